@@ -0,0 +1,108 @@
+import argparse
+import sys
+from pathlib import Path
+
+from .cases import CASES, get_cases
+from .runner import (
+    DEFAULT_MEMORY_TOLERANCE,
+    DEFAULT_REPEAT,
+    DEFAULT_SIZES,
+    DEFAULT_TIME_TOLERANCE,
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from .synthetic import write_synthetic_export
+
+
+def _parse_sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(part.replace("_", "")) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid sizes: {value}")
+    if not sizes or any(size <= 0 for size in sizes):
+        raise argparse.ArgumentTypeError(f"Invalid sizes: {value}")
+    return sizes
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    return (
+        f"{result.case:<16} {result.rows:>9} rows  "
+        f"{result.seconds * 1000:>10.1f} ms  {result.peak_bytes / 1024:>10.0f} KiB peak"
+    )
+
+
+def _report_regressions(baseline_path: Path, results, time_tolerance: float, memory_tolerance: float) -> int:
+    regressions = compare_results(load_results(baseline_path), results, time_tolerance, memory_tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION: {regression.case} @ {regression.rows} rows {regression.metric}: "
+            f"{regression.baseline:.4g} -> {regression.current:.4g} ({regression.ratio:.2f}x)"
+        )
+    if not regressions:
+        print(f"No regressions against {baseline_path}.")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PoE Stash Regex Generator benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Write a synthetic stash export")
+    generate.add_argument("--rows", type=int, required=True)
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--output", required=True)
+
+    run = commands.add_parser("run", help="Run benchmark cases on synthetic exports")
+    run.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES), help="Comma-separated row counts")
+    run.add_argument("--cases", help=f"Comma-separated subset of: {', '.join(case.name for case in CASES)}")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--workdir", help="Keep generated exports here between runs")
+    run.add_argument("--output", help="Write results as JSON")
+    run.add_argument("--baseline", help="Compare against a saved results file")
+
+    compare = commands.add_parser("compare", help="Compare two saved results files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+
+    for command in (run, compare):
+        command.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+        command.add_argument("--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        path = write_synthetic_export(Path(args.output), args.rows, args.seed)
+        print(f"Wrote {args.rows} rows to {path}")
+        return 0
+
+    if args.command == "compare":
+        current = load_results(Path(args.current))
+        return _report_regressions(Path(args.baseline), current, args.time_tolerance, args.memory_tolerance)
+
+    try:
+        cases = get_cases([name.strip() for name in args.cases.split(",")] if args.cases else None)
+    except ValueError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(
+        args.sizes,
+        cases,
+        repeat=args.repeat,
+        seed=args.seed,
+        workdir=Path(args.workdir) if args.workdir else None,
+        progress=lambda result: print(_format_result(result), flush=True),
+    )
+    if args.output:
+        save_results(Path(args.output), results)
+    if args.baseline:
+        return _report_regressions(Path(args.baseline), results, args.time_tolerance, args.memory_tolerance)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.collision_checker import validate_regex
+from core.csv_loader import load_csv
+from core.filtering import filter_items
+from core.item_table import HAS_NUMPY, ItemTable
+from core.parallel_csv import load_csv_parallel
+from core.models import FilterSpec, ItemRecord, SortSpec
+from core.regex_generator import generate_regex, iter_regex_entries
+from core.sorting import sort_items
+
+BENCHMARK_FILTER_TABS = 3
+BENCHMARK_MIN_TOTAL = Decimal("10")
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    setup: Callable[[Path], Any]
+    run: Callable[[Any], Any]
+
+
+def _records(path: Path) -> List[ItemRecord]:
+    records, _ = load_csv(str(path))
+    return records
+
+
+def _selection(path: Path) -> Dict[str, Any]:
+    records = _records(path)
+    tab = min(record.tab for record in records)
+    targets = sorted({record.name for record in records if record.tab == tab})
+    selected = set(targets)
+    non_targets = sorted({record.name for record in records if record.name not in selected})
+    return {"targets": targets, "non_targets": non_targets}
+
+
+def _wide_selection(path: Path) -> Dict[str, Any]:
+    spellings: Dict[str, set[str]] = {}
+    for record in _records(path):
+        spellings.setdefault(record.name.lower(), set()).add(record.name)
+    keys = sorted(spellings)
+    targets = sorted(name for key in keys[::2] for name in spellings[key])
+    non_targets = sorted(name for key in keys[1::2] for name in spellings[key])
+    return {"targets": targets, "non_targets": non_targets}
+
+
+def _generation(path: Path) -> Dict[str, Any]:
+    state = _selection(path)
+    result = generate_regex(state["targets"], state["non_targets"], allow_negation=False)
+    if not result.ok:
+        raise RuntimeError(f"Benchmark selection could not be encoded: {result.error}")
+    state["entries"] = result.entries
+    return state
+
+
+def _filter_state(path: Path) -> Tuple[List[ItemRecord], FilterSpec]:
+    records = _records(path)
+    tabs = sorted({record.tab for record in records})[:BENCHMARK_FILTER_TABS]
+    return records, FilterSpec(tabs=set(tabs), min_total=BENCHMARK_MIN_TOTAL)
+
+
+def _table_filter_state(path: Path) -> Tuple[ItemTable, FilterSpec]:
+    records, spec = _filter_state(path)
+    return ItemTable.from_records(records), spec
+
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase("load_csv", lambda path: path, lambda path: load_csv(str(path))),
+    BenchmarkCase("load_csv_parallel", lambda path: path, lambda path: load_csv_parallel(str(path))),
+    BenchmarkCase("filter_items", _filter_state, lambda state: filter_items(*state)),
+    BenchmarkCase(
+        "sort_items",
+        _records,
+        lambda records: sort_items(records, SortSpec(field="total", ascending=False)),
+    ),
+    BenchmarkCase(
+        "generate_regex",
+        _selection,
+        lambda state: generate_regex(state["targets"], state["non_targets"], allow_negation=False),
+    ),
+    BenchmarkCase(
+        "regex_first_entry",
+        _wide_selection,
+        lambda state: next(iter_regex_entries(state["targets"], state["non_targets"])),
+    ),
+    BenchmarkCase(
+        "validate_regex",
+        _generation,
+        lambda state: validate_regex(state["entries"], state["targets"], state["non_targets"]),
+    ),
+]
+
+if HAS_NUMPY:
+    CASES += [
+        BenchmarkCase("filter_table", _table_filter_state, lambda state: state[0].filter(state[1])),
+        BenchmarkCase(
+            "sort_table",
+            lambda path: ItemTable.from_records(_records(path)),
+            lambda table: table.sort(SortSpec(field="total", ascending=False)),
+        ),
+    ]
+
+
+def get_cases(names: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    if not names:
+        return list(CASES)
+    by_name = {case.name: case for case in CASES}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}")
+    return [by_name[name] for name in names]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional
+
+from .cases import BenchmarkCase
+from .synthetic import NamingSeed, load_naming_seed, write_synthetic_export
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_REPEAT = 3
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.25
+MIN_TIME_DELTA_SECONDS = 0.005
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    case: str
+    rows: int
+    seconds: float
+    peak_bytes: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    case: str
+    rows: int
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def measure(case: BenchmarkCase, state: Any, repeat: int = DEFAULT_REPEAT) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        case.run(state)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        case.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def export_path(workdir: Path, rows: int, seed: int) -> Path:
+    return workdir / f"synthetic_{rows}_{seed}.csv"
+
+
+def run_benchmarks(
+    sizes: Iterable[int],
+    cases: List[BenchmarkCase],
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 0,
+    workdir: Optional[Path] = None,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    naming: Optional[NamingSeed] = None
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = workdir or Path(temp_dir)
+        for rows in sizes:
+            path = export_path(root, rows, seed)
+            if not path.exists():
+                naming = naming or load_naming_seed()
+                write_synthetic_export(path, rows, seed, naming)
+            for case in cases:
+                seconds, peak = measure(case, case.setup(path), repeat)
+                result = BenchmarkResult(case=case.name, rows=rows, seconds=seconds, peak_bytes=peak)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return results
+
+
+def save_results(path: Path, results: List[BenchmarkResult]) -> None:
+    payload = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load_results(path: Path) -> List[BenchmarkResult]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return [
+        BenchmarkResult(
+            case=str(item["case"]),
+            rows=int(item["rows"]),
+            seconds=float(item["seconds"]),
+            peak_bytes=int(item["peak_bytes"]),
+        )
+        for item in payload.get("results", [])
+    ]
+
+
+def compare_results(
+    baseline: List[BenchmarkResult],
+    current: List[BenchmarkResult],
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+) -> List[Regression]:
+    previous = {(result.case, result.rows): result for result in baseline}
+    regressions: List[Regression] = []
+    for result in current:
+        before = previous.get((result.case, result.rows))
+        if before is None:
+            continue
+        slower = result.seconds - before.seconds
+        if slower > MIN_TIME_DELTA_SECONDS and result.seconds > before.seconds * (1 + time_tolerance):
+            regressions.append(Regression(result.case, result.rows, "seconds", before.seconds, result.seconds))
+        if result.peak_bytes > before.peak_bytes * (1 + memory_tolerance):
+            regressions.append(
+                Regression(result.case, result.rows, "peak_bytes", before.peak_bytes, result.peak_bytes)
+            )
+    return regressions
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import csv
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from core.config import CSV_ENCODING
+from core.csv_loader import load_csv
+
+DOCUMENTS_DIR = Path(__file__).resolve().parents[2] / "Product Documents"
+SAMPLE_EXPORT = DOCUMENTS_DIR / "sample_export.csv"
+SCARAB_LIST = DOCUMENTS_DIR / "scarab_list.txt"
+CSV_HEADER = ["Name", "Tab", "Quantity", "Price", "Total"]
+DUPLICATE_NAME_RATE = 0.05
+MAX_SPLICE_ATTEMPTS = 20
+
+
+@dataclass(frozen=True)
+class NamingSeed:
+    names: List[str]
+    tabs: List[str]
+
+
+def load_naming_seed(sample_path: Path = SAMPLE_EXPORT, scarab_path: Path = SCARAB_LIST) -> NamingSeed:
+    records, _ = load_csv(str(sample_path))
+    names = {record.name for record in records}
+    if scarab_path.exists():
+        lines = scarab_path.read_text(encoding="utf-8").splitlines()
+        names.update(line.strip() for line in lines if line.strip())
+    tabs = sorted({record.tab for record in records if record.tab})
+    return NamingSeed(names=sorted(names), tabs=tabs)
+
+
+def iter_synthetic_names(count: int, seed: int = 0, naming: Optional[NamingSeed] = None) -> Iterator[str]:
+    naming = naming or load_naming_seed()
+    rng = random.Random(seed)
+    real = list(naming.names)
+    rng.shuffle(real)
+    words = [name.split() for name in naming.names]
+    seen: set[str] = set()
+
+    for name in real[:count]:
+        seen.add(name)
+        yield name
+
+    serial = 0
+    while len(seen) < count:
+        for _ in range(MAX_SPLICE_ATTEMPTS):
+            head = rng.choice(words)
+            tail = rng.choice(words)
+            name = " ".join(head[: rng.randint(1, len(head))] + tail[rng.randint(0, len(tail) - 1) :])
+            if name not in seen:
+                break
+        else:
+            serial += 1
+            name = f"{name} {serial}"
+            if name in seen:
+                continue
+        seen.add(name)
+        yield name
+
+
+def iter_synthetic_rows(rows: int, seed: int = 0, naming: Optional[NamingSeed] = None) -> Iterator[List[str]]:
+    naming = naming or load_naming_seed()
+    rng = random.Random(seed + 1)
+    unique_count = max(1, rows - int(rows * DUPLICATE_NAME_RATE))
+    names = iter_synthetic_names(unique_count, seed, naming)
+    emitted: List[str] = []
+
+    for _ in range(rows):
+        if emitted and (len(emitted) == unique_count or rng.random() < DUPLICATE_NAME_RATE):
+            name = rng.choice(emitted)
+        else:
+            name = next(names)
+            emitted.append(name)
+        quantity = 1 if rng.random() < 0.6 else rng.randint(2, 500)
+        total = int(rng.lognormvariate(3.0, 2.5))
+        yield [name, rng.choice(naming.tabs), str(quantity), "", str(total)]
+
+
+def write_synthetic_export(path: Path, rows: int, seed: int = 0, naming: Optional[NamingSeed] = None) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding=CSV_ENCODING) as handle:
+        writer = csv.writer(handle, quoting=csv.QUOTE_ALL)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(iter_synthetic_rows(rows, seed, naming))
+    return path
@@ -1,15 +1,45 @@
 import argparse
+import cProfile
+import itertools
+import json
 import sys
+import time
+from dataclasses import asdict
 from decimal import Decimal, InvalidOperation
 
-from core.config import DEFAULT_MATCH_MODE, MAX_REGEX_LENGTH
-from core.csv_loader import load_csv
-from core.filtering import filter_items
-from core.models import FilterSpec, SortSpec
-from core.regex_generator import generate_regex
+from core.cancellation import CancellationToken, GenerationCancelled
+from core.config import (
+    DEFAULT_MATCH_MODE,
+    DEFAULT_TIME_BUDGET_MS,
+    DEFAULT_VALIDATION,
+    MAX_REGEX_LENGTH,
+    NEGATION_PREFIX,
+    WATCH_INTERVAL_MS,
+)
+from core.collision_report import collision_report
+from core.csv_loader import iter_csv
+from core.export_cache import ExportCache
+from core.export_reload import ExportReloader
+from core.filtering import LiveSelection, split_selection
+from core.models import FilterSpec, GenerationStats, LoadWarnings, SortSpec
+from core.multi_export import load_exports
+from core.name_index import NameIndex
+from core.parallel_csv import parse_csv_parallel
+from core.persistence import default_cache_path, default_export_cache_dir
+from core.regex_cache import RegexCache
+from core.regex_generator import (
+    VALIDATION_MODES,
+    RegexGenerationError,
+    RegexSession,
+    generate_regex,
+    iter_regex_entries,
+)
 from core.sorting import sort_items
 
 
+PROFILE_STATS = "stats"
+
+
 def _parse_decimal(value: str | None) -> Decimal | None:
     if value is None:
         return None
@@ -34,22 +64,67 @@ def _parse_tabs(value: str | None) -> set[str]:
     return {tab.strip() for tab in value.split(",") if tab.strip()}
 
 
-def _build_non_targets(all_items, selected_items) -> list[str]:
-    selected_ids = {id(item) for item in selected_items}
-    return [item.name for item in all_items if id(item) not in selected_ids]
+def _quote_regex(regex: str, negated: bool = False) -> str:
+    prefix = NEGATION_PREFIX if negated else ""
+    return f'"{prefix}{regex}"'
+
+
+def _unquote_regex(regex: str) -> str:
+    if len(regex) >= 2 and regex[0] == regex[-1] == '"':
+        return regex[1:-1]
+    return regex
+
 
+def _print_check(entries: list[str], targets: list[str], non_targets: list[str]) -> int:
+    report = collision_report([_unquote_regex(entry) for entry in entries], targets, non_targets)
+    payload = asdict(report)
+    payload["ok"] = report.ok
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0 if report.ok else 1
 
-def _quote_regex(regex: str) -> str:
-    return f'"{regex}"'
+
+def _print_stats(stats: GenerationStats | None) -> None:
+    if stats is None:
+        print("Profile: result served from cache")
+        return
+    print("Profile:")
+    for phase, seconds in stats.phase_seconds.items():
+        print(f"  {phase:<12} {seconds * 1000:>9.1f} ms")
+    print(f"  {'total':<12} {sum(stats.phase_seconds.values()) * 1000:>9.1f} ms")
+    print(
+        f"Suffixes: {stats.suffix_count}, candidates: {stats.candidate_count}, "
+        f"cover iterations: {stats.cover_iterations}, validated names: {stats.validated_names}, "
+        f"regex executions: {stats.validation_regex_executions}"
+    )
 
 
 def _max_raw_regex_length() -> int:
     return max(1, MAX_REGEX_LENGTH - 2)
 
 
+def _print_progressive(loaded_count, filtered, targets, non_targets, options) -> int:
+    print(f"Loaded items: {loaded_count}")
+    print(f"Filtered items: {len(filtered)}")
+    try:
+        skipped = {"validation", "allow_negation", "collect_stats"}
+        options = {key: value for key, value in options.items() if key not in skipped}
+        for index, entry in enumerate(iter_regex_entries(targets, non_targets, **options), start=1):
+            quoted = _quote_regex(entry)
+            print(f"Entry {index} ({len(quoted)} chars): {quoted}", flush=True)
+    except (RegexGenerationError, GenerationCancelled) as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="PoE Stash Regex Generator CLI")
-    parser.add_argument("--csv", required=True, help="Path to CSV export")
+    parser.add_argument(
+        "--csv",
+        required=True,
+        nargs="+",
+        help="Path to CSV export; several exports are merged by Name+Tab",
+    )
     parser.add_argument("--tabs", help="Comma-separated tab names")
     parser.add_argument("--name-contains", help="Substring match against item names")
     parser.add_argument("--min-total", type=_parse_decimal)
@@ -68,20 +143,104 @@ def main() -> int:
     parser.add_argument("--sort-desc", action="store_true")
     parser.add_argument(
         "--match-mode",
-        choices=["exact", "balanced", "compact"],
+        choices=["exact", "balanced", "compact", "substring", "optimal"],
         default=DEFAULT_MATCH_MODE,
         help="Regex matching mode",
     )
+    parser.add_argument(
+        "--time-budget-ms",
+        type=_parse_int,
+        default=DEFAULT_TIME_BUDGET_MS,
+        help="Search time budget for the optimal match mode",
+    )
+    parser.add_argument(
+        "--validation",
+        choices=list(VALIDATION_MODES),
+        help=f"Check the coverage certificate, run every regex, or both on a sample (default: {DEFAULT_VALIDATION})",
+    )
+    parser.add_argument(
+        "--no-negation",
+        action="store_true",
+        help="Never emit a negated (!) regex for the unselected items",
+    )
+    parser.add_argument("--timeout-ms", type=_parse_int, help="Abort generation after this many milliseconds")
+    parser.add_argument(
+        "--progressive",
+        action="store_true",
+        help="Print entries as soon as each one is finalized (bypasses the cache)",
+    )
+    parser.add_argument(
+        "--check",
+        action="append",
+        metavar="REGEX",
+        help="Report every filtered item the regex misses and every other item it matches, as JSON (repeatable)",
+    )
+    parser.add_argument("--cache", action="store_true", help="Reuse results from the on-disk regex cache")
+    parser.add_argument("--cache-path", help="Regex cache file (implies --cache)")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_STATS,
+        metavar="PSTATS_FILE",
+        help="Print per-phase generation stats, or dump a cProfile of the whole run to PSTATS_FILE",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate whenever the CSV export changes on disk",
+    )
+    parser.add_argument(
+        "--watch-interval-ms",
+        type=_parse_int,
+        default=WATCH_INTERVAL_MS,
+        help="Polling interval for --watch",
+    )
+    parser.add_argument(
+        "--parallel-load",
+        action="store_true",
+        help="Parse large exports in memory-mapped chunks across a process pool",
+    )
+    parser.add_argument(
+        "--export-cache",
+        action="store_true",
+        help="Reuse parsed exports from the binary snapshot cache, keyed by file hash",
+    )
+    parser.add_argument("--export-cache-dir", help="Export snapshot directory (implies --export-cache)")
     parser.add_argument("--show-warnings", action="store_true")
 
     args = parser.parse_args()
+    if args.watch and len(args.csv) > 1:
+        parser.error("--watch supports a single --csv export")
+    if args.parallel_load and len(args.csv) > 1:
+        parser.error("--parallel-load supports a single --csv export; several exports are already read concurrently")
+    if args.progressive:
+        ignored = [
+            flag
+            for flag, used in (
+                ("--validation", args.validation is not None),
+                ("--no-negation", args.no_negation),
+                ("--profile", args.profile == PROFILE_STATS),
+            )
+            if used
+        ]
+        if ignored:
+            parser.error(f"--progressive validates each entry as it is emitted and cannot use {', '.join(ignored)}")
+    args.validation = args.validation or DEFAULT_VALIDATION
+    if args.profile is None or args.profile == PROFILE_STATS:
+        return _run(args)
 
-    records, warnings = load_csv(args.csv)
-    if args.show_warnings and warnings:
-        for warning in warnings:
-            print(f"WARN: {warning}", file=sys.stderr)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return _run(args)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        print(f"Profile written to {args.profile}", file=sys.stderr)
 
-    spec = FilterSpec(
+
+def _build_spec(args: argparse.Namespace) -> FilterSpec:
+    return FilterSpec(
         tabs=_parse_tabs(args.tabs),
         name_query=args.name_contains.strip() if args.name_contains else None,
         min_total=args.min_total,
@@ -94,36 +253,165 @@ def main() -> int:
         bottom_n=args.bottom_n,
     )
 
-    filtered = filter_items(records, spec)
+
+def _print_warnings(args: argparse.Namespace, warnings: LoadWarnings) -> None:
+    if args.show_warnings:
+        for warning in warnings.summary():
+            print(f"WARN: {warning}", file=sys.stderr)
+
+
+def _select(args: argparse.Namespace, records, spec: FilterSpec):
+    filtered, non_targets = split_selection(records, spec)
     if args.sort_field:
         filtered = sort_items(
             filtered,
             SortSpec(field=args.sort_field, ascending=not args.sort_desc),
         )
+    return filtered, [item.name for item in filtered], non_targets
 
-    targets = [item.name for item in filtered]
-    non_targets = _build_non_targets(records, filtered)
-
-    result = generate_regex(
-        targets,
-        non_targets,
-        max_length=_max_raw_regex_length(),
-        match_mode=args.match_mode,
-    )
 
-    print(f"Loaded items: {len(records)}")
-    print(f"Filtered items: {len(filtered)}")
+def _print_result(args: argparse.Namespace, result, loaded_count: int, filtered_count: int, cache=None) -> int:
+    print(f"Loaded items: {loaded_count}")
+    print(f"Filtered items: {filtered_count}")
+    if cache is not None:
+        print(f"Cache: {cache.stats.hits} hit(s), {cache.stats.misses} miss(es)")
 
     if not result.ok:
         print(f"ERROR: {result.error}")
         return 1
 
+    if result.negated:
+        print("Negated: the regex matches the unselected items and the ! prefix highlights everything else.")
     for index, entry in enumerate(result.entries, start=1):
-        quoted = _quote_regex(entry)
+        quoted = _quote_regex(entry, result.negated)
         print(f"Entry {index} ({len(quoted)} chars): {quoted}")
 
+    if result.proven_optimal is not None:
+        status = "proven" if result.proven_optimal else "not proven within time budget"
+        print(f"Optimality: {status}")
+    if args.profile == PROFILE_STATS:
+        _print_stats(result.stats)
+
     return 0
 
 
+def _export_cache(args: argparse.Namespace) -> ExportCache | None:
+    if not (args.export_cache or args.export_cache_dir):
+        return None
+    return ExportCache(args.export_cache_dir or default_export_cache_dir())
+
+
+def _load_records(args: argparse.Namespace, warnings: LoadWarnings):
+    export_cache = _export_cache(args)
+    if len(args.csv) > 1:
+        return load_exports(args.csv, warnings=warnings, cache=export_cache).records, None
+
+    path = args.csv[0]
+    if export_cache is not None:
+        snapshot = export_cache.load(path)
+        warnings.extend(snapshot.warnings)
+        return snapshot.records, snapshot.name_index
+    if args.parallel_load:
+        return parse_csv_parallel(path, warnings.add), None
+    return itertools.chain.from_iterable(iter_csv(path, warnings=warnings)), None
+
+
+def _run(args: argparse.Namespace) -> int:
+    if args.watch:
+        return _watch(args)
+
+    warnings = LoadWarnings()
+    records, name_index = _load_records(args, warnings)
+    filtered, targets, non_targets = _select(args, records, _build_spec(args))
+    loaded_count = len(filtered) + len(non_targets)
+    _print_warnings(args, warnings)
+
+    if args.check:
+        return _print_check(args.check, targets, non_targets)
+
+    options = {
+        "name_index": name_index if name_index is not None else NameIndex(itertools.chain(targets, non_targets)),
+        "max_length": _max_raw_regex_length(),
+        "match_mode": args.match_mode,
+        "time_budget_ms": args.time_budget_ms,
+        "validation": args.validation,
+        "allow_negation": not args.no_negation,
+        "collect_stats": args.profile == PROFILE_STATS,
+        "token": CancellationToken(args.timeout_ms) if args.timeout_ms is not None else None,
+    }
+    if args.progressive:
+        return _print_progressive(loaded_count, filtered, targets, non_targets, options)
+
+    cache = None
+    if args.cache or args.cache_path:
+        cache = RegexCache(path=args.cache_path or default_cache_path())
+        for warning in cache.load():
+            print(f"WARN: {warning}", file=sys.stderr)
+        result = cache.generate(targets, non_targets, **options)
+    else:
+        result = generate_regex(targets, non_targets, **options)
+
+    return _print_result(args, result, loaded_count, len(filtered), cache)
+
+
+def _watch_step(
+    args: argparse.Namespace,
+    reloader: ExportReloader,
+    selection: LiveSelection,
+    session: RegexSession,
+) -> int:
+    token = CancellationToken(args.timeout_ms) if args.timeout_ms is not None else None
+    try:
+        result = session.result(token)
+    except GenerationCancelled as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    return _print_result(args, result, len(reloader.records), len(selection))
+
+
+def _watch(args: argparse.Namespace) -> int:
+    path = args.csv[0]
+    reloader = ExportReloader(path, cache=_export_cache(args))
+    reloader.reload(force=True)
+    _print_warnings(args, reloader.warnings)
+
+    selection = LiveSelection(reloader.records, _build_spec(args))
+    name_index = NameIndex(record.name for record in reloader.records)
+    session = RegexSession(
+        max_length=_max_raw_regex_length(),
+        match_mode=args.match_mode,
+        name_index=name_index,
+        validation=args.validation,
+        allow_negation=not args.no_negation,
+    )
+    session.update(selection.target_names(), selection.non_target_names())
+    status = _watch_step(args, reloader, selection, session)
+    print(f"Watching {path} (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            time.sleep(max(0, args.watch_interval_ms) / 1000)
+            try:
+                diff = reloader.reload()
+            except OSError as exc:
+                print(f"WARN: {exc}", file=sys.stderr)
+                continue
+            if diff is None or diff.empty:
+                continue
+            print(f"Reloaded: {diff.summary()}")
+            _print_warnings(args, reloader.warnings)
+            name_index.apply_changes(diff.added_names, diff.removed_names)
+            delta = selection.apply(diff.outgoing, diff.incoming)
+            session.apply(
+                added_targets=delta.added_targets,
+                removed_targets=delta.removed_targets,
+                added_non_targets=delta.added_non_targets,
+                removed_non_targets=delta.removed_non_targets,
+            )
+            status = _watch_step(args, reloader, selection, session)
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        return status
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+
+class GenerationCancelled(Exception):
+    pass
+
+
+class CancellationToken:
+    def __init__(self, timeout_ms: Optional[int] = None) -> None:
+        self.deadline = None if timeout_ms is None else time.perf_counter() + max(0, timeout_ms) / 1000
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def remaining_ms(self) -> Optional[int]:
+        if self.deadline is None:
+            return None
+        return max(0, int((self.deadline - time.perf_counter()) * 1000))
+
+    def check(self) -> None:
+        if self._cancelled:
+            raise GenerationCancelled("Generation cancelled.")
+        if self.expired:
+            raise GenerationCancelled("Generation timed out.")
+
+
+def check_token(token: Optional[CancellationToken]) -> None:
+    if token is not None:
+        token.check()
@@ -1,7 +1,17 @@
 import re
-from typing import Iterable, Tuple
+from typing import Callable, Iterable, Mapping, Optional, Tuple
 
+from .cancellation import CancellationToken, check_token
 from .config import CASE_INSENSITIVE_MATCHING
+from .entry_matcher import END, START, EntryMatcher, expand_entry
+from .models import CoverageCertificate, GenerationStats
+
+PATTERN_ANCHORS = {
+    "suffix": ("", END),
+    "prefix": (START, ""),
+    "substring": ("", ""),
+    "exact": (START, END),
+}
 
 
 def validate_regex(
@@ -9,28 +19,98 @@ def validate_regex(
     targets: Iterable[str],
     non_targets: Iterable[str],
     case_insensitive: bool = CASE_INSENSITIVE_MATCHING,
+    token: Optional[CancellationToken] = None,
+    stats: Optional[GenerationStats] = None,
 ) -> Tuple[bool, str | None]:
     entries = [entry for entry in regex_entries if entry]
     if not entries:
         return False, "No regex entries generated."
 
     flags = re.IGNORECASE if case_insensitive else 0
-    compiled = []
     for entry in entries:
         try:
-            compiled.append(re.compile(entry, flags))
+            re.compile(entry, flags)
         except re.error as exc:
             return False, f"Invalid regex '{entry}': {exc}"
+    matcher = EntryMatcher(entries, case_insensitive)
+    try:
+        return _check_names(matcher, targets, non_targets, token, stats)
+    finally:
+        if stats is not None:
+            stats.validation_regex_executions += matcher.regex_executions
 
-    targets_list = list(targets)
-    non_targets_list = list(non_targets)
 
-    for name in targets_list:
-        if not any(regex.search(name) for regex in compiled):
+def _check_names(
+    matcher: EntryMatcher,
+    targets: Iterable[str],
+    non_targets: Iterable[str],
+    token: Optional[CancellationToken],
+    stats: Optional[GenerationStats],
+) -> Tuple[bool, str | None]:
+    for name in targets:
+        check_token(token)
+        if stats is not None:
+            stats.validated_names += 1
+        if not matcher.matches(name):
             return False, f"Regex does not match target '{name}'."
 
-    for name in non_targets_list:
-        if any(regex.search(name) for regex in compiled):
+    for name in non_targets:
+        check_token(token)
+        if stats is not None:
+            stats.validated_names += 1
+        if matcher.matches(name):
             return False, f"Regex matches non-target '{name}'."
 
     return True, None
+
+
+def _covers(kind: str, literal: str, name: str) -> bool:
+    if kind == "suffix":
+        return name.endswith(literal)
+    if kind == "prefix":
+        return name.startswith(literal)
+    if kind == "exact":
+        return name == literal
+    return literal in name
+
+
+def verify_certificate(
+    regex_entries: Iterable[str],
+    certificate: CoverageCertificate,
+    targets: Iterable[str],
+    evidence: Mapping[str, Callable[[str], bool]],
+) -> Tuple[bool, str | None]:
+    entries = [entry for entry in regex_entries if entry]
+    if not entries:
+        return False, "No regex entries generated."
+
+    expanded: set[str] = set()
+    for entry in entries:
+        literals = expand_entry(entry)
+        if literals is None:
+            return False, f"Entry '{entry}' is outside the certified dialect."
+        expanded.update(literal.lower() if certificate.case_insensitive else literal for literal in literals)
+
+    certified: set[str] = set()
+    for pattern in certificate.patterns:
+        if pattern.kind not in PATTERN_ANCHORS or pattern.kind not in evidence:
+            return False, f"No evidence available for {pattern.kind} pattern '{pattern.literal}'."
+        start, end = PATTERN_ANCHORS[pattern.kind]
+        certified.add(start + pattern.literal + end)
+    if expanded != certified:
+        return False, "Regex entries do not match the certified patterns."
+
+    for name in targets:
+        position = certificate.assignments.get(name)
+        if position is None:
+            return False, f"Regex does not match target '{name}'."
+        pattern = certificate.patterns[position]
+        normalized = name.lower() if certificate.case_insensitive else name
+        if not _covers(pattern.kind, pattern.literal, normalized):
+            return False, f"Regex does not match target '{name}'."
+
+    for pattern in certificate.patterns:
+        if evidence[pattern.kind](pattern.literal):
+            return False, f"Certified {pattern.kind} pattern '{pattern.literal}' matches a non-target."
+
+    return True, None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .config import CASE_INSENSITIVE_MATCHING, COLLISION_REPORT_CHUNK_SIZE, NEGATION_PREFIX
+from .entry_matcher import EntryMatcher
+from .models import CollisionReport
+from .regex_batch import pool_context
+from .set_cover import iter_bits
+
+_MATCHER: Optional[EntryMatcher] = None
+
+
+def _init_worker(entries: Tuple[str, ...], case_insensitive: bool) -> None:
+    global _MATCHER
+    _MATCHER = EntryMatcher(entries, case_insensitive)
+
+
+def _match_chunk(names: Sequence[str]) -> List[int]:
+    return [_MATCHER.match_mask(name) for name in names]
+
+
+def collision_report(
+    regex_entries: Iterable[str],
+    targets: Iterable[str],
+    non_targets: Iterable[str],
+    case_insensitive: bool = CASE_INSENSITIVE_MATCHING,
+    max_workers: Optional[int] = None,
+    chunk_size: int = COLLISION_REPORT_CHUNK_SIZE,
+) -> CollisionReport:
+    entries = tuple(entry for entry in regex_entries if entry)
+    if not entries:
+        return CollisionReport(entries=[], error="No regex entries generated.")
+
+    flags = re.IGNORECASE if case_insensitive else 0
+    patterns: List[str] = []
+    negated = 0
+    for index, entry in enumerate(entries):
+        pattern = entry
+        if entry.startswith(NEGATION_PREFIX):
+            pattern = entry[len(NEGATION_PREFIX) :]
+            negated |= 1 << index
+        if not pattern:
+            return CollisionReport(entries=list(entries), error=f"Invalid regex '{entry}': empty pattern")
+        try:
+            re.compile(pattern, flags)
+        except re.error as exc:
+            return CollisionReport(entries=list(entries), error=f"Invalid regex '{entry}': {exc}")
+        patterns.append(pattern)
+
+    targets_list = list(dict.fromkeys(targets))
+    names = targets_list + list(dict.fromkeys(non_targets))
+    size = max(1, chunk_size)
+    chunks = [names[start : start + size] for start in range(0, len(names), size)]
+
+    workers = min(len(chunks), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        _init_worker(tuple(patterns), case_insensitive)
+        masks = [mask for chunk in chunks for mask in _match_chunk(chunk)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=pool_context(),
+            initializer=_init_worker,
+            initargs=(tuple(patterns), case_insensitive),
+        ) as executor:
+            masks = [mask for chunk_masks in executor.map(_match_chunk, chunks) for mask in chunk_masks]
+    masks = [mask ^ negated for mask in masks]
+
+    uncovered = [name for name, mask in zip(targets_list, masks) if not mask]
+    matched: dict[str, list[int]] = {}
+    for name, mask in zip(names[len(targets_list) :], masks[len(targets_list) :]):
+        if mask:
+            matched.setdefault(name, list(iter_bits(mask)))
+    return CollisionReport(entries=list(entries), uncovered_targets=uncovered, matched_non_targets=matched)
@@ -5,9 +5,24 @@ CASE_INSENSITIVE_MATCHING = True
 DEFAULT_MATCH_MODE = "balanced"
 MIN_SINGLE_WORD_SUFFIX_LENGTH = 8
 MIN_MULTI_WORD_SUFFIX_LENGTH = 6
+DEFAULT_TIME_BUDGET_MS = 1000
+DEFAULT_CACHE_SIZE = 128
+DEFAULT_VALIDATION = "certified"
+VALIDATION_SAMPLE_SIZE = 256
+COLLISION_REPORT_CHUNK_SIZE = 5000
+ALLOW_NEGATION = True
+NEGATION_PREFIX = "!"
 
 DEFAULT_QUANTITY = 1
 DEFAULT_TOTAL = Decimal("0")
 
 CSV_ENCODING = "utf-8-sig"
+CSV_CHUNK_SIZE = 5000
+CSV_PARALLEL_CHUNK_BYTES = 8 * 1024 * 1024
+MAX_WARNING_EXAMPLES = 10
+WATCH_INTERVAL_MS = 2000
 DEFAULT_STORAGE_FILENAME = "saved_regex.json"
+DEFAULT_CACHE_FILENAME = "regex_cache.json"
+DEFAULT_EXPORT_CACHE_DIRNAME = "export_cache"
+EXPORT_CACHE_SNAPSHOTS = 4
+EXPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
@@ -1,67 +1,113 @@
+from __future__ import annotations
+
 import csv
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Callable, Iterable, Iterator, Mapping, Optional, TextIO, Tuple
+
+from .config import CSV_CHUNK_SIZE, CSV_ENCODING, DEFAULT_QUANTITY, DEFAULT_TOTAL
+from .models import ItemRecord, LoadWarnings
 
-from .config import CSV_ENCODING, DEFAULT_QUANTITY, DEFAULT_TOTAL
-from .models import ItemRecord
+Warn = Callable[[str, str], None]
+RowWarn = Callable[[str, int, str], None]
 
+EMPTY_CSV_WARNING = "CSV appears to be empty or missing headers."
 
-def _parse_int(value: str, default: int, warnings: list[str], row_index: int, field_name: str) -> int:
+
+def _parse_int(value: str, default: int, warn: RowWarn, row_index: int, field_name: str) -> int:
     if value is None or value == "":
         return default
     try:
         return int(value)
     except ValueError:
-        warnings.append(
-            f"Row {row_index}: invalid {field_name} '{value}', defaulting to {default}."
-        )
+        warn(f"invalid_{field_name.lower()}", row_index, f"invalid {field_name} '{value}', defaulting to {default}.")
         return default
 
 
-def _parse_decimal(value: str, default: Decimal, warnings: list[str], row_index: int, field_name: str) -> Decimal:
+def _parse_decimal(value: str, default: Decimal, warn: RowWarn, row_index: int, field_name: str) -> Decimal:
     if value is None or value == "":
         return default
     try:
         return Decimal(value)
     except (InvalidOperation, ValueError):
-        warnings.append(
-            f"Row {row_index}: invalid {field_name} '{value}', defaulting to {default}."
-        )
+        warn(f"invalid_{field_name.lower()}", row_index, f"invalid {field_name} '{value}', defaulting to {default}.")
         return default
 
 
-def load_csv(path: str) -> Tuple[list[ItemRecord], list[str]]:
-    records: list[ItemRecord] = []
-    warnings: list[str] = []
-
+def resolve_csv_path(path: str) -> Path:
     csv_path = Path(path)
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found: {path}")
+    return csv_path
 
-    with csv_path.open(newline="", encoding=CSV_ENCODING) as handle:
-        reader = csv.DictReader(handle)
-        if not reader.fieldnames:
-            warnings.append("CSV appears to be empty or missing headers.")
-            return records, warnings
-
-        for row_index, row in enumerate(reader, start=2):
-            name = (row.get("Name") or "").strip()
-            if not name:
-                warnings.append(f"Row {row_index}: missing Name, row skipped.")
-                continue
-
-            tab = (row.get("Tab") or "").strip()
-            quantity = _parse_int(row.get("Quantity") or "", DEFAULT_QUANTITY, warnings, row_index, "Quantity")
-            total = _parse_decimal(row.get("Total") or "", DEFAULT_TOTAL, warnings, row_index, "Total")
-
-            records.append(
-                ItemRecord(
-                    name=name,
-                    tab=tab,
-                    quantity=quantity,
-                    total=total,
-                )
-            )
 
+def _row_warn(warn: Warn) -> RowWarn:
+    return lambda category, row_index, detail: warn(category, f"Row {row_index}: {detail}")
+
+
+def parse_rows(rows: Iterable[Mapping[str, str]], first_row_index: int, warn: RowWarn) -> Iterator[ItemRecord]:
+    for row_index, row in enumerate(rows, start=first_row_index):
+        name = (row.get("Name") or "").strip()
+        if not name:
+            warn("missing_name", row_index, "missing Name, row skipped.")
+            continue
+
+        tab = (row.get("Tab") or "").strip()
+        quantity = _parse_int(row.get("Quantity") or "", DEFAULT_QUANTITY, warn, row_index, "Quantity")
+        total = _parse_decimal(row.get("Total") or "", DEFAULT_TOTAL, warn, row_index, "Total")
+
+        yield ItemRecord(
+            name=name,
+            tab=tab,
+            quantity=quantity,
+            total=total,
+        )
+
+
+def iter_records(handle: TextIO, warn: Warn) -> Iterator[ItemRecord]:
+    reader = csv.DictReader(handle)
+    if not reader.fieldnames:
+        warn("empty", EMPTY_CSV_WARNING)
+        return
+    yield from parse_rows(reader, 2, _row_warn(warn))
+
+
+def load_csv(path: str) -> Tuple[list[ItemRecord], list[str]]:
+    warnings: list[str] = []
+    with resolve_csv_path(path).open(newline="", encoding=CSV_ENCODING) as handle:
+        records = list(iter_records(handle, lambda category, message: warnings.append(message)))
     return records, warnings
+
+
+def _iter_chunks(csv_path: Path, chunk_size: int, warnings: LoadWarnings) -> Iterator[list[ItemRecord]]:
+    with csv_path.open(newline="", encoding=CSV_ENCODING) as handle:
+        chunk: list[ItemRecord] = []
+        for record in iter_records(handle, warnings.add):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class CsvChunks:
+    def __init__(self, csv_path: Path, chunk_size: int, warnings: LoadWarnings) -> None:
+        self.warnings = warnings
+        self._chunks = _iter_chunks(csv_path, chunk_size, warnings)
+
+    def __iter__(self) -> CsvChunks:
+        return self
+
+    def __next__(self) -> list[ItemRecord]:
+        return next(self._chunks)
+
+
+def iter_csv(
+    path: str,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    warnings: Optional[LoadWarnings] = None,
+) -> CsvChunks:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    return CsvChunks(resolve_csv_path(path), chunk_size, warnings if warnings is not None else LoadWarnings())
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+START = "\x00"
+END = "\x01"
+MAX_ENTRY_EXPANSIONS = 4096
+ENTRY_EXPANSION_CACHE_SIZE = 1024
+
+_UNSUPPORTED = set(".*+?[]{}")
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _is_class_escape(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+class _Parser:
+    def __init__(self, entry: str) -> None:
+        self.entry = entry
+        self.pos = 0
+
+    def alternation(self) -> List[str]:
+        branches = self.sequence()
+        while self.pos < len(self.entry) and self.entry[self.pos] == "|":
+            self.pos += 1
+            branches = branches + self.sequence()
+            if len(branches) > MAX_ENTRY_EXPANSIONS:
+                raise _Unsupported()
+        return branches
+
+    def sequence(self) -> List[str]:
+        results = [""]
+        while self.pos < len(self.entry) and self.entry[self.pos] not in "|)":
+            char = self.entry[self.pos]
+            self.pos += 1
+            if char == "\\":
+                if self.pos == len(self.entry) or _is_class_escape(self.entry[self.pos]):
+                    raise _Unsupported()
+                parts = [self.entry[self.pos]]
+                self.pos += 1
+            elif char == "(":
+                if self.entry.startswith("?:", self.pos):
+                    self.pos += 2
+                elif self.entry.startswith("?", self.pos):
+                    raise _Unsupported()
+                parts = self.alternation()
+                if self.pos == len(self.entry) or self.entry[self.pos] != ")":
+                    raise _Unsupported()
+                self.pos += 1
+            elif char == "[":
+                parts = self.char_class()
+            elif char == "^":
+                parts = [START]
+            elif char == "$":
+                parts = [END]
+            elif char in _UNSUPPORTED:
+                raise _Unsupported()
+            else:
+                parts = [char]
+
+            if self.pos < len(self.entry) and self.entry[self.pos] in "*+?{":
+                raise _Unsupported()
+            if len(results) * len(parts) > MAX_ENTRY_EXPANSIONS:
+                raise _Unsupported()
+            results = [prefix + part for prefix in results for part in parts]
+        return results
+
+    def char_class(self) -> List[str]:
+        chars: List[str] = []
+        while self.pos < len(self.entry) and self.entry[self.pos] != "]":
+            char = self.entry[self.pos]
+            self.pos += 1
+            if char == "\\":
+                if self.pos == len(self.entry) or _is_class_escape(self.entry[self.pos]):
+                    raise _Unsupported()
+                char = self.entry[self.pos]
+                self.pos += 1
+            elif char in "[^-":
+                raise _Unsupported()
+            chars.append(char)
+        if self.pos == len(self.entry) or not chars:
+            raise _Unsupported()
+        self.pos += 1
+        return list(dict.fromkeys(chars))
+
+
+def expand_entry(entry: str, case_insensitive: bool = False) -> Optional[List[str]]:
+    expanded = _expand_entry(entry, case_insensitive)
+    return None if expanded is None else list(expanded)
+
+
+@lru_cache(maxsize=ENTRY_EXPANSION_CACHE_SIZE)
+def _expand_entry(entry: str, case_insensitive: bool) -> Optional[Tuple[str, ...]]:
+    if START in entry or END in entry:
+        return None
+    parser = _Parser(entry)
+    try:
+        literals = parser.alternation()
+    except _Unsupported:
+        return None
+    if parser.pos != len(entry):
+        return None
+
+    expanded: List[str] = []
+    for literal in literals:
+        body = literal[1:] if literal.startswith(START) else literal
+        body = body[:-1] if body.endswith(END) else body
+        if START in body or END in body:
+            return None
+        if case_insensitive:
+            if not literal.isascii():
+                return None
+            literal = literal.lower()
+        expanded.append(literal)
+    return tuple(expanded)
+
+
+class EntryMatcher:
+    def __init__(self, entries: Iterable[str], case_insensitive: bool = False) -> None:
+        self.entries = list(entries)
+        self.case_insensitive = case_insensitive
+        flags = re.IGNORECASE if case_insensitive else 0
+        self.compiled = [re.compile(entry, flags) for entry in self.entries]
+        self.regex_executions = 0
+
+        self._goto: List[dict[str, int]] = [{}]
+        self._output: List[int] = [0]
+        self._fallback: List[Tuple[int, re.Pattern[str]]] = []
+        for index, entry in enumerate(self.entries):
+            literals = expand_entry(entry, case_insensitive)
+            if literals is None:
+                self._fallback.append((index, self.compiled[index]))
+                continue
+            for literal in literals:
+                self._insert(literal, 1 << index)
+        self._fail = self._link()
+
+    def _insert(self, literal: str, bit: int) -> None:
+        node = 0
+        for char in literal:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._output.append(0)
+            node = child
+        self._output[node] |= bit
+
+    def _link(self) -> List[int]:
+        fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                state = fail[node]
+                while state and char not in self._goto[state]:
+                    state = fail[state]
+                fail[child] = self._goto[state].get(char, 0)
+                self._output[child] |= self._output[fail[child]]
+                queue.append(child)
+        return fail
+
+    def _needs_regex(self, name: str) -> bool:
+        if "\n" in name or START in name or END in name:
+            return True
+        return self.case_insensitive and not name.isascii()
+
+    def match_mask(self, name: str, stop_at_first: bool = False) -> int:
+        if self._needs_regex(name):
+            mask = 0
+            for index, regex in enumerate(self.compiled):
+                self.regex_executions += 1
+                if regex.search(name):
+                    mask |= 1 << index
+                    if stop_at_first:
+                        break
+            return mask
+
+        mask = 0
+        for index, regex in self._fallback:
+            self.regex_executions += 1
+            if regex.search(name):
+                mask |= 1 << index
+                if stop_at_first:
+                    return mask
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        text = START + (name.lower() if self.case_insensitive else name) + END
+        node = 0
+        mask |= output[0]
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            mask |= output[node]
+            if mask and stop_at_first:
+                return mask
+        return mask
+
+    def matches(self, name: str) -> bool:
+        return bool(self.match_mask(name, stop_at_first=True))
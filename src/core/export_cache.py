@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import struct
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, BinaryIO, List, Tuple
+
+from .config import CASE_INSENSITIVE_MATCHING, CSV_ENCODING, EXPORT_CACHE_MAX_BYTES, EXPORT_CACHE_SNAPSHOTS
+from .csv_loader import iter_records, resolve_csv_path
+from .models import CacheStats, ItemRecord, LoadWarnings
+from .name_index import NameIndex
+
+EXPORT_CACHE_VERSION = 1
+SNAPSHOT_MAGIC = b"PSRX"
+SNAPSHOT_SUFFIX = ".bin"
+COLUMN_TYPECODES = ("I", "I", "I", "q")
+
+_HEADER = struct.Struct("<4sIQ")
+
+
+@dataclass
+class ExportSnapshot:
+    records: List[ItemRecord]
+    warnings: LoadWarnings
+    name_index: NameIndex
+
+
+class _DigestReader(io.RawIOBase):
+    def __init__(self, raw: BinaryIO) -> None:
+        self.raw = raw
+        self.digest = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = self.raw.readinto(buffer)
+        if count:
+            self.digest.update(memoryview(buffer)[:count])
+        return count
+
+
+def encode_snapshot(snapshot: ExportSnapshot) -> bytes:
+    pools: Tuple[dict[str, int], ...] = ({}, {}, {})
+    columns = [array(typecode) for typecode in COLUMN_TYPECODES]
+    for record in snapshot.records:
+        for pool, column, value in zip(pools, columns, (record.name, record.tab, str(record.total))):
+            column.append(pool.setdefault(value, len(pool)))
+        columns[3].append(record.quantity)
+
+    metadata = {
+        "count": len(snapshot.records),
+        "names": list(pools[0]),
+        "tabs": list(pools[1]),
+        "totals": list(pools[2]),
+        "warnings": {
+            "max_examples": snapshot.warnings.max_examples,
+            "counts": snapshot.warnings.counts,
+            "examples": snapshot.warnings.examples,
+        },
+        "case_insensitive": snapshot.name_index.case_insensitive,
+        "index": snapshot.name_index.reversed_names(),
+    }
+    body = json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(SNAPSHOT_MAGIC, EXPORT_CACHE_VERSION, len(body))
+    return b"".join([header, body, *(column.tobytes() for column in columns)])
+
+
+def decode_snapshot(data: bytes) -> ExportSnapshot:
+    magic, version, length = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != EXPORT_CACHE_VERSION:
+        raise ValueError("Unsupported export snapshot.")
+    offset = _HEADER.size
+    metadata = json.loads(data[offset : offset + length])
+    offset += length
+
+    count = metadata["count"]
+    columns = []
+    for typecode in COLUMN_TYPECODES:
+        column = array(typecode)
+        size = column.itemsize * count
+        column.frombytes(data[offset : offset + size])
+        columns.append(column)
+        offset += size
+    if offset != len(data):
+        raise ValueError("Truncated export snapshot.")
+
+    warnings = metadata["warnings"]
+    names = metadata["names"]
+    tabs = metadata["tabs"]
+    totals = [Decimal(value) for value in metadata["totals"]]
+    records = [
+        ItemRecord(name=names[name], tab=tabs[tab], quantity=quantity, total=totals[total])
+        for name, tab, total, quantity in zip(*columns)
+    ]
+    return ExportSnapshot(
+        records=records,
+        warnings=LoadWarnings(
+            max_examples=int(warnings["max_examples"]),
+            counts={str(category): int(count) for category, count in warnings["counts"].items()},
+            examples=[str(message) for message in warnings["examples"]],
+        ),
+        name_index=NameIndex.from_reversed_names(metadata["index"], bool(metadata["case_insensitive"])),
+    )
+
+
+def _parse_export(path: Path, case_insensitive: bool) -> Tuple[str, ExportSnapshot]:
+    warnings = LoadWarnings()
+    with path.open("rb") as raw:
+        reader = _DigestReader(raw)
+        with io.TextIOWrapper(io.BufferedReader(reader), encoding=CSV_ENCODING, newline="") as handle:
+            records = list(iter_records(handle, warnings.add))
+            handle.read()
+            digest = reader.digest.hexdigest()
+    snapshot = ExportSnapshot(
+        records=records,
+        warnings=warnings,
+        name_index=NameIndex((record.name for record in records), case_insensitive),
+    )
+    return digest, snapshot
+
+
+class ExportCache:
+    def __init__(
+        self,
+        directory: str,
+        max_snapshots: int = EXPORT_CACHE_SNAPSHOTS,
+        case_insensitive: bool = CASE_INSENSITIVE_MATCHING,
+        max_bytes: int = EXPORT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_snapshots = max(1, max_snapshots)
+        self.max_bytes = max_bytes
+        self.case_insensitive = case_insensitive
+        self.stats = CacheStats()
+
+    def snapshot_path(self, digest: str) -> Path:
+        key = f"{digest}:{EXPORT_CACHE_VERSION}:{int(self.case_insensitive)}"
+        return self.directory / (hashlib.sha256(key.encode("ascii")).hexdigest() + SNAPSHOT_SUFFIX)
+
+    def load(self, path: str) -> ExportSnapshot:
+        csv_path = resolve_csv_path(path)
+        with csv_path.open("rb") as handle:
+            digest = hashlib.file_digest(handle, "sha256").hexdigest()
+        snapshot = self._read(self.snapshot_path(digest))
+        if snapshot is not None:
+            self.stats.hits += 1
+            return snapshot
+
+        self.stats.misses += 1
+        digest, snapshot = _parse_export(csv_path, self.case_insensitive)
+        self._write(self.snapshot_path(digest), snapshot)
+        return snapshot
+
+    def _read(self, snapshot_path: Path) -> ExportSnapshot | None:
+        try:
+            snapshot = decode_snapshot(snapshot_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, struct.error):
+            snapshot_path.unlink(missing_ok=True)
+            return None
+        os.utime(snapshot_path)
+        return snapshot
+
+    def _write(self, snapshot_path: Path, snapshot: ExportSnapshot) -> None:
+        try:
+            payload = encode_snapshot(snapshot)
+        except OverflowError:
+            return
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = snapshot_path.with_suffix(SNAPSHOT_SUFFIX + ".tmp")
+            tmp_path.write_bytes(payload)
+            tmp_path.replace(snapshot_path)
+        except OSError:
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        snapshots = sorted(
+            ((item.stat(), item) for item in self.directory.glob("*" + SNAPSHOT_SUFFIX)),
+            key=lambda entry: entry[0].st_mtime_ns,
+        )
+        total_bytes = sum(stat.st_size for stat, _ in snapshots)
+        for index, (stat, stale) in enumerate(snapshots):
+            if len(snapshots) - index <= self.max_snapshots and total_bytes <= self.max_bytes:
+                break
+            stale.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+            self.stats.evictions += 1
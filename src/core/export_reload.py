@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+from .config import CSV_CHUNK_SIZE
+from .csv_loader import iter_csv
+from .export_cache import ExportCache
+from .models import ItemRecord, LoadWarnings
+
+RecordKey = Tuple[str, str, int]
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class ExportDiff:
+    added: List[ItemRecord] = field(default_factory=list)
+    removed: List[ItemRecord] = field(default_factory=list)
+    changed: List[Tuple[ItemRecord, ItemRecord]] = field(default_factory=list)
+    added_names: List[str] = field(default_factory=list)
+    removed_names: List[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def outgoing(self) -> List[ItemRecord]:
+        return self.removed + [before for before, _ in self.changed]
+
+    @property
+    def incoming(self) -> List[ItemRecord]:
+        return self.added + [after for _, after in self.changed]
+
+    def summary(self) -> str:
+        return f"{len(self.added)} added, {len(self.removed)} removed, {len(self.changed)} changed"
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(path: str) -> FileSignature:
+    stat = os.stat(path)
+    return FileSignature(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=file_digest(path))
+
+
+def _keyed(records: Iterable[ItemRecord]) -> dict[RecordKey, ItemRecord]:
+    seen: Counter[Tuple[str, str]] = Counter()
+    keyed: dict[RecordKey, ItemRecord] = {}
+    for record in records:
+        occurrence = seen[(record.name, record.tab)]
+        seen[(record.name, record.tab)] += 1
+        keyed[(record.name, record.tab, occurrence)] = record
+    return keyed
+
+
+def diff_records(old: Iterable[ItemRecord], new: Iterable[ItemRecord]) -> ExportDiff:
+    before = _keyed(old)
+    after = _keyed(new)
+    added = [record for key, record in after.items() if key not in before]
+    removed = [record for key, record in before.items() if key not in after]
+    changed = [
+        (before[key], record)
+        for key, record in after.items()
+        if key in before and before[key] != record
+    ]
+    if not added and not removed:
+        return ExportDiff(changed=changed)
+
+    old_names = {key[0] for key in before}
+    new_names = {key[0] for key in after}
+    return ExportDiff(
+        added=added,
+        removed=removed,
+        changed=changed,
+        added_names=sorted(new_names - old_names),
+        removed_names=sorted(old_names - new_names),
+    )
+
+
+class ExportReloader:
+    def __init__(self, path: str, chunk_size: int = CSV_CHUNK_SIZE, cache: Optional[ExportCache] = None) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.signature: Optional[FileSignature] = None
+        self.records: List[ItemRecord] = []
+        self.warnings = LoadWarnings()
+
+    def _unchanged_on_disk(self) -> bool:
+        if self.signature is None:
+            return False
+        stat = os.stat(self.path)
+        if (stat.st_mtime_ns, stat.st_size) == (self.signature.mtime_ns, self.signature.size):
+            return True
+        if stat.st_size != self.signature.size:
+            return False
+        digest = file_digest(self.path)
+        if digest != self.signature.digest:
+            return False
+        self.signature = FileSignature(mtime_ns=stat.st_mtime_ns, size=stat.st_size, digest=digest)
+        return True
+
+    def reload(self, force: bool = False) -> Optional[ExportDiff]:
+        if not force and self._unchanged_on_disk():
+            return None
+
+        signature = file_signature(self.path)
+        warnings = LoadWarnings()
+        if self.cache is not None and force:
+            snapshot = self.cache.load(self.path)
+            records = snapshot.records
+            warnings.extend(snapshot.warnings)
+        else:
+            records = [record for chunk in iter_csv(self.path, self.chunk_size, warnings) for record in chunk]
+        diff = diff_records(self.records, records)
+        self.signature = signature
+        self.records = records
+        self.warnings = warnings
+        return diff
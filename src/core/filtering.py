@@ -1,5 +1,8 @@
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Iterable, List
+from typing import Callable, Iterable, List, Tuple
 
 from .models import FilterSpec, ItemRecord
 
@@ -10,44 +13,148 @@ def _price_for(item: ItemRecord) -> Decimal:
     return item.total / Decimal(item.quantity)
 
 
-def filter_items(items: Iterable[ItemRecord], spec: FilterSpec) -> List[ItemRecord]:
-    filtered = list(items)
-
-    if spec.tabs:
-        filtered = [item for item in filtered if item.tab in spec.tabs]
-
-    if spec.name_query:
-        query = spec.name_query.casefold()
-        filtered = [item for item in filtered if query in item.name.casefold()]
-
-    if spec.min_total is not None:
-        filtered = [item for item in filtered if item.total >= spec.min_total]
-
-    if spec.max_total is not None:
-        filtered = [item for item in filtered if item.total <= spec.max_total]
+def _matches(item: ItemRecord, spec: FilterSpec, query: str | None) -> bool:
+    if spec.tabs and item.tab not in spec.tabs:
+        return False
+    if query and query not in item.name.casefold():
+        return False
+    if spec.min_total is not None and item.total < spec.min_total:
+        return False
+    if spec.max_total is not None and item.total > spec.max_total:
+        return False
+    if spec.min_price is not None and _price_for(item) < spec.min_price:
+        return False
+    if spec.max_price is not None and _price_for(item) > spec.max_price:
+        return False
+    if spec.min_quantity is not None and item.quantity < spec.min_quantity:
+        return False
+    if spec.max_quantity is not None and item.quantity > spec.max_quantity:
+        return False
+    return True
+
+
+def _smallest(items: Iterable[ItemRecord], count: int, key: Callable[[ItemRecord], tuple]) -> List[ItemRecord]:
+    if count < 0:
+        return sorted(items, key=key)[:count]
+    return heapq.nsmallest(count, items, key=key)
 
-    if spec.min_price is not None:
-        filtered = [item for item in filtered if _price_for(item) >= spec.min_price]
 
-    if spec.max_price is not None:
-        filtered = [item for item in filtered if _price_for(item) <= spec.max_price]
-
-    if spec.min_quantity is not None:
-        filtered = [item for item in filtered if item.quantity >= spec.min_quantity]
-
-    if spec.max_quantity is not None:
-        filtered = [item for item in filtered if item.quantity <= spec.max_quantity]
+def filter_items(items: Iterable[ItemRecord], spec: FilterSpec) -> List[ItemRecord]:
+    query = spec.name_query.casefold() if spec.name_query else None
+    filtered: Iterable[ItemRecord] = (item for item in items if _matches(item, spec, query))
 
     if spec.top_n is not None:
-        filtered = sorted(
+        filtered = _smallest(
             filtered,
-            key=lambda item: (-item.total, item.name, item.tab, item.quantity),
-        )[: spec.top_n]
+            spec.top_n,
+            lambda item: (-item.total, item.name, item.tab, item.quantity),
+        )
 
     if spec.bottom_n is not None:
-        filtered = sorted(
+        filtered = _smallest(
             filtered,
-            key=lambda item: (item.total, item.name, item.tab, item.quantity),
-        )[: spec.bottom_n]
-
-    return filtered
+            spec.bottom_n,
+            lambda item: (item.total, item.name, item.tab, item.quantity),
+        )
+
+    return list(filtered)
+
+
+def split_selection(items: Iterable[ItemRecord], spec: FilterSpec) -> Tuple[List[ItemRecord], List[str]]:
+    names: List[str] = []
+
+    def remember(stream: Iterable[ItemRecord]) -> Iterable[ItemRecord]:
+        for item in stream:
+            names.append(item.name)
+            yield item
+
+    selected = filter_items(remember(items), spec)
+    pending = Counter(item.name for item in selected)
+    non_targets: List[str] = []
+    for name in names:
+        if pending[name]:
+            pending[name] -= 1
+        else:
+            non_targets.append(name)
+    return selected, non_targets
+
+
+@dataclass
+class SelectionDelta:
+    added_targets: set[str] = field(default_factory=set)
+    removed_targets: set[str] = field(default_factory=set)
+    added_non_targets: set[str] = field(default_factory=set)
+    removed_non_targets: set[str] = field(default_factory=set)
+
+
+def _adjust(counter: Counter, key, step: int) -> None:
+    count = counter[key] + step
+    if count:
+        counter[key] = count
+    else:
+        del counter[key]
+
+
+class LiveSelection:
+    def __init__(self, items: Iterable[ItemRecord], spec: FilterSpec) -> None:
+        self.spec = spec
+        self._query = spec.name_query.casefold() if spec.name_query else None
+        self._ranked = spec.top_n is not None or spec.bottom_n is not None
+        self._records: Counter[ItemRecord] = Counter(items)
+        self._names: Counter[str] = Counter()
+        for item, count in self._records.items():
+            self._names[item.name] += count
+        self._reselect()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def items(self) -> List[ItemRecord]:
+        return list(self._selected.elements())
+
+    def target_names(self) -> List[str]:
+        return list(self._targets.elements())
+
+    def non_target_names(self) -> List[str]:
+        return [name for name, count in self._names.items() for _ in range(count - self._targets[name])]
+
+    def apply(self, removed: Iterable[ItemRecord], added: Iterable[ItemRecord]) -> SelectionDelta:
+        changes = [(item, -1) for item in removed] + [(item, 1) for item in added]
+        if self._ranked:
+            touched = set(self._names)
+        else:
+            touched = {item.name for item, _ in changes}
+        before = {name: self._membership(name) for name in touched}
+
+        for item, step in changes:
+            _adjust(self._records, item, step)
+            _adjust(self._names, item.name, step)
+            if not self._ranked and _matches(item, self.spec, self._query):
+                _adjust(self._selected, item, step)
+                _adjust(self._targets, item.name, step)
+                self._count += step
+        if self._ranked:
+            self._reselect()
+            touched |= set(self._names)
+
+        delta = SelectionDelta()
+        for name in touched:
+            was_target, was_non_target = before.get(name, (False, False))
+            is_target, is_non_target = self._membership(name)
+            if is_target != was_target:
+                (delta.added_targets if is_target else delta.removed_targets).add(name)
+            if is_non_target != was_non_target:
+                (delta.added_non_targets if is_non_target else delta.removed_non_targets).add(name)
+        return delta
+
+    def _membership(self, name: str) -> Tuple[bool, bool]:
+        targets = self._targets[name]
+        return targets > 0, self._names[name] > targets
+
+    def _reselect(self) -> None:
+        self._selected: Counter[ItemRecord] = Counter(filter_items(self._records.elements(), self.spec))
+        self._targets: Counter[str] = Counter()
+        for item, count in self._selected.items():
+            self._targets[item.name] += count
+        self._count = sum(self._selected.values())
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from math import ceil, floor
+from typing import Any, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .config import CSV_CHUNK_SIZE
+from .csv_loader import iter_csv
+from .models import FilterSpec, ItemRecord, LoadWarnings, SortSpec
+
+HAS_NUMPY = np is not None
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+SORT_KEYS = {
+    "name": ("name", "tab", "quantity", "total"),
+    "tab": ("tab", "name", "quantity", "total"),
+    "quantity": ("quantity", "name", "tab", "total"),
+    "total": ("total", "name", "tab", "quantity"),
+}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("ItemTable requires numpy; install it with 'pip install numpy'.")
+
+
+def _check_int64(value: int, label: str) -> int:
+    if not INT64_MIN <= value <= INT64_MAX:
+        raise ValueError(f"{label} {value} does not fit in a 64-bit column.")
+    return value
+
+
+def _total_digits(total: Decimal) -> tuple[int, int]:
+    sign, digits, exponent = total.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f"Total {total} cannot be stored as fixed-point.")
+    value = int("".join(map(str, digits)))
+    return (-value if sign else value), exponent
+
+
+def _pool_ranks(pool: List[str]) -> Any:
+    ranks = np.empty(len(pool), dtype=np.int64)
+    ranks[sorted(range(len(pool)), key=pool.__getitem__)] = np.arange(len(pool))
+    return ranks
+
+
+def _at_least(values: Any, bound: int) -> Any:
+    if bound > INT64_MAX:
+        return np.zeros(len(values), dtype=bool)
+    if bound < INT64_MIN:
+        return np.ones(len(values), dtype=bool)
+    return values >= bound
+
+
+def _at_most(values: Any, bound: int) -> Any:
+    if bound < INT64_MIN:
+        return np.zeros(len(values), dtype=bool)
+    if bound > INT64_MAX:
+        return np.ones(len(values), dtype=bool)
+    return values <= bound
+
+
+class _TableBuilder:
+    def __init__(self) -> None:
+        self.names: dict[str, int] = {}
+        self.tabs: dict[str, int] = {}
+        self.name_codes = array("q")
+        self.tab_codes = array("q")
+        self.quantities = array("q")
+        self.totals = array("q")
+        self.exponents = array("h")
+        self.scale = 0
+
+    def add(self, record: ItemRecord) -> None:
+        value, exponent = _total_digits(record.total)
+        if -exponent > self.scale:
+            factor = 10 ** (-exponent - self.scale)
+            try:
+                self.totals = array("q", (total * factor for total in self.totals))
+            except OverflowError:
+                raise ValueError(f"Totals cannot share {-exponent} decimal places in a 64-bit column.") from None
+            self.scale = -exponent
+        self.name_codes.append(self.names.setdefault(record.name, len(self.names)))
+        self.tab_codes.append(self.tabs.setdefault(record.tab, len(self.tabs)))
+        self.quantities.append(_check_int64(record.quantity, "Quantity"))
+        self.totals.append(_check_int64(value * 10 ** (exponent + self.scale), "Total"))
+        try:
+            self.exponents.append(exponent)
+        except OverflowError:
+            raise ValueError(f"Total {record.total} has an exponent outside the stored range.") from None
+
+    def build(self) -> ItemTable:
+        return ItemTable(
+            name_pool=list(self.names),
+            tab_pool=list(self.tabs),
+            name_codes=np.frombuffer(self.name_codes, dtype=np.int64).astype(np.int32),
+            tab_codes=np.frombuffer(self.tab_codes, dtype=np.int64).astype(np.int32),
+            quantities=np.frombuffer(self.quantities, dtype=np.int64).copy(),
+            totals=np.frombuffer(self.totals, dtype=np.int64).copy(),
+            total_exponents=np.frombuffer(self.exponents, dtype=np.int16).copy(),
+            total_scale=self.scale,
+        )
+
+
+@dataclass(frozen=True)
+class ItemTable:
+    name_pool: List[str]
+    tab_pool: List[str]
+    name_codes: Any
+    tab_codes: Any
+    quantities: Any
+    totals: Any
+    total_exponents: Any
+    total_scale: int
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+    @classmethod
+    def from_records(cls, records: Iterable[ItemRecord]) -> ItemTable:
+        _require_numpy()
+        builder = _TableBuilder()
+        for record in records:
+            builder.add(record)
+        return builder.build()
+
+    def to_records(self) -> List[ItemRecord]:
+        return [
+            ItemRecord(
+                name=self.name_pool[name],
+                tab=self.tab_pool[tab],
+                quantity=quantity,
+                total=self._source_decimal(total, exponent),
+            )
+            for name, tab, quantity, total, exponent in zip(
+                self.name_codes.tolist(),
+                self.tab_codes.tolist(),
+                self.quantities.tolist(),
+                self.totals.tolist(),
+                self.total_exponents.tolist(),
+            )
+        ]
+
+    def names(self) -> List[str]:
+        return [self.name_pool[code] for code in self.name_codes.tolist()]
+
+    def total_sum(self) -> Decimal:
+        return self._decimal(sum(self.totals.tolist()))
+
+    def take(self, indices: Any) -> ItemTable:
+        return ItemTable(
+            name_pool=self.name_pool,
+            tab_pool=self.tab_pool,
+            name_codes=self.name_codes[indices],
+            tab_codes=self.tab_codes[indices],
+            quantities=self.quantities[indices],
+            totals=self.totals[indices],
+            total_exponents=self.total_exponents[indices],
+            total_scale=self.total_scale,
+        )
+
+    def filter(self, spec: FilterSpec) -> ItemTable:
+        mask = np.ones(len(self), dtype=bool)
+        if spec.tabs:
+            mask &= np.isin(self.tab_codes, [code for code, tab in enumerate(self.tab_pool) if tab in spec.tabs])
+        if spec.name_query:
+            query = spec.name_query.casefold()
+            hits = np.array([query in name.casefold() for name in self.name_pool], dtype=bool)
+            mask &= hits[self.name_codes]
+        if spec.min_total is not None:
+            mask &= _at_least(self.totals, ceil(self._scaled(spec.min_total)))
+        if spec.max_total is not None:
+            mask &= _at_most(self.totals, floor(self._scaled(spec.max_total)))
+        if spec.min_price is not None:
+            mask &= self._price_mask(spec.min_price, at_least=True)
+        if spec.max_price is not None:
+            mask &= self._price_mask(spec.max_price, at_least=False)
+        if spec.min_quantity is not None:
+            mask &= _at_least(self.quantities, spec.min_quantity)
+        if spec.max_quantity is not None:
+            mask &= _at_most(self.quantities, spec.max_quantity)
+
+        indices = np.flatnonzero(mask)
+        if spec.top_n is not None:
+            indices = self._ordered(indices, ("total", "name", "tab", "quantity"), (True, False, False, False))
+            indices = indices[: spec.top_n]
+        if spec.bottom_n is not None:
+            indices = self._ordered(indices, ("total", "name", "tab", "quantity"), (False,) * 4)
+            indices = indices[: spec.bottom_n]
+        return self.take(indices)
+
+    def sort(self, spec: SortSpec) -> ItemTable:
+        fields = SORT_KEYS.get(spec.field.lower())
+        if fields is None:
+            raise ValueError(f"Unsupported sort field: {spec.field}")
+        descending = not spec.ascending
+        return self.take(self._ordered(np.arange(len(self)), fields, (descending,) * len(fields)))
+
+    def _decimal(self, scaled: int) -> Decimal:
+        return Decimal(scaled).scaleb(-self.total_scale)
+
+    def _source_decimal(self, scaled: int, exponent: int) -> Decimal:
+        return Decimal(scaled // 10 ** (exponent + self.total_scale)).scaleb(exponent)
+
+    def _scaled(self, value: Decimal) -> Fraction:
+        return Fraction(value) * 10**self.total_scale
+
+    def _price_mask(self, bound: Decimal, at_least: bool) -> Any:
+        scaled = self._scaled(bound)
+        positive = self.quantities > 0
+        zero_passes = Decimal("0") >= bound if at_least else Decimal("0") <= bound
+        limit = max(abs(int(self.totals.min(initial=0))), int(self.totals.max(initial=0)))
+        quantity_limit = int(self.quantities.max(initial=0))
+        if max(limit * scaled.denominator, quantity_limit * abs(scaled.numerator)) < 2**62:
+            totals, quantities = self.totals, self.quantities
+        else:
+            totals, quantities = self.totals.astype(object), self.quantities.astype(object)
+        left = totals * scaled.denominator
+        right = quantities * scaled.numerator
+        passes = left >= right if at_least else left <= right
+        return np.where(positive, passes.astype(bool), zero_passes)
+
+    def _column_key(self, field: str, indices: Any, descending: bool) -> Any:
+        if field == "name":
+            key = _pool_ranks(self.name_pool)[self.name_codes[indices]]
+        elif field == "tab":
+            key = _pool_ranks(self.tab_pool)[self.tab_codes[indices]]
+        else:
+            values = self.quantities[indices] if field == "quantity" else self.totals[indices]
+            key = np.unique(values, return_inverse=True)[1].reshape(-1)
+        return -key if descending else key
+
+    def _ordered(self, indices: Any, fields: Iterable[str], descending: Iterable[bool]) -> Any:
+        keys = [self._column_key(field, indices, flag) for field, flag in zip(fields, descending)]
+        return indices[np.lexsort(keys[::-1])]
+
+
+def load_item_table(
+    path: str,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    warnings: Optional[LoadWarnings] = None,
+) -> ItemTable:
+    _require_numpy()
+    builder = _TableBuilder()
+    for chunk in iter_csv(path, chunk_size, warnings):
+        for record in chunk:
+            builder.add(record)
+    return builder.build()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional
+
+from .config import MAX_WARNING_EXAMPLES, NEGATION_PREFIX
 
 
 @dataclass(frozen=True)
@@ -13,6 +15,47 @@ class ItemRecord:
     total: Decimal
 
 
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+
+@dataclass
+class LoadWarnings:
+    max_examples: int = MAX_WARNING_EXAMPLES
+    counts: dict[str, int] = field(default_factory=dict)
+    examples: list[str] = field(default_factory=list)
+
+    def add(self, category: str, message: str) -> None:
+        self.counts[category] = self.counts.get(category, 0) + 1
+        if len(self.examples) < self.max_examples:
+            self.examples.append(message)
+
+    def extend(self, other: LoadWarnings, prefix: str = "") -> None:
+        for category, count in other.counts.items():
+            self.counts[category] = self.counts.get(category, 0) + count
+        room = self.max_examples - len(self.examples)
+        self.examples.extend(prefix + message for message in other.examples[: max(0, room)])
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def summary(self) -> list[str]:
+        lines = list(self.examples)
+        hidden = self.total - len(self.examples)
+        if hidden > 0:
+            counts = ", ".join(f"{category}: {count}" for category, count in sorted(self.counts.items()))
+            lines.append(f"... and {hidden} more warning(s) ({counts}).")
+        return lines
+
+
 @dataclass(frozen=True)
 class FilterSpec:
     tabs: set[str] = field(default_factory=set)
@@ -33,11 +76,66 @@ class SortSpec:
     ascending: bool = True
 
 
+@dataclass(frozen=True)
+class CertifiedPattern:
+    kind: str
+    literal: str
+
+
+@dataclass(frozen=True)
+class CoverageCertificate:
+    case_insensitive: bool
+    patterns: list[CertifiedPattern]
+    assignments: dict[str, int]
+
+
+@dataclass
+class GenerationStats:
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    suffix_count: int = 0
+    candidate_count: int = 0
+    cover_iterations: int = 0
+    validated_names: int = 0
+    validation_regex_executions: int = 0
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+
 @dataclass(frozen=True)
 class RegexResult:
     entries: list[str]
     error: Optional[str] = None
+    proven_optimal: Optional[bool] = None
+    certificate: Optional[CoverageCertificate] = field(default=None, compare=False)
+    negated: bool = False
+    stats: Optional[GenerationStats] = field(default=None, compare=False)
 
     @property
     def ok(self) -> bool:
         return self.error is None
+
+    @property
+    def search_entries(self) -> list[str]:
+        if self.negated:
+            return [NEGATION_PREFIX + entry for entry in self.entries]
+        return list(self.entries)
+
+
+@dataclass(frozen=True)
+class CollisionReport:
+    entries: list[str]
+    uncovered_targets: list[str] = field(default_factory=list)
+    matched_non_targets: dict[str, list[int]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.uncovered_targets and not self.matched_non_targets
+
+
+@dataclass(frozen=True)
+class RegexJob:
+    target_names: list[str]
+    non_target_names: Optional[list[str]] = None
+    options: dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .config import CSV_ENCODING
+from .csv_loader import iter_records, resolve_csv_path
+from .export_cache import ExportCache
+from .models import ItemRecord, LoadWarnings
+from .regex_batch import pool_context
+
+RecordKey = Tuple[str, str]
+SourceResult = Tuple[List[ItemRecord], LoadWarnings]
+
+
+@dataclass(frozen=True)
+class MergedExport:
+    records: List[ItemRecord]
+    sources: Dict[RecordKey, Tuple[str, ...]]
+    row_count: int
+
+    def sources_for(self, record: ItemRecord) -> Tuple[str, ...]:
+        return self.sources.get((record.name, record.tab), ())
+
+
+def _load_source(path: str) -> SourceResult:
+    warnings = LoadWarnings()
+    with open(path, newline="", encoding=CSV_ENCODING) as handle:
+        records = list(iter_records(handle, warnings.add))
+    return records, warnings
+
+
+def _load_cached(cache: ExportCache, path: str) -> SourceResult:
+    snapshot = cache.load(path)
+    return snapshot.records, snapshot.warnings
+
+
+def _executor(workers: int, cache: Optional[ExportCache]) -> Executor:
+    if cache is not None:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+
+
+def merge_records(sourced: Iterable[Tuple[str, Iterable[ItemRecord]]]) -> MergedExport:
+    merged: Dict[RecordKey, ItemRecord] = {}
+    sources: Dict[RecordKey, Dict[str, None]] = {}
+    row_count = 0
+    for source, records in sourced:
+        for record in records:
+            row_count += 1
+            key = (record.name, record.tab)
+            previous = merged.get(key)
+            if previous is not None:
+                record = ItemRecord(
+                    name=record.name,
+                    tab=record.tab,
+                    quantity=previous.quantity + record.quantity,
+                    total=previous.total + record.total,
+                )
+            merged[key] = record
+            sources.setdefault(key, {})[source] = None
+    return MergedExport(
+        records=list(merged.values()),
+        sources={key: tuple(labels) for key, labels in sources.items()},
+        row_count=row_count,
+    )
+
+
+def load_exports(
+    paths: Sequence[str],
+    max_workers: Optional[int] = None,
+    warnings: Optional[LoadWarnings] = None,
+    cache: Optional[ExportCache] = None,
+) -> MergedExport:
+    sources = list(dict.fromkeys(paths))
+    resolved = [str(resolve_csv_path(path)) for path in sources]
+    load = (lambda path: _load_cached(cache, path)) if cache is not None else _load_source
+
+    workers = min(len(resolved), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        results = [load(path) for path in resolved]
+    else:
+        with _executor(workers, cache) as executor:
+            results = list(executor.map(load, resolved))
+
+    if warnings is not None:
+        for source, (_, source_warnings) in zip(sources, results):
+            warnings.extend(source_warnings, prefix=f"{source}: ")
+    return merge_records((source, records) for source, (records, _) in zip(sources, results))
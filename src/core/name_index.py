@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+from .config import CASE_INSENSITIVE_MATCHING
+from .suffix_index import SuffixIndex
+
+
+class ComplementIndex:
+    def __init__(self, universe: SuffixIndex, targets: SuffixIndex) -> None:
+        self._universe = universe
+        self._targets = targets
+
+    def _has_non_target_with_suffix(self, suffix: str) -> bool:
+        return self._universe.count_with_suffix(suffix) > self._targets.count_with_suffix(suffix)
+
+    def shared_suffix_length(self, text: str) -> int:
+        low = 0
+        high = len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._has_non_target_with_suffix(text[len(text) - middle :]):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+
+class NameIndex(SuffixIndex):
+    def __init__(self, names: Iterable[str], case_insensitive: bool = CASE_INSENSITIVE_MATCHING) -> None:
+        self.case_insensitive = case_insensitive
+        self._fingerprint: Optional[int] = None
+        super().__init__(name.lower() if case_insensitive else name for name in names)
+
+    @classmethod
+    def from_reversed_names(cls, reversed_names: Iterable[str], case_insensitive: bool) -> NameIndex:
+        index = cls((), case_insensitive)
+        index._reversed = list(reversed_names)
+        return index
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, "_fingerprint": None}
+
+    def add(self, name: str) -> None:
+        size = len(self)
+        super().add(name)
+        if self._fingerprint is not None and len(self) != size:
+            self._fingerprint += hash(name)
+
+    def discard(self, name: str) -> None:
+        size = len(self)
+        super().discard(name)
+        if self._fingerprint is not None and len(self) != size:
+            self._fingerprint -= hash(name)
+
+    def apply_changes(self, added: Iterable[str], removed: Iterable[str]) -> None:
+        for name in removed:
+            self.discard(name.lower() if self.case_insensitive else name)
+        for name in added:
+            self.add(name.lower() if self.case_insensitive else name)
+
+    def fingerprint(self) -> int:
+        if self._fingerprint is None:
+            self._fingerprint = sum(hash(name[::-1]) for name in self._reversed)
+        return self._fingerprint
+
+    def matches_selection(
+        self,
+        targets_norm: set[str],
+        non_targets_norm: set[str],
+        case_insensitive: bool,
+    ) -> bool:
+        if case_insensitive != self.case_insensitive:
+            return False
+        if len(targets_norm) + len(non_targets_norm) != len(self):
+            return False
+        return sum(map(hash, targets_norm)) + sum(map(hash, non_targets_norm)) == self.fingerprint()
+
+    def complement(self, targets_norm: Iterable[str]) -> ComplementIndex:
+        return ComplementIndex(self, SuffixIndex(targets_norm))
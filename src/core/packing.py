@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+EXACT_PACKING_ITEM_LIMIT = 40
+EXACT_PACKING_NODE_LIMIT = 200_000
+
+
+def _entry_length(count: int, total: int, overhead: int, single_overhead: int) -> int:
+    if count == 1:
+        return total + single_overhead
+    return total + (count - 1) + overhead
+
+
+def _fits(count: int, total: int, max_length: int, overhead: int, single_overhead: int) -> bool:
+    return _entry_length(count, total, overhead, single_overhead) <= max_length
+
+
+def _sequential_bins(
+    lengths: Sequence[int],
+    max_length: int,
+    overhead: int,
+    single_overhead: int,
+) -> List[List[int]]:
+    bins: List[List[int]] = []
+    total = 0
+    for index, length in enumerate(lengths):
+        if bins and _fits(len(bins[-1]) + 1, total + length, max_length, overhead, single_overhead):
+            bins[-1].append(index)
+            total += length
+        else:
+            bins.append([index])
+            total = length
+    return bins
+
+
+def _first_fit_decreasing(
+    lengths: Sequence[int],
+    max_length: int,
+    overhead: int,
+    single_overhead: int,
+) -> List[List[int]]:
+    size = 1 << max(0, len(lengths) - 1).bit_length()
+    room = [-1] * (2 * size)
+    bins: List[List[int]] = []
+    totals: List[int] = []
+    for index in sorted(range(len(lengths)), key=lambda item: (-lengths[item], item)):
+        length = lengths[index]
+        if room[1] >= length:
+            node = 1
+            while node < size:
+                node = 2 * node if room[2 * node] >= length else 2 * node + 1
+            position = node - size
+        else:
+            position = len(bins)
+            bins.append([])
+            totals.append(0)
+        bins[position].append(index)
+        totals[position] += length
+
+        node = size + position
+        room[node] = max_length - overhead - totals[position] - len(bins[position])
+        while node > 1:
+            node //= 2
+            room[node] = max(room[2 * node], room[2 * node + 1])
+    return bins
+
+
+def _assign(
+    order: List[int],
+    position: int,
+    lengths: Sequence[int],
+    bins: List[List[int]],
+    totals: List[int],
+    max_length: int,
+    overhead: int,
+    single_overhead: int,
+    budget: List[int],
+) -> bool:
+    if position == len(order):
+        return True
+    budget[0] -= 1
+    if budget[0] < 0:
+        return False
+
+    index = order[position]
+    length = lengths[index]
+    for slot, members in enumerate(bins):
+        if not members and slot > 0 and not bins[slot - 1]:
+            break
+        if not _fits(len(members) + 1, totals[slot] + length, max_length, overhead, single_overhead):
+            continue
+        members.append(index)
+        totals[slot] += length
+        if _assign(order, position + 1, lengths, bins, totals, max_length, overhead, single_overhead, budget):
+            return True
+        members.pop()
+        totals[slot] -= length
+    return False
+
+
+def _exact_bins(
+    lengths: Sequence[int],
+    bin_count: int,
+    max_length: int,
+    overhead: int,
+    single_overhead: int,
+    budget: List[int],
+) -> Optional[List[List[int]]]:
+    order = sorted(range(len(lengths)), key=lambda item: (-lengths[item], item))
+    bins: List[List[int]] = [[] for _ in range(bin_count)]
+    totals = [0] * bin_count
+    if _assign(order, 0, lengths, bins, totals, max_length, overhead, single_overhead, budget):
+        return [members for members in bins if members]
+    return None
+
+
+def pack_items(
+    lengths: Sequence[int],
+    max_length: int,
+    overhead: int = 0,
+    single_overhead: int = 0,
+) -> List[List[int]]:
+    if not lengths:
+        return []
+
+    capacity = max_length + 1 - min(overhead, single_overhead)
+    lower_bound = max(1, -(-sum(length + 1 for length in lengths) // capacity))
+
+    best = _sequential_bins(lengths, max_length, overhead, single_overhead)
+    if len(best) > lower_bound:
+        decreasing = _first_fit_decreasing(lengths, max_length, overhead, single_overhead)
+        if len(decreasing) < len(best):
+            best = decreasing
+
+    if lower_bound < len(best) and len(lengths) <= EXACT_PACKING_ITEM_LIMIT:
+        budget = [EXACT_PACKING_NODE_LIMIT]
+        for bin_count in range(lower_bound, len(best)):
+            found = _exact_bins(lengths, bin_count, max_length, overhead, single_overhead, budget)
+            if found is not None:
+                best = found
+                break
+            if budget[0] < 0:
+                break
+
+    return sorted((sorted(members) for members in best), key=lambda members: members[0])
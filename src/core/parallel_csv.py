@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import csv
+import io
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .config import CSV_ENCODING, CSV_PARALLEL_CHUNK_BYTES
+from .csv_loader import EMPTY_CSV_WARNING, Warn, iter_records, parse_rows, resolve_csv_path
+from .models import ItemRecord
+from .regex_batch import pool_context
+
+ChunkTask = Tuple[str, int, int, List[str]]
+ChunkResult = Tuple[List[ItemRecord], List[Tuple[str, int, str]], int]
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+_RFC_RECORDS = re.compile(rb'(?:(?:"[^"]*+(?:""[^"]*+)*+"|[^,"\r\n]*+)(?:,|\r\n|\n|\Z))*+')
+
+
+def _is_rfc4180(view: mmap.mmap) -> bool:
+    start = len(UTF8_BOM) if view[: len(UTF8_BOM)] == UTF8_BOM else 0
+    return _RFC_RECORDS.match(view, start).end() == len(view)
+
+
+def _record_end(view: mmap.mmap, position: int, odd: bool = False) -> int:
+    while True:
+        newline = view.find(b"\n", position)
+        if newline == -1:
+            return len(view)
+        odd ^= view[position:newline].count(b'"') % 2 == 1
+        position = newline + 1
+        if not odd:
+            return position
+
+
+def _record_boundaries(view: mmap.mmap, start: int, chunk_bytes: int) -> List[int]:
+    boundaries = [start]
+    while boundaries[-1] + chunk_bytes < len(view):
+        target = boundaries[-1] + chunk_bytes
+        odd = view[boundaries[-1] : target].count(b'"') % 2 == 1
+        position = _record_end(view, target, odd)
+        if position >= len(view):
+            break
+        boundaries.append(position)
+    boundaries.append(len(view))
+    return boundaries
+
+
+def _parse_chunk(task: ChunkTask) -> ChunkResult:
+    path, start, end, fieldnames = task
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        text = view[start:end].decode("utf-8")
+    rows = list(csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames))
+    warnings: List[Tuple[str, int, str]] = []
+    records = list(
+        parse_rows(rows, 0, lambda category, row_index, detail: warnings.append((category, row_index, detail)))
+    )
+    return records, warnings, len(rows)
+
+
+def _load_sequential(path: str, warn: Warn) -> List[ItemRecord]:
+    with open(path, newline="", encoding=CSV_ENCODING) as handle:
+        return list(iter_records(handle, warn))
+
+
+def parse_csv_parallel(
+    path: str,
+    warn: Warn,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = CSV_PARALLEL_CHUNK_BYTES,
+) -> List[ItemRecord]:
+    csv_path = str(resolve_csv_path(path))
+    if os.path.getsize(csv_path) <= chunk_bytes:
+        return _load_sequential(csv_path, warn)
+
+    with open(csv_path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        if not _is_rfc4180(view):
+            return _load_sequential(csv_path, warn)
+        header_end = _record_end(view, 0)
+        header = view[:header_end].decode(CSV_ENCODING)
+        boundaries = _record_boundaries(view, header_end, chunk_bytes)
+
+    fieldnames = next(csv.reader(io.StringIO(header, newline="")), None)
+    if not fieldnames:
+        warn("empty", EMPTY_CSV_WARNING)
+        return []
+
+    tasks = [(csv_path, start, end, fieldnames) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        results = [_parse_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+            results = list(executor.map(_parse_chunk, tasks))
+
+    records: List[ItemRecord] = []
+    row_base = 2
+    for chunk_records, chunk_warnings, row_count in results:
+        records.extend(chunk_records)
+        for category, row_index, detail in chunk_warnings:
+            warn(category, f"Row {row_base + row_index}: {detail}")
+        row_base += row_count
+    return records
+
+
+def load_csv_parallel(
+    path: str,
+    max_workers: Optional[int] = None,
+    chunk_bytes: int = CSV_PARALLEL_CHUNK_BYTES,
+) -> Tuple[List[ItemRecord], List[str]]:
+    warnings: List[str] = []
+    records = parse_csv_parallel(
+        path,
+        lambda category, message: warnings.append(message),
+        max_workers,
+        chunk_bytes,
+    )
+    return records, warnings
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Tuple
 
-from .config import DEFAULT_STORAGE_FILENAME
+from .config import DEFAULT_CACHE_FILENAME, DEFAULT_EXPORT_CACHE_DIRNAME, DEFAULT_STORAGE_FILENAME
 
 APP_DIR_NAME = "PoE Stash Regex Generator"
 
@@ -43,6 +43,16 @@ def default_storage_path(base_dir: str | None = None) -> str:
     return str(root / APP_DIR_NAME / DEFAULT_STORAGE_FILENAME)
 
 
+def default_cache_path(base_dir: str | None = None) -> str:
+    root = Path(base_dir) if base_dir else _default_base_dir()
+    return str(root / APP_DIR_NAME / DEFAULT_CACHE_FILENAME)
+
+
+def default_export_cache_dir(base_dir: str | None = None) -> str:
+    root = Path(base_dir) if base_dir else _default_base_dir()
+    return str(root / APP_DIR_NAME / DEFAULT_EXPORT_CACHE_DIRNAME)
+
+
 def save_entries(path: str, entries: Iterable[SavedRegexEntry]) -> None:
     storage_path = Path(path)
     storage_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .models import RegexJob, RegexResult
+from .regex_generator import generate_regex
+
+_UNIVERSE: Tuple[str, ...] = ()
+
+
+def _init_worker(universe: Tuple[str, ...]) -> None:
+    global _UNIVERSE
+    _UNIVERSE = universe
+
+
+def _run_job(job: RegexJob) -> RegexResult:
+    if job.non_target_names is None:
+        selected = set(job.target_names)
+        non_targets = [name for name in _UNIVERSE if name not in selected]
+    else:
+        non_targets = job.non_target_names
+    return generate_regex(job.target_names, non_targets, **job.options)
+
+
+def pool_context() -> multiprocessing.context.BaseContext:
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def generate_regex_batch(
+    universe: Iterable[str],
+    jobs: Sequence[RegexJob],
+    max_workers: Optional[int] = None,
+) -> List[RegexResult]:
+    names = tuple(universe)
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        _init_worker(names)
+        return [_run_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=pool_context(),
+        initializer=_init_worker,
+        initargs=(names,),
+    ) as executor:
+        return list(executor.map(_run_job, jobs))
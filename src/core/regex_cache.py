@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .config import (
+    ALLOW_NEGATION,
+    CASE_INSENSITIVE_MATCHING,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_MATCH_MODE,
+    DEFAULT_TIME_BUDGET_MS,
+    DEFAULT_VALIDATION,
+    MAX_REGEX_LENGTH,
+    MIN_MULTI_WORD_SUFFIX_LENGTH,
+    MIN_SINGLE_WORD_SUFFIX_LENGTH,
+)
+from .models import CacheStats, RegexResult
+from .regex_generator import generate_regex
+
+REGEX_CACHE_VERSION = 1
+
+
+def regex_fingerprint(
+    target_names: Iterable[str],
+    non_target_names: Iterable[str],
+    max_length: int = MAX_REGEX_LENGTH,
+    case_insensitive: bool = CASE_INSENSITIVE_MATCHING,
+    match_mode: str = DEFAULT_MATCH_MODE,
+    min_single_word_length: int = MIN_SINGLE_WORD_SUFFIX_LENGTH,
+    min_multi_word_length: int = MIN_MULTI_WORD_SUFFIX_LENGTH,
+    time_budget_ms: int = DEFAULT_TIME_BUDGET_MS,
+    allow_negation: bool = ALLOW_NEGATION,
+    validation: str = DEFAULT_VALIDATION,
+) -> str:
+    payload = {
+        "version": REGEX_CACHE_VERSION,
+        "targets": sorted({name for name in target_names if name}),
+        "non_targets": sorted({name for name in non_target_names if name}),
+        "max_length": max_length,
+        "case_insensitive": case_insensitive,
+        "match_mode": match_mode,
+        "min_single_word_length": min_single_word_length,
+        "min_multi_word_length": min_multi_word_length,
+        "time_budget_ms": time_budget_ms if match_mode == "optimal" else None,
+        "allow_negation": allow_negation,
+        "validation": validation,
+    }
+    encoded = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("ascii")).hexdigest()
+
+
+def _serialize_result(key: str, result: RegexResult) -> dict[str, Any]:
+    return {
+        "key": key,
+        "entries": list(result.entries),
+        "error": result.error,
+        "proven_optimal": result.proven_optimal,
+        "negated": result.negated,
+    }
+
+
+def _deserialize_result(data: dict[str, Any]) -> RegexResult:
+    error = data.get("error")
+    proven_optimal = data.get("proven_optimal")
+    return RegexResult(
+        entries=[str(value) for value in data.get("entries", [])],
+        error=str(error) if error is not None else None,
+        proven_optimal=bool(proven_optimal) if proven_optimal is not None else None,
+        negated=bool(data.get("negated", False)),
+    )
+
+
+class RegexCache:
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE, path: str | None = None) -> None:
+        self.max_entries = max(1, max_entries)
+        self.path = path
+        self.stats = CacheStats()
+        self._results: OrderedDict[str, RegexResult] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[RegexResult]:
+        result = self._results.get(key)
+        if result is None:
+            self.stats.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.stats.hits += 1
+        return result
+
+    def put(self, key: str, result: RegexResult) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+            self.stats.evictions += 1
+
+    def generate(self, target_names: Iterable[str], non_target_names: Iterable[str], **options: Any) -> RegexResult:
+        targets = list(target_names)
+        non_targets = list(non_target_names)
+        name_index = options.pop("name_index", None)
+        token = options.pop("token", None)
+        collect_stats = options.pop("collect_stats", False)
+        key = regex_fingerprint(targets, non_targets, **options)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = generate_regex(
+            targets,
+            non_targets,
+            name_index=name_index,
+            token=token,
+            collect_stats=collect_stats,
+            **options,
+        )
+        if token is not None and (token.cancelled or token.expired) and not result.ok:
+            return result
+        self.put(key, result)
+        if self.path:
+            self.save()
+        return result
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        storage_path = Path(self.path)
+        storage_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = [_serialize_result(key, result) for key, result in self._results.items()]
+
+        tmp_path = storage_path.with_suffix(storage_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=True), encoding="ascii")
+        tmp_path.replace(storage_path)
+
+    def load(self) -> list[str]:
+        if not self.path:
+            return []
+        storage_path = Path(self.path)
+        if not storage_path.exists():
+            return []
+
+        try:
+            payload = json.loads(storage_path.read_text(encoding="ascii"))
+        except (OSError, json.JSONDecodeError) as exc:
+            return [f"Failed to load regex cache: {exc}"]
+
+        if not isinstance(payload, list):
+            return ["Regex cache data is not a list."]
+
+        for item in payload:
+            if isinstance(item, dict) and isinstance(item.get("key"), str):
+                self.put(item["key"], _deserialize_result(item))
+        return []
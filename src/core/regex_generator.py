@@ -1,19 +1,56 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
-
-from .collision_checker import validate_regex
+import heapq
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .cancellation import CancellationToken, GenerationCancelled, check_token
+from .collision_checker import validate_regex, verify_certificate
 from .config import (
+    ALLOW_NEGATION,
     CASE_INSENSITIVE_MATCHING,
     DEFAULT_MATCH_MODE,
+    DEFAULT_TIME_BUDGET_MS,
+    DEFAULT_VALIDATION,
     MAX_REGEX_LENGTH,
     MIN_MULTI_WORD_SUFFIX_LENGTH,
     MIN_SINGLE_WORD_SUFFIX_LENGTH,
+    NEGATION_PREFIX,
+    VALIDATION_SAMPLE_SIZE,
 )
-from .models import RegexResult
+from .entry_matcher import END, START
+from .models import CertifiedPattern, CoverageCertificate, GenerationStats, RegexResult
+from .name_index import ComplementIndex, NameIndex
+from .packing import pack_items
+from .set_cover import iter_bits, optimize_cover
+from .suffix_automaton import SuffixAutomaton
+from .suffix_index import SuffixIndex
 
 REGEX_META = set(".^$*+?()[]{}|\\")
+CLASS_META = set("[]\\^-")
+VALIDATION_MODES = ("certified", "full", "sampled-full")
+
+Evidence = Callable[[str], bool]
+RenderedGroup = Tuple[str, List[str], dict[str, bool]]
+
+
+class RegexGenerationError(Exception):
+    pass
+
+
+@contextmanager
+def _phase(stats: Optional[GenerationStats], name: str) -> Iterator[None]:
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_phase(name, time.perf_counter() - started)
 
 
 def _escape_literal(text: str) -> str:
@@ -28,11 +65,6 @@ def _normalize(name: str, case_insensitive: bool) -> str:
     return name.lower() if case_insensitive else name
 
 
-def _iter_suffixes(text: str) -> Iterable[str]:
-    for index in range(len(text)):
-        yield text[index:]
-
-
 def _is_balanced_suffix(
     raw_suffix: str,
     min_single_word_length: int,
@@ -45,66 +77,391 @@ def _is_balanced_suffix(
     return len(raw_suffix) >= min_single_word_length
 
 
-def _build_suffix_set(names: Iterable[str]) -> set[str]:
-    suffixes: set[str] = set()
-    for name in names:
-        for suffix in _iter_suffixes(name):
-            suffixes.add(suffix)
-    return suffixes
+def _escape_class_char(char: str) -> str:
+    return f"\\{char}" if char in CLASS_META else char
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    ordered = sorted(chars)
+    if len(ordered) == 1:
+        return _escape_char(ordered[0])
+    return "[" + "".join(_escape_class_char(char) for char in ordered) + "]"
 
 
-def _has_suffix_relations(strings: List[str]) -> bool:
-    ordered = sorted(strings, key=len)
-    for index, short in enumerate(ordered):
-        for long_value in ordered[index + 1 :]:
-            if long_value.endswith(short):
-                return True
-    return False
+def _literal_tokens(escaped: str) -> List[str]:
+    tokens: List[str] = []
+    index = 0
+    while index < len(escaped):
+        step = 1
+        if escaped[index] == "\\":
+            step = 2
+        elif escaped[index] == "[":
+            while escaped[index + step] != "]":
+                step += 2 if escaped[index + step] == "\\" else 1
+            step += 1
+        tokens.append(escaped[index : index + step])
+        index += step
+    return tokens
 
 
-def _build_suffix_regex(strings: List[str]) -> str:
-    groups: dict[str, List[str]] = {}
+def _factor_prefixes(alternatives: List[Tuple[str, bool]]) -> List[Tuple[str, bool]]:
+    groups: dict[str, List[List[str]]] = {}
+    order: List[Tuple[str, Optional[str]]] = []
+    for text, literal in alternatives:
+        if not literal or not text:
+            order.append((text, None))
+            continue
+        tokens = _literal_tokens(text)
+        if tokens[0] not in groups:
+            groups[tokens[0]] = []
+            order.append((text, tokens[0]))
+        groups[tokens[0]].append(tokens)
+
+    factored: List[Tuple[str, bool]] = []
+    for text, first in order:
+        if first is None:
+            factored.append((text, False))
+            continue
+        members = groups[first]
+        shared = 0
+        while all(shared < len(tokens) - 1 for tokens in members) and len(
+            {tokens[shared] for tokens in members}
+        ) == 1:
+            shared += 1
+        if shared == 0:
+            factored.extend(("".join(tokens), True) for tokens in members)
+            continue
+
+        plain = "|".join("".join(tokens) for tokens in members)
+        rests = _factor_prefixes([("".join(tokens[shared:]), True) for tokens in members])
+        grouped = "".join(members[0][:shared]) + "(" + "|".join(rest for rest, _ in rests) + ")"
+        if len(grouped) < len(plain):
+            factored.append((grouped, False))
+        else:
+            factored.extend(("".join(tokens), True) for tokens in members)
+    return factored
+
+
+def _absorb_classes(
+    groups: dict[frozenset[str], Tuple[List[str], int]],
+    fragments: List[Tuple[str, bool]],
+    path: str,
+    is_safe: Callable[[str], bool],
+) -> List[str]:
+    absorbed: List[str] = []
+    languages = sorted(groups, key=len)
+    for position, language in enumerate(languages):
+        chars, child = groups[language]
+        for other in languages[position + 1 :]:
+            if other not in groups or not language < other:
+                continue
+            other_chars = groups[other][0]
+            removed = len(fragments[child][0]) + len(_char_class(chars)) + (3 if len(groups) == 2 else 1)
+            added = len(_char_class(other_chars + chars)) - len(_char_class(other_chars))
+            if removed <= added:
+                continue
+            extra = [(path + char + rest)[::-1] for char in chars for rest in other - language]
+            if all(is_safe(value) for value in extra):
+                other_chars.extend(chars)
+                del groups[language]
+                absorbed.extend(extra)
+                break
+    return absorbed
+
+
+def _build_suffix_regex(
+    strings: List[str],
+    is_safe: Optional[Callable[[str], bool]] = None,
+) -> Tuple[List[Tuple[str, bool]], List[str]]:
+    children: List[dict[str, int]] = [{}]
+    paths = [""]
     for value in strings:
         if not value:
             raise ValueError("Empty string is not supported for suffix compaction.")
-        groups.setdefault(value[-1], []).append(value[:-1])
+        node = 0
+        for char in reversed(value):
+            child = children[node].get(char)
+            if child is None:
+                child = len(children)
+                children.append({})
+                paths.append(paths[node] + char)
+                children[node][char] = child
+            node = child
+
+    languages: List[frozenset[str]] = [frozenset({""})] * len(children)
+    fragments: List[Tuple[str, bool]] = [("", True)] * len(children)
+    absorbed: List[str] = []
+    root_alternatives: List[Tuple[str, bool]] = []
+    for node in range(len(children) - 1, -1, -1):
+        if not children[node]:
+            continue
+        groups: dict[frozenset[str], Tuple[List[str], int]] = {}
+        for char, child in sorted(children[node].items()):
+            groups.setdefault(languages[child], ([], child))[0].append(char)
+        if is_safe is not None and len(groups) > 1:
+            absorbed.extend(_absorb_classes(groups, fragments, paths[node], is_safe))
+        languages[node] = frozenset(
+            char + rest for language, (chars, _) in groups.items() for char in chars for rest in language
+        )
 
-    parts: List[str] = []
-    for char in sorted(groups.keys()):
-        prefixes = groups[char]
-        if prefixes and all(value == "" for value in prefixes):
-            subpattern = ""
-        else:
-            subpattern = _build_suffix_regex(sorted(prefixes)) if prefixes else ""
-        if subpattern:
-            parts.append(subpattern + _escape_char(char))
+        alternatives = _factor_prefixes(
+            [
+                (fragments[child][0] + _char_class(chars), fragments[child][1])
+                for chars, child in sorted(groups.values(), key=lambda group: min(group[0]))
+            ]
+        )
+        if node == 0:
+            root_alternatives = alternatives
+        elif len(alternatives) == 1:
+            fragments[node] = alternatives[0]
         else:
-            parts.append(_escape_char(char))
-
-    if len(parts) == 1:
-        return parts[0]
-    return "(" + "|".join(parts) + ")"
+            fragments[node] = ("(" + "|".join(text for text, _ in alternatives) + ")", False)
+    return root_alternatives, absorbed
 
 
-def _compact_suffixes(raw_suffixes: List[str]) -> Optional[str]:
-    unique = sorted(set(raw_suffixes))
+def _drop_covered_suffixes(raw_suffixes: Iterable[str]) -> List[str]:
+    kept: List[str] = []
+    for reversed_value in sorted(value[::-1] for value in set(raw_suffixes)):
+        if kept and reversed_value.startswith(kept[-1]):
+            continue
+        kept.append(reversed_value)
+    return [value[::-1] for value in kept]
+
+
+def _compact_suffixes(
+    raw_suffixes: List[str],
+    is_safe: Optional[Callable[[str], bool]] = None,
+) -> Tuple[Optional[str], List[str]]:
+    if any(value == "" for value in raw_suffixes):
+        return None, []
+    unique = _drop_covered_suffixes(raw_suffixes)
+    if len(unique) == 1 and len(set(raw_suffixes)) > 1:
+        return f"{_escape_literal(unique[0])}$", []
     if len(unique) <= 1:
-        return None
-    if any(value == "" for value in unique):
-        return None
-    if _has_suffix_relations(unique):
-        return None
+        return None, []
 
-    regex_body = _build_suffix_regex(unique)
-    return f"({regex_body})$"
+    alternatives, absorbed = _build_suffix_regex(unique, is_safe)
+    if len(alternatives) == 1:
+        return f"{alternatives[0][0]}$", absorbed
+    return "(" + "|".join(text for text, _ in alternatives) + ")$", absorbed
 
 
 @dataclass
 class Candidate:
     key: str
     pattern: str
-    covers: set[int]
-    is_suffix: bool
+    mask: int
+    kind: str
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        self.covers = self.mask << self.offset
+
+    @property
+    def covers(self) -> int:
+        return self.mask << self.offset
+
+    @covers.setter
+    def covers(self, cover: int) -> None:
+        self.offset = (cover & -cover).bit_length() - 1 if cover else 0
+        self.mask = cover >> self.offset
+
+    @property
+    def gain(self) -> int:
+        return self.mask.bit_count()
+
+    def covered(self, uncovered: int) -> int:
+        return ((uncovered >> self.offset) & self.mask) << self.offset
+
+    def add(self, slot: int) -> None:
+        if not self.mask:
+            self.mask, self.offset = 1, slot
+        elif slot < self.offset:
+            self.mask, self.offset = (self.mask << (self.offset - slot)) | 1, slot
+        else:
+            self.mask |= 1 << (slot - self.offset)
+
+    def discard(self, slot: int) -> None:
+        if slot < self.offset:
+            return
+        mask = self.mask & ~(1 << (slot - self.offset))
+        shift = (mask & -mask).bit_length() - 1 if mask else 0
+        self.mask, self.offset = mask >> shift, self.offset + shift
+
+
+PATTERN_TEMPLATES = {
+    "suffix": "{}$",
+    "prefix": "^{}",
+    "substring": "{}",
+    "exact": "^{}$",
+}
+
+
+def _make_candidate(kind: str, raw: str, cover: int, offset: int = 0) -> Candidate:
+    return Candidate(
+        key=raw,
+        pattern=PATTERN_TEMPLATES[kind].format(_escape_literal(raw)),
+        mask=cover,
+        kind=kind,
+        offset=offset,
+    )
+
+
+def _suffix_candidate(raw_suffix: str, cover: int, offset: int = 0) -> Candidate:
+    return _make_candidate("suffix", raw_suffix, cover, offset)
+
+
+def _exact_candidate(raw: str, index: int) -> Candidate:
+    return _make_candidate("exact", raw, 1 << index)
+
+
+def _build_suffix_candidates(
+    targets_raw: List[str],
+    non_target_index: SuffixIndex | ComplementIndex,
+    case_insensitive: bool,
+    balanced: bool,
+    min_single_word_length: int,
+    min_multi_word_length: int,
+    token: Optional[CancellationToken] = None,
+) -> List[Candidate]:
+    candidate_map: dict[str, Tuple[int, int]] = {}
+    representative_raw: dict[str, str] = {}
+    needs_exact: List[int] = []
+
+    for index, raw in enumerate(targets_raw):
+        check_token(token)
+        normalized = _normalize(raw, case_insensitive)
+        shared = non_target_index.shared_suffix_length(normalized)
+        covered = False
+
+        for pos in range(len(raw) - shared):
+            suffix_raw = raw[pos:]
+            if balanced:
+                if not _is_balanced_suffix(suffix_raw, min_single_word_length, min_multi_word_length):
+                    continue
+            suffix_norm = normalized[pos:]
+            covered = True
+            offset, mask = candidate_map.get(suffix_norm, (index, 0))
+            candidate_map[suffix_norm] = (offset, mask | 1 << (index - offset))
+
+            existing = representative_raw.get(suffix_norm)
+            if existing is None or suffix_raw < existing:
+                representative_raw[suffix_norm] = suffix_raw
+        if not covered:
+            needs_exact.append(index)
+
+    candidates = [
+        _suffix_candidate(representative_raw[suffix_norm], mask, offset)
+        for suffix_norm, (offset, mask) in candidate_map.items()
+    ]
+    candidates.extend(_exact_candidate(targets_raw[index], index) for index in needs_exact)
+    return candidates
+
+
+def _build_substring_candidates(
+    targets_raw: List[str],
+    automaton: SuffixAutomaton,
+    suffix_index: SuffixIndex,
+    prefix_index: SuffixIndex,
+    case_insensitive: bool,
+    token: Optional[CancellationToken] = None,
+) -> List[Candidate]:
+    cover_map: dict[Tuple[str, str], int] = {}
+    representative_raw: dict[Tuple[str, str], str] = {}
+    covered_targets = 0
+
+    for index, raw in enumerate(targets_raw):
+        check_token(token)
+        normalized = _normalize(raw, case_insensitive)
+        bit = 1 << index
+        spans: List[Tuple[str, int, int]] = []
+
+        previous_start = -1
+        for end, matched in enumerate(automaton.matching_lengths(normalized)):
+            start = end - matched
+            if start >= 0 and start != previous_start:
+                spans.append(("substring", start, end + 1))
+            previous_start = start
+
+        shared = suffix_index.shared_suffix_length(normalized)
+        if shared < len(normalized):
+            spans.append(("suffix", len(normalized) - shared - 1, len(normalized)))
+
+        shared = prefix_index.shared_suffix_length(normalized[::-1])
+        if shared < len(normalized):
+            spans.append(("prefix", 0, shared + 1))
+
+        for kind, start, stop in spans:
+            key = (kind, normalized[start:stop])
+            cover_map[key] = cover_map.get(key, 0) | bit
+            covered_targets |= bit
+
+            existing = representative_raw.get(key)
+            if existing is None or raw[start:stop] < existing:
+                representative_raw[key] = raw[start:stop]
+
+    candidates = [
+        _make_candidate(kind, representative_raw[(kind, norm)], cover)
+        for (kind, norm), cover in cover_map.items()
+    ]
+    needs_exact = ((1 << len(targets_raw)) - 1) & ~covered_targets
+    candidates.extend(_exact_candidate(targets_raw[index], index) for index in iter_bits(needs_exact))
+    return candidates
+
+
+def _overlap_error(targets_norm: Iterable[str], non_targets_norm: set[str]) -> Optional[str]:
+    overlap = [name for name in targets_norm if name in non_targets_norm]
+    if not overlap:
+        return None
+    return (
+        "Target and non-target names overlap under case-insensitive matching: "
+        f"'{min(overlap)}'."
+    )
+
+
+def _iter_cover(
+    candidates: List[Candidate],
+    uncovered: int,
+    token: Optional[CancellationToken] = None,
+    stats: Optional[GenerationStats] = None,
+) -> Iterator[int]:
+    heap = [
+        (-candidate.gain, len(candidate.pattern), candidate.key, order)
+        for order, candidate in enumerate(candidates)
+        if candidate.covers
+    ]
+    heapq.heapify(heap)
+
+    while uncovered and heap:
+        check_token(token)
+        if stats is not None:
+            stats.cover_iterations += 1
+        negative_gain, pattern_length, key, order = heapq.heappop(heap)
+        candidate = candidates[order]
+        cover = candidate.covered(uncovered)
+        if not cover:
+            continue
+        gain = cover.bit_count()
+        if gain < -negative_gain:
+            heapq.heappush(heap, (-gain, pattern_length, key, order))
+            continue
+
+        yield order
+        uncovered &= ~cover
+
+
+def _select_cover(
+    candidates: List[Candidate],
+    uncovered: int,
+    token: Optional[CancellationToken] = None,
+    stats: Optional[GenerationStats] = None,
+) -> Optional[List[int]]:
+    selected = list(_iter_cover(candidates, uncovered, token, stats))
+    for order in selected:
+        uncovered &= ~candidates[order].covers
+    if uncovered:
+        return None
+    return selected
 
 
 def _pack_patterns(patterns: List[str], max_length: int) -> Tuple[Optional[List[str]], Optional[str]]:
@@ -112,61 +469,117 @@ def _pack_patterns(patterns: List[str], max_length: int) -> Tuple[Optional[List[
         return None, "Max length must be positive."
 
     ordered = sorted(patterns, key=lambda value: (len(value), value))
-    entries: List[str] = []
-    current = ""
-
     for pattern in ordered:
         if len(pattern) > max_length:
             return None, f"Single pattern exceeds max length: '{pattern}'."
 
-        if not current:
-            current = pattern
-            continue
-
-        if len(current) + 1 + len(pattern) <= max_length:
-            current = f"{current}|{pattern}"
-        else:
-            entries.append(current)
-            current = pattern
-
-    if current:
-        entries.append(current)
-
-    return entries, None
+    bins = pack_items([len(pattern) for pattern in ordered], max_length)
+    return ["|".join(ordered[index] for index in members) for members in bins], None
 
 
 def _pack_exact_names(names: List[str], max_length: int) -> Tuple[Optional[List[str]], Optional[str]]:
     ordered = sorted(names, key=lambda value: (len(value), value))
-    entries: List[str] = []
-    current = ""
-
     for name in ordered:
         single = f"^{name}$"
         if len(single) > max_length:
             return None, f"Single pattern exceeds max length: '{single}'."
 
-        if not current:
-            current = name
-            continue
-
-        candidate = f"{current}|{name}"
-        grouped = f"^(?:{candidate})$"
-        if len(grouped) <= max_length:
-            current = candidate
+    bins = pack_items(
+        [len(name) for name in ordered],
+        max_length,
+        overhead=len("^(?:)$"),
+        single_overhead=len("^$"),
+    )
+    entries: List[str] = []
+    for members in bins:
+        if len(members) == 1:
+            entries.append(f"^{ordered[members[0]]}$")
         else:
-            if "|" in current:
-                entries.append(f"^(?:{current})$")
+            entries.append("^(?:" + "|".join(ordered[index] for index in members) + ")$")
+    return entries, None
+
+
+def _suffix_evidence(index: SuffixIndex | ComplementIndex) -> Evidence:
+    return lambda literal: index.shared_suffix_length(literal) == len(literal)
+
+
+def _build_candidates(
+    targets_raw: List[str],
+    targets_norm: set[str],
+    non_targets_norm: set[str],
+    case_insensitive: bool,
+    match_mode: str,
+    min_single_word_length: int,
+    min_multi_word_length: int,
+    name_index: Optional[NameIndex],
+    token: Optional[CancellationToken],
+    stats: Optional[GenerationStats] = None,
+) -> Tuple[Optional[List[Candidate]], dict[str, Evidence]]:
+    evidence: dict[str, Evidence] = {"exact": non_targets_norm.__contains__}
+    if match_mode == "substring":
+        with _phase(stats, "index"):
+            automaton = SuffixAutomaton(non_targets_norm)
+            suffix_index = SuffixIndex(non_targets_norm)
+            prefix_index = SuffixIndex(name[::-1] for name in non_targets_norm)
+        evidence["substring"] = automaton.__contains__
+        evidence["suffix"] = _suffix_evidence(suffix_index)
+        evidence["prefix"] = lambda literal: prefix_index.shared_suffix_length(literal[::-1]) == len(literal)
+        with _phase(stats, "candidates"):
+            candidates = _build_substring_candidates(
+                targets_raw,
+                automaton,
+                suffix_index,
+                prefix_index,
+                case_insensitive,
+                token,
+            )
+    elif match_mode in {"compact", "balanced", "optimal"}:
+        with _phase(stats, "index"):
+            if name_index is not None and name_index.matches_selection(
+                targets_norm,
+                non_targets_norm,
+                case_insensitive,
+            ):
+                non_target_index = name_index.complement(targets_norm)
             else:
-                entries.append(f"^{current}$")
-            current = name
+                non_target_index = SuffixIndex(non_targets_norm)
+        evidence["suffix"] = _suffix_evidence(non_target_index)
+        with _phase(stats, "candidates"):
+            candidates = _build_suffix_candidates(
+                targets_raw,
+                non_target_index,
+                case_insensitive,
+                match_mode != "compact",
+                min_single_word_length,
+                min_multi_word_length,
+                token,
+            )
+    else:
+        return None, evidence
 
-    if current:
-        if "|" in current:
-            entries.append(f"^(?:{current})$")
-        else:
-            entries.append(f"^{current}$")
+    if stats is not None:
+        stats.candidate_count += len(candidates)
+        stats.suffix_count += sum(1 for candidate in candidates if candidate.kind != "exact")
+    return candidates, evidence
 
-    return entries, None
+
+def _prepare_names(
+    target_names: Iterable[str],
+    non_target_names: Iterable[str],
+    case_insensitive: bool,
+) -> Tuple[List[str], List[str], set[str], set[str], Optional[str]]:
+    targets_raw = sorted(
+        {name for name in target_names if name},
+        key=lambda name: (_normalize(name, case_insensitive)[::-1], name),
+    )
+    non_targets_raw = sorted({name for name in non_target_names if name})
+    targets_norm = {_normalize(name, case_insensitive) for name in targets_raw}
+    non_targets_norm = {_normalize(name, case_insensitive) for name in non_targets_raw}
+
+    if not targets_raw:
+        return targets_raw, non_targets_raw, targets_norm, non_targets_norm, "No targets provided."
+    error = _overlap_error(targets_norm, non_targets_norm)
+    return targets_raw, non_targets_raw, targets_norm, non_targets_norm, error
 
 
 def generate_regex(
@@ -177,161 +590,769 @@ def generate_regex(
     match_mode: str = DEFAULT_MATCH_MODE,
     min_single_word_length: int = MIN_SINGLE_WORD_SUFFIX_LENGTH,
     min_multi_word_length: int = MIN_MULTI_WORD_SUFFIX_LENGTH,
+    time_budget_ms: int = DEFAULT_TIME_BUDGET_MS,
+    name_index: Optional[NameIndex] = None,
+    token: Optional[CancellationToken] = None,
+    validation: str = DEFAULT_VALIDATION,
+    allow_negation: bool = ALLOW_NEGATION,
+    collect_stats: bool = False,
 ) -> RegexResult:
-    targets_raw = sorted({name for name in target_names if name})
-    non_targets_raw = sorted({name for name in non_target_names if name})
+    if validation not in VALIDATION_MODES:
+        return RegexResult(entries=[], error=f"Unsupported validation mode: {validation}")
+    targets = list(target_names)
+    non_targets = list(non_target_names)
+    stats = GenerationStats() if collect_stats else None
+    deadline = time.perf_counter() + max(0, time_budget_ms) / 1000
+
+    def generate(positive: List[str], negative: List[str], length: int) -> RegexResult:
+        return _generate_regex(
+            positive,
+            negative,
+            length,
+            case_insensitive,
+            match_mode,
+            min_single_word_length,
+            min_multi_word_length,
+            max(0, int((deadline - time.perf_counter()) * 1000)),
+            name_index,
+            token,
+            validation,
+            stats,
+        )
 
-    if not targets_raw:
-        return RegexResult(entries=[], error="No targets provided.")
+    try:
+        result = generate(targets, non_targets, max_length)
+        if allow_negation and _should_try_negation(targets, non_targets):
+            result = _pick_formulation(result, generate(non_targets, targets, max_length - len(NEGATION_PREFIX)))
+    except GenerationCancelled as exc:
+        result = RegexResult(entries=[], error=str(exc))
+    return replace(result, stats=stats) if stats is not None else result
 
-    targets_norm = {_normalize(name, case_insensitive) for name in targets_raw}
-    non_targets_norm = {_normalize(name, case_insensitive) for name in non_targets_raw}
 
-    overlap = targets_norm & non_targets_norm
-    if overlap:
-        example = sorted(overlap)[0]
-        return RegexResult(
-            entries=[],
-            error=(
-                "Target and non-target names overlap under case-insensitive matching: "
-                f"'{example}'."
-            ),
-        )
+def _should_try_negation(targets: Iterable[str], non_targets: Iterable[str]) -> bool:
+    non_target_count = len({name for name in non_targets if name})
+    return 0 < non_target_count <= len({name for name in targets if name})
+
+
+def _formulation_cost(result: RegexResult, negated: bool) -> Tuple[int, int]:
+    prefix = len(NEGATION_PREFIX) if negated else 0
+    return len(result.entries), sum(len(entry) + prefix for entry in result.entries)
+
+
+def _pick_formulation(positive: RegexResult, negated: RegexResult) -> RegexResult:
+    if not negated.ok or len(negated.entries) != 1:
+        return positive
+    if positive.ok and _formulation_cost(positive, False) <= _formulation_cost(negated, True):
+        return positive
+    return replace(negated, negated=True)
+
+
+def _generate_regex(
+    target_names: Iterable[str],
+    non_target_names: Iterable[str],
+    max_length: int,
+    case_insensitive: bool,
+    match_mode: str,
+    min_single_word_length: int,
+    min_multi_word_length: int,
+    time_budget_ms: int,
+    name_index: Optional[NameIndex],
+    token: Optional[CancellationToken],
+    validation: str,
+    stats: Optional[GenerationStats] = None,
+) -> RegexResult:
+    targets_raw, non_targets_raw, targets_norm, non_targets_norm, error = _prepare_names(
+        target_names,
+        non_target_names,
+        case_insensitive,
+    )
+    if error:
+        return RegexResult(entries=[], error=error)
 
     if match_mode == "exact":
         escaped = [_escape_literal(name) for name in targets_raw]
-        entries, error = _pack_exact_names(escaped, max_length)
+        with _phase(stats, "packing"):
+            entries, error = _pack_exact_names(escaped, max_length)
         if error:
             return RegexResult(entries=[], error=error)
 
-        ok, validation_error = validate_regex(entries, targets_raw, non_targets_raw, case_insensitive)
+        certificate = _build_certificate(
+            [_exact_candidate(name, index) for index, name in enumerate(targets_raw)],
+            targets_raw,
+            case_insensitive,
+        )
+        ok, validation_error = _validate_entries(
+            entries,
+            targets_raw,
+            non_targets_raw,
+            case_insensitive,
+            validation,
+            certificate,
+            {"exact": non_targets_norm.__contains__},
+            token,
+            stats,
+        )
         if not ok:
             return RegexResult(entries=[], error=validation_error)
 
-        return RegexResult(entries=entries, error=None)
-
-    if match_mode not in {"compact", "balanced"}:
+        return RegexResult(entries=entries, error=None, certificate=certificate)
+
+    candidates, evidence = _build_candidates(
+        targets_raw,
+        targets_norm,
+        non_targets_norm,
+        case_insensitive,
+        match_mode,
+        min_single_word_length,
+        min_multi_word_length,
+        name_index,
+        token,
+        stats,
+    )
+    if candidates is None:
         return RegexResult(entries=[], error=f"Unsupported match mode: {match_mode}")
 
-    non_target_suffixes = _build_suffix_set(non_targets_norm)
-
-    candidate_map: dict[str, set[int]] = {}
-    representative_raw: dict[str, str] = {}
-    needs_exact: set[int] = set()
+    return _finish_generation(
+        candidates,
+        (1 << len(targets_raw)) - 1,
+        targets_raw,
+        non_targets_raw,
+        max_length,
+        case_insensitive,
+        time_budget_ms if match_mode == "optimal" else None,
+        token,
+        validation,
+        evidence,
+        stats=stats,
+    )
+
+
+def iter_regex_entries(
+    target_names: Iterable[str],
+    non_target_names: Iterable[str],
+    max_length: int = MAX_REGEX_LENGTH,
+    case_insensitive: bool = CASE_INSENSITIVE_MATCHING,
+    match_mode: str = DEFAULT_MATCH_MODE,
+    min_single_word_length: int = MIN_SINGLE_WORD_SUFFIX_LENGTH,
+    min_multi_word_length: int = MIN_MULTI_WORD_SUFFIX_LENGTH,
+    time_budget_ms: int = DEFAULT_TIME_BUDGET_MS,
+    name_index: Optional[NameIndex] = None,
+    token: Optional[CancellationToken] = None,
+) -> Iterator[str]:
+    targets_raw, non_targets_raw, targets_norm, non_targets_norm, error = _prepare_names(
+        target_names,
+        non_target_names,
+        case_insensitive,
+    )
+    if error:
+        raise RegexGenerationError(error)
+    if max_length <= 0:
+        raise RegexGenerationError("Max length must be positive.")
 
-    for index, raw in enumerate(targets_raw):
-        normalized = _normalize(raw, case_insensitive)
-        if normalized in non_target_suffixes:
-            needs_exact.add(index)
+    def checked(entry: str) -> str:
+        ok, validation_error = validate_regex([entry], [], non_targets_raw, case_insensitive, token)
+        if not ok:
+            raise RegexGenerationError(validation_error)
+        return entry
 
-        positions = list(range(len(raw)))
-        for pos in positions:
-            suffix_raw = raw[pos:]
-            if match_mode == "balanced":
-                if not _is_balanced_suffix(suffix_raw, min_single_word_length, min_multi_word_length):
-                    continue
-            suffix_norm = normalized[pos:]
-            if suffix_norm in non_target_suffixes:
-                continue
-            candidate_map.setdefault(suffix_norm, set()).add(index)
+    if match_mode == "exact":
+        entries, error = _pack_exact_names([_escape_literal(name) for name in targets_raw], max_length)
+        if error:
+            raise RegexGenerationError(error)
+        for entry in entries:
+            yield checked(entry)
+        return
+
+    candidates, _ = _build_candidates(
+        targets_raw,
+        targets_norm,
+        non_targets_norm,
+        case_insensitive,
+        match_mode,
+        min_single_word_length,
+        min_multi_word_length,
+        name_index,
+        token,
+    )
+    if candidates is None:
+        raise RegexGenerationError(f"Unsupported match mode: {match_mode}")
+
+    uncovered = (1 << len(targets_raw)) - 1
+    if match_mode == "optimal":
+        chosen = _select_cover(candidates, uncovered, token)
+        if chosen is not None:
+            chosen, _ = optimize_cover(
+                [candidate.covers for candidate in candidates],
+                [len(candidate.pattern) + 1 for candidate in candidates],
+                uncovered,
+                chosen,
+                time_budget_ms,
+                token,
+            )
+        orders: Iterable[int] = chosen or []
+    else:
+        orders = _iter_cover(candidates, uncovered, token)
 
-            existing = representative_raw.get(suffix_norm)
-            if existing is None or suffix_raw < existing:
-                representative_raw[suffix_norm] = suffix_raw
+    current = ""
+    for order in orders:
+        candidate = candidates[order]
+        uncovered &= ~candidate.covers
+        if len(candidate.pattern) > max_length:
+            raise RegexGenerationError(f"Single pattern exceeds max length: '{candidate.pattern}'.")
+        if current and len(current) + 1 + len(candidate.pattern) <= max_length:
+            current += "|" + candidate.pattern
+            continue
+        if current:
+            yield checked(current)
+        current = candidate.pattern
 
-    if candidate_map:
-        covered_targets = set().union(*candidate_map.values())
-    else:
-        covered_targets = set()
-
-    for index in range(len(targets_raw)):
-        if index not in covered_targets:
-            needs_exact.add(index)
-
-    candidates: List[Candidate] = []
-    for suffix_norm, cover in candidate_map.items():
-        raw_suffix = representative_raw[suffix_norm]
-        pattern = f"{_escape_literal(raw_suffix)}$"
-        candidates.append(
-            Candidate(
-                key=raw_suffix,
-                pattern=pattern,
-                covers=cover,
-                is_suffix=True,
-            )
+    if current:
+        yield checked(current)
+    if uncovered:
+        raise RegexGenerationError("Unable to cover all targets with collision-safe patterns.")
+
+
+def _finish_generation(
+    candidates: List[Candidate],
+    uncovered: int,
+    targets_raw: List[str],
+    non_targets_raw: List[str],
+    max_length: int,
+    case_insensitive: bool,
+    time_budget_ms: Optional[int] = None,
+    token: Optional[CancellationToken] = None,
+    validation: str = "full",
+    evidence: Optional[Mapping[str, Evidence]] = None,
+    slot_names: Optional[Mapping[int, str]] = None,
+    stats: Optional[GenerationStats] = None,
+) -> RegexResult:
+    with _phase(stats, "cover"):
+        chosen = _select_cover(candidates, uncovered, token, stats)
+    if chosen is None:
+        return RegexResult(
+            entries=[],
+            error="Unable to cover all targets with collision-safe patterns.",
         )
 
-    for index in needs_exact:
-        raw = targets_raw[index]
-        pattern = f"^{_escape_literal(raw)}$"
-        candidates.append(
-            Candidate(
-                key=raw,
-                pattern=pattern,
-                covers={index},
-                is_suffix=False,
+    proven_optimal: Optional[bool] = None
+    if time_budget_ms is not None:
+        with _phase(stats, "optimize"):
+            chosen, proven_optimal = optimize_cover(
+                [candidate.covers for candidate in candidates],
+                [len(candidate.pattern) + 1 for candidate in candidates],
+                uncovered,
+                chosen,
+                time_budget_ms,
+                token,
             )
-        )
+    selected = _drop_covered_candidates([candidates[index] for index in chosen], uncovered)
 
-    uncovered = set(range(len(targets_raw)))
-    selected: List[Candidate] = []
+    is_safe = _suffix_safety(evidence, case_insensitive)
+    entries, absorbed, error = _render_entries(selected, max_length, is_safe, stats)
+    if error:
+        return RegexResult(entries=[], error=error)
 
-    while uncovered:
-        best: Optional[Candidate] = None
-        best_cover: set[int] = set()
+    certificate = _build_certificate(
+        selected,
+        slot_names if slot_names is not None else targets_raw,
+        case_insensitive,
+        absorbed,
+    )
+    ok, validation_error = _validate_entries(
+        entries,
+        targets_raw,
+        non_targets_raw,
+        case_insensitive,
+        validation,
+        certificate,
+        evidence or {},
+        token,
+        stats,
+    )
+    if not ok:
+        return RegexResult(entries=[], error=validation_error)
 
-        for candidate in candidates:
-            cover = candidate.covers & uncovered
-            if not cover:
-                continue
-            if best is None:
-                best = candidate
-                best_cover = cover
-                continue
+    return RegexResult(entries=entries, error=None, proven_optimal=proven_optimal, certificate=certificate)
+
+
+def _render_group(
+    group: List[Candidate],
+    is_safe: Optional[Callable[[str], bool]],
+) -> RenderedGroup:
+    plain = "|".join(candidate.pattern for candidate in group)
+    suffixes = [candidate.key for candidate in group if candidate.kind == "suffix"]
+    checked: dict[str, bool] = {}
+    if len(suffixes) < 2:
+        return plain, [], checked
+
+    def traced(raw_suffix: str) -> bool:
+        if raw_suffix not in checked:
+            checked[raw_suffix] = is_safe(raw_suffix)
+        return checked[raw_suffix]
+
+    compacted, absorbed = _compact_suffixes(suffixes, traced if is_safe is not None else None)
+    if not compacted:
+        return plain, [], checked
+    others = [candidate.pattern for candidate in group if candidate.kind != "suffix"]
+    entry = "|".join(sorted([compacted, *others], key=lambda value: (len(value), value)))
+    if len(entry) >= len(plain):
+        return plain, [], checked
+    return entry, absorbed, checked
+
+
+def _render_entries(
+    selected: List[Candidate],
+    max_length: int,
+    is_safe: Optional[Callable[[str], bool]],
+    stats: Optional[GenerationStats] = None,
+    rendered: Optional[dict[Tuple[str, ...], RenderedGroup]] = None,
+) -> Tuple[List[str], List[str], Optional[str]]:
+    if not selected:
+        return [], [], "No patterns could be generated."
+    if max_length <= 0:
+        return [], [], "Max length must be positive."
+    ordered = sorted(selected, key=lambda candidate: (len(candidate.pattern), candidate.pattern))
+    for candidate in ordered:
+        if len(candidate.pattern) > max_length:
+            return [], [], f"Single pattern exceeds max length: '{candidate.pattern}'."
+
+    with _phase(stats, "packing"):
+        bins = pack_items([len(candidate.pattern) for candidate in ordered], max_length)
+
+    previous = dict(rendered) if rendered is not None else {}
+    if rendered is not None:
+        rendered.clear()
+
+    def render(group: List[Candidate]) -> RenderedGroup:
+        key = tuple(candidate.pattern for candidate in group)
+        cached = previous.get(key)
+        if cached is None or any(is_safe(raw_suffix) != safe for raw_suffix, safe in cached[2].items()):
+            cached = _render_group(group, is_safe)
+        if rendered is not None:
+            rendered[key] = cached
+        return cached
+
+    merged: List[Tuple[List[Candidate], RenderedGroup]] = []
+    with _phase(stats, "compaction"):
+        for members in bins:
+            group = [ordered[index] for index in members]
+            current = render(group)
+            if merged:
+                last_group, last = merged[-1]
+                combined = len(last[0]) + len(current[0]) + 1
+                saved = _plain_length(last_group) + _plain_length(group) + 1 - combined
+                if combined - max_length < saved:
+                    union = render(last_group + group)
+                    if len(union[0]) <= max_length and len(union[0]) < combined:
+                        merged[-1] = (last_group + group, union)
+                        continue
+            merged.append((group, current))
+
+    with _phase(stats, "packing"):
+        entries, error = _pack_patterns([text for _, (text, _, _) in merged], max_length)
+    if error or not entries:
+        return [], [], error
+    plain = ["|".join(ordered[index].pattern for index in members) for members in bins]
+    if _total_length(plain) <= _total_length(entries):
+        return plain, [], None
+    return entries, [raw for _, (_, extra, _) in merged for raw in extra], None
+
+
+def _plain_length(group: List[Candidate]) -> int:
+    return sum(len(candidate.pattern) for candidate in group) + len(group) - 1
+
+
+def _total_length(entries: List[str]) -> Tuple[int, int]:
+    return sum(len(entry) for entry in entries), len(entries)
+
+
+def _drop_covered_candidates(selected: List[Candidate], uncovered: int) -> List[Candidate]:
+    kept_keys = set(_drop_covered_suffixes(candidate.key for candidate in selected if candidate.kind == "suffix"))
+    kept = [candidate for candidate in selected if candidate.kind != "suffix" or candidate.key in kept_keys]
+    covered = 0
+    for candidate in kept:
+        covered |= candidate.covers
+    return kept if uncovered & ~covered == 0 else selected
+
+
+def _suffix_safety(
+    evidence: Optional[Mapping[str, Evidence]],
+    case_insensitive: bool,
+) -> Optional[Callable[[str], bool]]:
+    if not evidence or "suffix" not in evidence:
+        return None
+    suffix_evidence = evidence["suffix"]
+    return lambda raw_suffix: not suffix_evidence(_normalize(raw_suffix, case_insensitive))
+
+
+def _build_certificate(
+    selected: List[Candidate],
+    slot_names: Mapping[int, str] | Sequence[str],
+    case_insensitive: bool,
+    absorbed: Sequence[str] = (),
+) -> Optional[CoverageCertificate]:
+    patterns: List[CertifiedPattern] = []
+    assignments: dict[str, int] = {}
+    for position, candidate in enumerate(selected):
+        literal = _normalize(candidate.key, case_insensitive)
+        if START in literal or END in literal:
+            return None
+        patterns.append(CertifiedPattern(kind=candidate.kind, literal=literal))
+        for slot in iter_bits(candidate.covers):
+            assignments.setdefault(slot_names[slot], position)
+    for raw_suffix in absorbed:
+        literal = _normalize(raw_suffix, case_insensitive)
+        if START in literal or END in literal:
+            return None
+        patterns.append(CertifiedPattern(kind="suffix", literal=literal))
+    return CoverageCertificate(case_insensitive=case_insensitive, patterns=patterns, assignments=assignments)
+
+
+def _sample(names: List[str], size: int) -> List[str]:
+    if len(names) <= size:
+        return names
+    return random.Random(len(names)).sample(names, size)
+
+
+def _certifiable(targets_raw: List[str], non_targets_raw: List[str], case_insensitive: bool) -> bool:
+    if not case_insensitive:
+        return True
+    return all(name.isascii() for name in targets_raw) and all(name.isascii() for name in non_targets_raw)
+
+
+def _validate_entries(
+    entries: List[str],
+    targets_raw: List[str],
+    non_targets_raw: List[str],
+    case_insensitive: bool,
+    validation: str,
+    certificate: Optional[CoverageCertificate],
+    evidence: Mapping[str, Evidence],
+    token: Optional[CancellationToken],
+    stats: Optional[GenerationStats] = None,
+) -> Tuple[bool, Optional[str]]:
+    with _phase(stats, "validation"):
+        certifiable = certificate is not None and _certifiable(targets_raw, non_targets_raw, case_insensitive)
+        if validation == "full" or not certifiable:
+            return validate_regex(entries, targets_raw, non_targets_raw, case_insensitive, token, stats)
+
+        ok, error = verify_certificate(entries, certificate, targets_raw, evidence)
+        if not ok or validation == "certified":
+            return ok, error
+        return validate_regex(
+            entries,
+            _sample(targets_raw, VALIDATION_SAMPLE_SIZE),
+            _sample(non_targets_raw, VALIDATION_SAMPLE_SIZE),
+            case_insensitive,
+            token,
+            stats,
+        )
 
-            if len(cover) > len(best_cover):
-                best = candidate
-                best_cover = cover
-                continue
-            if len(cover) == len(best_cover):
-                if len(candidate.pattern) < len(best.pattern):
-                    best = candidate
-                    best_cover = cover
-                    continue
-                if len(candidate.pattern) == len(best.pattern) and candidate.key < best.key:
-                    best = candidate
-                    best_cover = cover
-
-        if best is None:
-            return RegexResult(
-                entries=[],
-                error="Unable to cover all targets with collision-safe patterns.",
-            )
 
-        selected.append(best)
-        uncovered -= best_cover
+class RegexSession:
+    def __init__(
+        self,
+        max_length: int = MAX_REGEX_LENGTH,
+        case_insensitive: bool = CASE_INSENSITIVE_MATCHING,
+        match_mode: str = DEFAULT_MATCH_MODE,
+        min_single_word_length: int = MIN_SINGLE_WORD_SUFFIX_LENGTH,
+        min_multi_word_length: int = MIN_MULTI_WORD_SUFFIX_LENGTH,
+        name_index: Optional[NameIndex] = None,
+        validation: str = DEFAULT_VALIDATION,
+        allow_negation: bool = ALLOW_NEGATION,
+    ) -> None:
+        self.max_length = max_length
+        self.case_insensitive = case_insensitive
+        self.match_mode = match_mode
+        self.min_single_word_length = min_single_word_length
+        self.min_multi_word_length = min_multi_word_length
+        self.name_index = name_index
+        self.validation = validation
+        self.allow_negation = allow_negation
+
+        self._target_slots: dict[str, int] = {}
+        self._slot_raw: dict[int, str] = {}
+        self._free_slots: List[int] = []
+        self._shared: dict[int, int] = {}
+        self._candidate_counts: dict[int, int] = {}
+        self._slots_by_norm: dict[str, set[int]] = {}
+        self._target_index = SuffixIndex([])
+
+        self._non_targets: set[str] = set()
+        self._non_target_counts: dict[str, int] = {}
+        self._non_target_index = SuffixIndex([])
+
+        self._candidates: dict[str, Candidate] = {}
+        self._exact_candidates: dict[int, Candidate] = {}
+        self._rendered: dict[Tuple[str, ...], RenderedGroup] = {}
+        self._complement: Optional[RegexSession] = None
+
+    @property
+    def targets(self) -> List[str]:
+        return sorted(self._target_slots)
+
+    @property
+    def non_targets(self) -> List[str]:
+        return sorted(self._non_targets)
+
+    def update(self, target_names: Iterable[str], non_target_names: Iterable[str]) -> None:
+        targets = {name for name in target_names if name}
+        non_targets = {name for name in non_target_names if name}
+        self.apply(
+            added_targets=targets - self._target_slots.keys(),
+            removed_targets=self._target_slots.keys() - targets,
+            added_non_targets=non_targets - self._non_targets,
+            removed_non_targets=self._non_targets - non_targets,
+        )
 
-    suffix_candidates = [candidate for candidate in selected if candidate.is_suffix]
-    exact_patterns = [candidate.pattern for candidate in selected if not candidate.is_suffix]
+    def apply(
+        self,
+        added_targets: Iterable[str] = (),
+        removed_targets: Iterable[str] = (),
+        added_non_targets: Iterable[str] = (),
+        removed_non_targets: Iterable[str] = (),
+    ) -> None:
+        added_targets, removed_targets = set(added_targets), set(removed_targets)
+        added_non_targets, removed_non_targets = set(added_non_targets), set(removed_non_targets)
+        for name in sorted(removed_targets):
+            self._remove_target(name)
+        for name in sorted(removed_non_targets):
+            self._remove_non_target(name)
+        for name in sorted(added_non_targets):
+            self._add_non_target(name)
+        for name in sorted(added_targets, key=lambda name: (_normalize(name, self.case_insensitive)[::-1], name)):
+            self._add_target(name)
+        if self._complement is not None:
+            self._complement.apply(
+                added_targets=added_non_targets,
+                removed_targets=removed_non_targets,
+                added_non_targets=added_targets,
+                removed_non_targets=removed_targets,
+            )
 
-    suffix_patterns = [candidate.pattern for candidate in suffix_candidates]
-    if len(suffix_candidates) > 1:
-        compacted = _compact_suffixes([candidate.key for candidate in suffix_candidates])
-        if compacted:
-            combined_length = sum(len(pattern) for pattern in suffix_patterns) + (len(suffix_patterns) - 1)
-            if len(compacted) < combined_length and len(compacted) <= max_length:
-                suffix_patterns = [compacted]
+    def result(self, token: Optional[CancellationToken] = None) -> RegexResult:
+        if self.match_mode not in {"compact", "balanced"}:
+            return generate_regex(
+                self.targets,
+                self.non_targets,
+                max_length=self.max_length,
+                case_insensitive=self.case_insensitive,
+                match_mode=self.match_mode,
+                min_single_word_length=self.min_single_word_length,
+                min_multi_word_length=self.min_multi_word_length,
+                name_index=self.name_index,
+                token=token,
+                validation=self.validation,
+                allow_negation=self.allow_negation,
+            )
 
-    all_patterns = suffix_patterns + exact_patterns
-    if not all_patterns:
-        return RegexResult(entries=[], error="No patterns could be generated.")
+        if self.validation not in VALIDATION_MODES:
+            return RegexResult(entries=[], error=f"Unsupported validation mode: {self.validation}")
+        positive = self._positive_result(token)
+        if not self.allow_negation or not _should_try_negation(self._target_slots, self._non_targets):
+            return positive
+
+        if self._complement is None:
+            self._complement = RegexSession(
+                max_length=self.max_length - len(NEGATION_PREFIX),
+                case_insensitive=self.case_insensitive,
+                match_mode=self.match_mode,
+                min_single_word_length=self.min_single_word_length,
+                min_multi_word_length=self.min_multi_word_length,
+                name_index=self.name_index,
+                validation=self.validation,
+                allow_negation=False,
+            )
+            self._complement.update(self._non_targets, self._target_slots)
+        return _pick_formulation(positive, self._complement.result(token))
+
+    def _positive_result(self, token: Optional[CancellationToken]) -> RegexResult:
+        if not self._target_slots:
+            return RegexResult(entries=[], error="No targets provided.")
+
+        overlap_error = _overlap_error(self._slots_by_norm, self._non_target_counts)
+        if overlap_error:
+            return RegexResult(entries=[], error=overlap_error)
+
+        evidence = {
+            "suffix": _suffix_evidence(self._non_target_index),
+            "exact": self._non_target_counts.__contains__,
+        }
+        try:
+            selected = self._choose_cover(token)
+            if selected is None:
+                return RegexResult(entries=[], error="Unable to cover all targets with collision-safe patterns.")
+            return self._render(selected, evidence, token)
+        except GenerationCancelled as exc:
+            return RegexResult(entries=[], error=str(exc))
+
+    def _choose_cover(self, token: Optional[CancellationToken]) -> Optional[List[Candidate]]:
+        uncovered = 0
+        candidates = list(self._candidates.values())
+        for slot, count in self._candidate_counts.items():
+            uncovered |= 1 << slot
+            if count:
+                continue
+            if slot not in self._exact_candidates:
+                self._exact_candidates[slot] = _exact_candidate(self._slot_raw[slot], slot)
+            candidates.append(self._exact_candidates[slot])
+
+        chosen = _select_cover(candidates, uncovered, token)
+        if chosen is None:
+            return None
+        return _drop_covered_candidates([candidates[order] for order in chosen], uncovered)
+
+    def _render(
+        self,
+        selected: List[Candidate],
+        evidence: Mapping[str, Evidence],
+        token: Optional[CancellationToken],
+    ) -> RegexResult:
+        check_token(token)
+        entries, absorbed, error = _render_entries(
+            selected,
+            self.max_length,
+            _suffix_safety(evidence, self.case_insensitive),
+            rendered=self._rendered,
+        )
+        if error:
+            return RegexResult(entries=[], error=error)
 
-    entries, error = _pack_patterns(all_patterns, max_length)
-    if error:
-        return RegexResult(entries=[], error=error)
+        certificate = _build_certificate(selected, self._slot_raw, self.case_insensitive, absorbed)
+        ok, validation_error = _validate_entries(
+            entries,
+            self.targets,
+            self.non_targets,
+            self.case_insensitive,
+            self.validation,
+            certificate,
+            evidence,
+            token,
+        )
+        if not ok:
+            return RegexResult(entries=[], error=validation_error)
+        return RegexResult(entries=entries, error=None, certificate=certificate)
+
+    def _add_target(self, raw: str) -> None:
+        if not raw or raw in self._target_slots:
+            return
+        slot = self._free_slots.pop() if self._free_slots else len(self._slot_raw)
+        normalized = _normalize(raw, self.case_insensitive)
+
+        self._target_slots[raw] = slot
+        self._slot_raw[slot] = raw
+        self._candidate_counts[slot] = 0
+        self._slots_by_norm.setdefault(normalized, set()).add(slot)
+        self._target_index.add(normalized)
+
+        shared = self._non_target_index.shared_suffix_length(normalized)
+        self._shared[slot] = shared
+        self._add_positions(slot, 0, len(raw) - shared)
+
+    def _remove_target(self, raw: str) -> None:
+        slot = self._target_slots.pop(raw, None)
+        if slot is None:
+            return
+        self._remove_positions(slot, 0, len(raw) - self._shared.pop(slot))
+
+        normalized = _normalize(raw, self.case_insensitive)
+        slots = self._slots_by_norm[normalized]
+        slots.discard(slot)
+        if not slots:
+            del self._slots_by_norm[normalized]
+            self._target_index.discard(normalized)
+
+        del self._slot_raw[slot]
+        del self._candidate_counts[slot]
+        self._exact_candidates.pop(slot, None)
+        self._free_slots.append(slot)
+
+    def _add_non_target(self, raw: str) -> None:
+        if not raw or raw in self._non_targets:
+            return
+        self._non_targets.add(raw)
+        normalized = _normalize(raw, self.case_insensitive)
+        count = self._non_target_counts.get(normalized, 0)
+        self._non_target_counts[normalized] = count + 1
+        if count:
+            return
+
+        unaffected = self._non_target_index.shared_suffix_length(normalized)
+        self._non_target_index.add(normalized)
+        if unaffected < len(normalized):
+            self._refresh_shared(normalized[len(normalized) - unaffected - 1 :])
+
+    def _remove_non_target(self, raw: str) -> None:
+        if raw not in self._non_targets:
+            return
+        self._non_targets.discard(raw)
+        normalized = _normalize(raw, self.case_insensitive)
+        count = self._non_target_counts[normalized] - 1
+        if count:
+            self._non_target_counts[normalized] = count
+            return
+        del self._non_target_counts[normalized]
+
+        self._non_target_index.discard(normalized)
+        unaffected = self._non_target_index.shared_suffix_length(normalized)
+        if unaffected < len(normalized):
+            self._refresh_shared(normalized[len(normalized) - unaffected - 1 :])
+
+    def _refresh_shared(self, suffix_norm: str) -> None:
+        for normalized in self._target_index.names_with_suffix(suffix_norm):
+            shared = self._non_target_index.shared_suffix_length(normalized)
+            for slot in self._slots_by_norm[normalized]:
+                previous = self._shared[slot]
+                if shared == previous:
+                    continue
+                self._shared[slot] = shared
+                length = len(normalized)
+                if shared > previous:
+                    self._remove_positions(slot, length - shared, length - previous)
+                else:
+                    self._add_positions(slot, length - previous, length - shared)
+
+    def _iter_positions(self, raw: str, start: int, stop: int) -> Iterable[int]:
+        for pos in range(start, stop):
+            if self.match_mode == "balanced" and not _is_balanced_suffix(
+                raw[pos:],
+                self.min_single_word_length,
+                self.min_multi_word_length,
+            ):
+                continue
+            yield pos
 
-    ok, validation_error = validate_regex(entries, targets_raw, non_targets_raw, case_insensitive)
-    if not ok:
-        return RegexResult(entries=[], error=validation_error)
+    def _add_positions(self, slot: int, start: int, stop: int) -> None:
+        raw = self._slot_raw[slot]
+        normalized = _normalize(raw, self.case_insensitive)
+        for pos in self._iter_positions(raw, start, stop):
+            suffix_raw = raw[pos:]
+            suffix_norm = normalized[pos:]
+            self._candidate_counts[slot] += 1
+
+            candidate = self._candidates.get(suffix_norm)
+            if candidate is None:
+                self._candidates[suffix_norm] = _suffix_candidate(suffix_raw, 1, slot)
+                continue
+            if suffix_raw < candidate.key:
+                candidate = _suffix_candidate(suffix_raw, candidate.mask, candidate.offset)
+                self._candidates[suffix_norm] = candidate
+            candidate.add(slot)
+
+    def _remove_positions(self, slot: int, start: int, stop: int) -> None:
+        raw = self._slot_raw[slot]
+        normalized = _normalize(raw, self.case_insensitive)
+        for pos in self._iter_positions(raw, start, stop):
+            suffix_norm = normalized[pos:]
+            candidate = self._candidates[suffix_norm]
+            candidate.discard(slot)
+            self._candidate_counts[slot] -= 1
 
-    return RegexResult(entries=entries, error=None)
+            if not candidate.mask:
+                del self._candidates[suffix_norm]
+                continue
+            if candidate.key != raw[pos:]:
+                continue
+            representative = min(self._slot_raw[other][pos - len(raw) :] for other in iter_bits(candidate.covers))
+            if representative != candidate.key:
+                self._candidates[suffix_norm] = _suffix_candidate(representative, candidate.mask, candidate.offset)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .cancellation import CancellationToken
+
+Chain = Optional[Tuple[int, "Chain"]]
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def _chain_to_list(chain: Chain) -> List[int]:
+    chosen: List[int] = []
+    while chain is not None:
+        index, chain = chain
+        chosen.append(index)
+    return sorted(chosen)
+
+
+def _lower_bound(
+    uncovered: int,
+    covers: Sequence[int],
+    costs: Sequence[int],
+    covering: dict[int, List[int]],
+) -> Tuple[float, List[Tuple[int, int]]]:
+    gains: dict[int, int] = {}
+    bound = 0.0
+    branch_options: List[Tuple[int, int]] = []
+
+    for element in iter_bits(uncovered):
+        cheapest = math.inf
+        options: List[Tuple[int, int]] = []
+        for index in covering.get(element, ()):
+            gain = gains.get(index)
+            if gain is None:
+                gain = (covers[index] & uncovered).bit_count()
+                gains[index] = gain
+            options.append((index, gain))
+            cheapest = min(cheapest, costs[index] / gain)
+        if not options:
+            return math.inf, []
+        bound += cheapest
+        if not branch_options or len(options) < len(branch_options):
+            branch_options = options
+
+    return bound, branch_options
+
+
+def _undominated(
+    options: List[Tuple[int, int]],
+    covers: Sequence[int],
+    costs: Sequence[int],
+    uncovered: int,
+) -> List[int]:
+    ordered = sorted(options, key=lambda option: (costs[option[0]] / option[1], costs[option[0]], option[0]))
+    kept: List[int] = []
+    for index, _ in ordered:
+        partial = covers[index] & uncovered
+        if any(
+            costs[other] <= costs[index] and partial & ~covers[other] == 0
+            for other in kept
+        ):
+            continue
+        kept.append(index)
+    return kept
+
+
+def _find(parent: dict[int, int], element: int) -> int:
+    while parent[element] != element:
+        parent[element] = parent[parent[element]]
+        element = parent[element]
+    return element
+
+
+def _components(covers: Sequence[int], universe: int) -> List[Tuple[int, List[int]]]:
+    parent: dict[int, int] = {element: element for element in iter_bits(universe)}
+    for cover in covers:
+        elements = iter_bits(cover & universe)
+        root = next(elements, None)
+        if root is None:
+            continue
+        root = _find(parent, root)
+        for element in elements:
+            other = _find(parent, element)
+            if other != root:
+                parent[other] = root
+
+    masks: dict[int, int] = {}
+    for element in parent:
+        root = _find(parent, element)
+        masks[root] = masks.get(root, 0) | (1 << element)
+
+    members: dict[int, List[int]] = {root: [] for root in masks}
+    for index, cover in enumerate(covers):
+        cover &= universe
+        if cover:
+            members[_find(parent, (cover & -cover).bit_length() - 1)].append(index)
+
+    return [(masks[root], members[root]) for root in sorted(masks, key=lambda root: masks[root] & -masks[root])]
+
+
+def _branch_and_bound(
+    universe: int,
+    indices: List[int],
+    covers: Sequence[int],
+    costs: Sequence[int],
+    initial: List[int],
+    deadline: float,
+    token: Optional[CancellationToken],
+) -> Tuple[List[int], bool]:
+    best = sorted(initial)
+    best_cost = sum(costs[index] for index in best)
+
+    covering: dict[int, List[int]] = {}
+    for index in indices:
+        for element in iter_bits(covers[index] & universe):
+            covering.setdefault(element, []).append(index)
+
+    stack: List[Tuple[int, int, Chain]] = [(universe, 0, None)]
+    while stack:
+        if time.perf_counter() >= deadline or (token is not None and token.cancelled):
+            return best, False
+
+        uncovered, cost, chain = stack.pop()
+        if not uncovered:
+            if cost < best_cost:
+                best_cost = cost
+                best = _chain_to_list(chain)
+            continue
+
+        bound, options = _lower_bound(uncovered, covers, costs, covering)
+        if cost + math.ceil(bound - 1e-9) >= best_cost:
+            continue
+
+        children = _undominated(options, covers, costs, uncovered)
+        for index in reversed(children):
+            stack.append((uncovered & ~covers[index], cost + costs[index], (index, chain)))
+
+    return best, True
+
+
+def optimize_cover(
+    covers: Sequence[int],
+    costs: Sequence[int],
+    universe: int,
+    initial: Sequence[int],
+    time_budget_ms: int,
+    token: Optional[CancellationToken] = None,
+) -> Tuple[List[int], bool]:
+    deadline = time.perf_counter() + max(0, time_budget_ms) / 1000
+    if token is not None and token.deadline is not None:
+        deadline = min(deadline, token.deadline)
+    chosen: List[int] = []
+    proven = True
+
+    for component, indices in _components(covers, universe):
+        component_initial = [index for index in initial if covers[index] & component]
+        best, component_proven = _branch_and_bound(
+            component,
+            indices,
+            covers,
+            costs,
+            component_initial,
+            deadline,
+            token,
+        )
+        chosen.extend(best)
+        proven = proven and component_proven
+
+    return sorted(chosen), proven
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Iterable, List
+
+
+class SuffixAutomaton:
+    def __init__(self, names: Iterable[str]) -> None:
+        self._next: List[dict[str, int]] = [{}]
+        self._link: List[int] = [-1]
+        self._length: List[int] = [0]
+        for name in names:
+            last = 0
+            for char in name:
+                last = self._extend(last, char)
+
+    def __len__(self) -> int:
+        return len(self._length)
+
+    def __contains__(self, text: str) -> bool:
+        state = 0
+        for char in text:
+            state = self._next[state].get(char, -1)
+            if state < 0:
+                return False
+        return True
+
+    def matching_lengths(self, text: str) -> List[int]:
+        transitions = self._next
+        links = self._link
+        state_lengths = self._length
+        lengths: List[int] = []
+        state = 0
+        length = 0
+        for char in text:
+            while state and char not in transitions[state]:
+                state = links[state]
+                length = state_lengths[state]
+            target = transitions[state].get(char)
+            if target is None:
+                length = 0
+            else:
+                state = target
+                length += 1
+            lengths.append(length)
+        return lengths
+
+    def _clone(self, source: int, target: int, char: str) -> int:
+        transitions = self._next
+        links = self._link
+        clone = len(self._length)
+        transitions.append(dict(transitions[target]))
+        links.append(links[target])
+        self._length.append(self._length[source] + 1)
+
+        state = source
+        while state >= 0 and transitions[state].get(char) == target:
+            transitions[state][char] = clone
+            state = links[state]
+        links[target] = clone
+        return clone
+
+    def _extend(self, last: int, char: str) -> int:
+        transitions = self._next
+        links = self._link
+        lengths = self._length
+
+        existing = transitions[last].get(char)
+        if existing is not None:
+            if lengths[last] + 1 == lengths[existing]:
+                return existing
+            return self._clone(last, existing, char)
+
+        current = len(lengths)
+        transitions.append({})
+        links.append(0)
+        lengths.append(lengths[last] + 1)
+
+        state = last
+        while state >= 0 and char not in transitions[state]:
+            transitions[state][char] = current
+            state = links[state]
+        if state >= 0:
+            target = transitions[state][char]
+            if lengths[state] + 1 == lengths[target]:
+                links[current] = target
+            else:
+                links[current] = self._clone(state, target, char)
+        return current
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable
+
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def _common_prefix_length(left: str, right: str) -> int:
+    limit = min(len(left), len(right))
+    index = 0
+    while index < limit and left[index] == right[index]:
+        index += 1
+    return index
+
+
+class SuffixIndex:
+    def __init__(self, names: Iterable[str]) -> None:
+        self._reversed = sorted({name[::-1] for name in names if name})
+
+    def __len__(self) -> int:
+        return len(self._reversed)
+
+    def reversed_names(self) -> list[str]:
+        return list(self._reversed)
+
+    def __contains__(self, suffix: str) -> bool:
+        if not suffix:
+            return False
+        return self.shared_suffix_length(suffix) == len(suffix)
+
+    def add(self, name: str) -> None:
+        if not name:
+            return
+        reversed_name = name[::-1]
+        position = bisect_left(self._reversed, reversed_name)
+        if position == len(self._reversed) or self._reversed[position] != reversed_name:
+            self._reversed.insert(position, reversed_name)
+
+    def discard(self, name: str) -> None:
+        reversed_name = name[::-1]
+        position = bisect_left(self._reversed, reversed_name)
+        if position < len(self._reversed) and self._reversed[position] == reversed_name:
+            del self._reversed[position]
+
+    def names_with_suffix(self, suffix: str) -> list[str]:
+        reversed_suffix = suffix[::-1]
+        position = bisect_left(self._reversed, reversed_suffix)
+        names: list[str] = []
+        while position < len(self._reversed) and self._reversed[position].startswith(reversed_suffix):
+            names.append(self._reversed[position][::-1])
+            position += 1
+        return names
+
+    def contains_name(self, name: str) -> bool:
+        reversed_name = name[::-1]
+        position = bisect_left(self._reversed, reversed_name)
+        return position < len(self._reversed) and self._reversed[position] == reversed_name
+
+    def count_with_suffix(self, suffix: str) -> int:
+        reversed_suffix = suffix[::-1]
+        start = bisect_left(self._reversed, reversed_suffix)
+        stop = bisect_left(self._reversed, reversed_suffix + _MAX_CHAR, lo=start)
+        return stop - start
+
+    def shared_suffix_length(self, text: str) -> int:
+        if not text or not self._reversed:
+            return 0
+        reversed_text = text[::-1]
+        position = bisect_left(self._reversed, reversed_text)
+        best = 0
+        if position < len(self._reversed):
+            best = _common_prefix_length(reversed_text, self._reversed[position])
+        if position > 0:
+            best = max(best, _common_prefix_length(reversed_text, self._reversed[position - 1]))
+        return best
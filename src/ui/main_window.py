@@ -6,12 +6,22 @@ from typing import Optional
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from core.config import DEFAULT_MATCH_MODE, MAX_REGEX_LENGTH
-from core.csv_loader import load_csv
-from core.filtering import filter_items
+from core.config import DEFAULT_MATCH_MODE, MAX_REGEX_LENGTH, WATCH_INTERVAL_MS
+from core.export_cache import ExportCache
+from core.export_reload import ExportReloader
+from core.filtering import LiveSelection
 from core.models import FilterSpec, SortSpec
-from core.persistence import default_storage_path, load_entries, new_entry, save_entries
-from core.regex_generator import generate_regex
+from core.name_index import NameIndex
+from core.persistence import (
+    default_cache_path,
+    default_export_cache_dir,
+    default_storage_path,
+    load_entries,
+    new_entry,
+    save_entries,
+)
+from core.regex_cache import RegexCache, regex_fingerprint
+from core.regex_generator import RegexSession
 from core.sorting import sort_items
 
 
@@ -37,14 +47,24 @@ class MainWindow(QtWidgets.QMainWindow):
         self.saved_entries = []
         self.generation_counter = 0
         self.current_group_label = "None"
+        self.regex_session: Optional[RegexSession] = None
+        self.selection: Optional[LiveSelection] = None
+        self.name_index: Optional[NameIndex] = None
+        self.reloader: Optional[ExportReloader] = None
 
         self.storage_path = default_storage_path()
+        self.regex_cache = RegexCache(path=default_cache_path())
+        self.export_cache = ExportCache(default_export_cache_dir())
 
         self.filter_timer = QtCore.QTimer(self)
         self.filter_timer.setSingleShot(True)
         self.filter_timer.setInterval(250)
         self.filter_timer.timeout.connect(self._apply_filters_update_view)
 
+        self.watch_timer = QtCore.QTimer(self)
+        self.watch_timer.setInterval(WATCH_INTERVAL_MS)
+        self.watch_timer.timeout.connect(self._poll_export)
+
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
         main_layout = QtWidgets.QVBoxLayout(central)
@@ -64,6 +84,11 @@ class MainWindow(QtWidgets.QMainWindow):
         load_button.clicked.connect(self._load_csv)
         file_layout.addWidget(load_button)
 
+        self.watch_checkbox = QtWidgets.QCheckBox("Watch")
+        self.watch_checkbox.setToolTip("Reload automatically when the CSV export changes on disk")
+        self.watch_checkbox.toggled.connect(self._toggle_watch)
+        file_layout.addWidget(self.watch_checkbox)
+
         filter_group = QtWidgets.QGroupBox("Filters")
         filter_layout = QtWidgets.QGridLayout(filter_group)
         main_layout.addWidget(filter_group)
@@ -125,6 +150,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.match_mode_combo.addItem("Balanced (word suffix)", "balanced")
         self.match_mode_combo.addItem("Exact (full name)", "exact")
         self.match_mode_combo.addItem("Compact (short suffix)", "compact")
+        self.match_mode_combo.addItem("Substring (prefix/infix/suffix)", "substring")
+        self.match_mode_combo.addItem("Optimal (fewest characters)", "optimal")
         match_index = self.match_mode_combo.findData(DEFAULT_MATCH_MODE)
         if match_index >= 0:
             self.match_mode_combo.setCurrentIndex(match_index)
@@ -230,6 +257,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.status_bar = self.statusBar()
         self._load_saved_entries()
+        cache_warnings = self.regex_cache.load()
+        if cache_warnings:
+            self.status_bar.showMessage(cache_warnings[0])
 
     def _browse_csv(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select CSV", str(Path.cwd()), "CSV Files (*.csv)")
@@ -242,20 +272,52 @@ class MainWindow(QtWidgets.QMainWindow):
             self._show_error("Please select a CSV file.")
             return
 
+        reloader = ExportReloader(path, cache=self.export_cache)
         try:
-            records, warnings = load_csv(path)
-        except FileNotFoundError as exc:
-            self._show_error(str(exc))
+            reloader.reload(force=True)
+        except FileNotFoundError:
+            self._show_error(f"CSV not found: {path}")
             return
 
+        self.reloader = reloader
+        records = reloader.records
+        warnings = reloader.warnings
         self.records = records
+        self.name_index = NameIndex(item.name for item in records)
+        self.selection = None
+        self.regex_session = None
         self._apply_filters_update_view()
 
-        if warnings:
-            self._show_warning("\n".join(warnings[:10]))
+        if warnings.total:
+            self._show_warning("\n".join(warnings.summary()))
 
         self.status_bar.showMessage(f"Loaded {len(records)} items.")
 
+    def _toggle_watch(self, enabled: bool) -> None:
+        if enabled:
+            self.watch_timer.start()
+        else:
+            self.watch_timer.stop()
+
+    def _poll_export(self) -> None:
+        if self.reloader is None:
+            return
+        try:
+            diff = self.reloader.reload()
+        except OSError as exc:
+            self.status_bar.showMessage(str(exc))
+            return
+        if diff is None or diff.empty:
+            return
+
+        self.records = self.reloader.records
+        if self.name_index is not None:
+            self.name_index.apply_changes(diff.added_names, diff.removed_names)
+        if self.selection is not None:
+            self.selection.apply(diff.outgoing, diff.incoming)
+        self._apply_filters_update_view()
+        self.status_bar.showMessage(f"Reloaded: {diff.summary()}.")
+
     def _generate_regex(self) -> None:
         if not self.records:
             self._show_error("No CSV loaded.")
@@ -264,15 +326,30 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self._apply_filters_update_view(show_errors=True):
             return
 
-        targets = [item.name for item in self.filtered]
-        non_targets = self._build_non_targets(self.filtered)
+        targets = self.selection.target_names()
+        non_targets = self.selection.non_target_names()
 
-        result = generate_regex(
+        match_mode = self._current_match_mode()
+        cache_key = regex_fingerprint(
             targets,
             non_targets,
             max_length=self._max_raw_regex_length(),
-            match_mode=self._current_match_mode(),
+            match_mode=match_mode,
         )
+        result = self.regex_cache.get(cache_key)
+        cached = result is not None
+        if result is None:
+            if self.regex_session is None or self.regex_session.match_mode != match_mode:
+                self.regex_session = RegexSession(
+                    max_length=self._max_raw_regex_length(),
+                    match_mode=match_mode,
+                    name_index=self.name_index,
+                )
+            self.regex_session.update(targets, non_targets)
+            result = self.regex_session.result()
+            self.regex_cache.put(cache_key, result)
+            self.regex_cache.save()
+
         if not result.ok:
             self._set_current_entries([], "None")
             self._show_error(result.error or "Failed to generate regex.")
@@ -280,8 +357,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.generation_counter += 1
         group_label = f"Generated #{self.generation_counter}"
-        self._set_current_entries(result.entries, group_label)
-        self.status_bar.showMessage(f"Generated {len(result.entries)} entry(ies).")
+        self._set_current_entries(result.search_entries, group_label)
+        source = " (cached)" if cached else ""
+        negated = ", negated" if result.negated else ""
+        self.status_bar.showMessage(f"Generated {len(result.entries)} entry(ies){negated}{source}.")
 
     def _schedule_filter_refresh(self) -> None:
         if not self.records:
@@ -290,6 +369,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _apply_filters_update_view(self, show_errors: bool = False) -> bool:
         if not self.records:
+            self.filtered = []
             self._populate_table([])
             self._update_expected_total([])
             return False
@@ -302,15 +382,18 @@ class MainWindow(QtWidgets.QMainWindow):
                 return False
             self.status_bar.showMessage(message)
 
-        filtered = filter_items(self.records, spec)
+        if self.selection is None or self.selection.spec != spec:
+            self.selection = LiveSelection(self.records, spec)
+        filtered = self.selection.items
         sort_field = self.sort_field_combo.currentText()
         if sort_field != "None":
             ascending = self.sort_order_combo.currentText() == "Ascending"
             filtered = sort_items(filtered, SortSpec(field=sort_field, ascending=ascending))
 
+        if filtered != self.filtered:
+            self._populate_table(filtered)
+            self._update_expected_total(filtered)
         self.filtered = filtered
-        self._populate_table(filtered)
-        self._update_expected_total(filtered)
         return True
 
     def _build_filter_spec(self) -> tuple[FilterSpec, list[str]]:
@@ -374,10 +457,6 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         return spec, errors
 
-    def _build_non_targets(self, selected_items) -> list[str]:
-        selected_ids = {id(item) for item in selected_items}
-        return [item.name for item in self.records if id(item) not in selected_ids]
-
     def _set_current_entries(self, entries: list[str], group_label: str) -> None:
         self.current_entries = list(entries)
         self.current_group_label = group_label
@@ -0,0 +1,57 @@
+from benchmarks.cases import get_cases
+from benchmarks.runner import BenchmarkResult, compare_results, run_benchmarks
+from benchmarks.synthetic import NamingSeed, write_synthetic_export
+from core.csv_loader import load_csv
+
+NAMING = NamingSeed(
+    names=["Chaos Orb", "Divine Orb", "Abyss Scarab of Edifice", "Ambush Scarab", "Burial Chambers Map"],
+    tabs=["c", "frag", "m"],
+)
+
+
+def test_synthetic_export_is_deterministic_and_loadable(tmp_path):
+    first = write_synthetic_export(tmp_path / "a.csv", 300, seed=7, naming=NAMING)
+    second = write_synthetic_export(tmp_path / "b.csv", 300, seed=7, naming=NAMING)
+
+    assert first.read_bytes() == second.read_bytes()
+    records, warnings = load_csv(str(first))
+    assert len(records) == 300
+    assert not warnings
+    assert {record.tab for record in records} <= set(NAMING.tabs)
+    assert len({record.name for record in records}) > 250
+
+
+def test_run_benchmarks_reports_each_case_and_size(tmp_path):
+    results = run_benchmarks([50, 80], get_cases(["load_csv", "sort_items"]), repeat=1, workdir=tmp_path)
+
+    assert [(result.case, result.rows) for result in results] == [
+        ("load_csv", 50),
+        ("sort_items", 50),
+        ("load_csv", 80),
+        ("sort_items", 80),
+    ]
+    assert all(result.seconds >= 0 and result.peak_bytes > 0 for result in results)
+
+
+def test_compare_flags_time_and_memory_regressions():
+    baseline = [BenchmarkResult("load_csv", 1000, 0.100, 1000), BenchmarkResult("sort_items", 1000, 0.001, 500)]
+    current = [BenchmarkResult("load_csv", 1000, 0.200, 1100), BenchmarkResult("sort_items", 1000, 0.002, 900)]
+
+    regressions = compare_results(baseline, current)
+
+    assert [(item.case, item.metric) for item in regressions] == [
+        ("load_csv", "seconds"),
+        ("sort_items", "peak_bytes"),
+    ]
+
+
+def test_wide_selection_case_splits_names_without_overlap(tmp_path):
+    export = write_synthetic_export(tmp_path / "wide.csv", 300, seed=3, naming=NAMING)
+    case = get_cases(["regex_first_entry"])[0]
+
+    state = case.setup(export)
+    entry = case.run(state)
+
+    assert state["targets"] and state["non_targets"]
+    assert not set(state["targets"]) & set(state["non_targets"])
+    assert entry
@@ -0,0 +1,45 @@
+import sys
+
+import pytest
+
+import cli
+
+HEADER = '"Name","Tab","Quantity","Total"\n'
+
+
+def _write(path, body):
+    path.write_text(HEADER + body, encoding="utf-8")
+    return str(path)
+
+
+def _run(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["cli.py", *args])
+    return cli.main()
+
+
+def test_progressive_rejects_flags_it_cannot_honor(tmp_path, monkeypatch, capsys):
+    path = _write(tmp_path / "export.csv", '"Chaos Orb","c","1","10"\n"Divine Orb","c","1","1"\n')
+
+    for flags in (["--validation", "full"], ["--no-negation"], ["--profile"]):
+        with pytest.raises(SystemExit) as exc:
+            _run(monkeypatch, "--csv", path, "--progressive", *flags)
+        assert exc.value.code == 2
+        assert f"cannot use {flags[0]}" in capsys.readouterr().err
+
+    assert _run(monkeypatch, "--csv", path, "--progressive", "--min-total", "5", "--match-mode", "compact") == 0
+    assert "Entry 1" in capsys.readouterr().out
+
+
+def test_only_multi_export_loads_merge_duplicate_rows(tmp_path, monkeypatch, capsys):
+    first = _write(tmp_path / "main.csv", '"Chaos Orb","c","1","10"\n"Chaos Orb","c","2","20"\n"Divine Orb","c","1","1"\n')
+    second = _write(tmp_path / "alt.csv", '"Exalted Orb","c","1","5"\n')
+
+    assert _run(monkeypatch, "--csv", first, "--min-total", "15", "--match-mode", "compact") == 1
+    single = capsys.readouterr().out
+    assert single.splitlines()[:2] == ["Loaded items: 3", "Filtered items: 1"]
+    assert "overlap" in single
+
+    assert _run(monkeypatch, "--csv", first, second, "--min-total", "15", "--match-mode", "compact") == 0
+    merged = capsys.readouterr().out
+    assert merged.splitlines()[:2] == ["Loaded items: 3", "Filtered items: 1"]
+    assert "Entry 1" in merged
@@ -0,0 +1,35 @@
+from core.collision_report import collision_report
+
+TARGETS = ["Chaos Orb", "Divine Orb", "Mirror Shard"]
+NON_TARGETS = ["Orb of Regret", "Shard of Fate", "Eldritch Chaos Orb"]
+
+
+def test_report_lists_every_problem_with_matching_entries():
+    report = collision_report(["Orb$", "^Orb", "Fate"], TARGETS, NON_TARGETS)
+
+    assert not report.ok
+    assert report.uncovered_targets == ["Mirror Shard"]
+    assert report.matched_non_targets == {
+        "Orb of Regret": [1],
+        "Shard of Fate": [2],
+        "Eldritch Chaos Orb": [0],
+    }
+
+
+def test_report_chunks_across_workers_like_inline_run():
+    entries = ["(Chaos|Divine) Orb$", "^Mirror"]
+
+    inline = collision_report(entries, TARGETS, NON_TARGETS, max_workers=1, chunk_size=2)
+    pooled = collision_report(entries, TARGETS, NON_TARGETS, max_workers=2, chunk_size=2)
+
+    assert pooled == inline
+    assert inline.matched_non_targets == {"Eldritch Chaos Orb": [0]}
+    assert collision_report(["(Orb"], TARGETS, NON_TARGETS).error.startswith("Invalid regex")
+
+
+def test_report_reads_negated_entries_as_highlighting_non_matches():
+    report = collision_report(["!Orb$|Fate$"], TARGETS, NON_TARGETS)
+
+    assert report.uncovered_targets == ["Chaos Orb", "Divine Orb"]
+    assert report.matched_non_targets == {"Orb of Regret": [0]}
+    assert collision_report(["!(Orb of Regret|Shard of Fate|Eldritch Chaos Orb)$"], TARGETS, NON_TARGETS).ok
@@ -1,6 +1,10 @@
 from decimal import Decimal
 
-from core.csv_loader import load_csv
+import pytest
+
+from core.csv_loader import iter_csv, load_csv
+from core.models import LoadWarnings
+from core.parallel_csv import load_csv_parallel
 
 
 def test_load_csv_parses_and_defaults(tmp_path):
@@ -37,3 +41,58 @@ def test_load_csv_skips_missing_name(tmp_path):
     assert len(records) == 1
     assert records[0].name == "Valid Item"
     assert warnings
+
+
+def test_iter_csv_yields_chunks_and_caps_warnings(tmp_path):
+    rows = ['"Name","Tab","Quantity","Total"']
+    rows += [f'"Item {index}","tab","x","{index}"' for index in range(7)]
+    rows += ['"","tab","1","1"']
+    path = tmp_path / "sample.csv"
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    warnings = LoadWarnings(max_examples=3)
+    chunks = list(iter_csv(str(path), chunk_size=3, warnings=warnings))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [record for chunk in chunks for record in chunk] == load_csv(str(path))[0]
+    assert warnings.counts == {"invalid_quantity": 7, "missing_name": 1}
+    assert len(warnings.examples) == 3
+    assert warnings.summary()[-1] == "... and 5 more warning(s) (invalid_quantity: 7, missing_name: 1)."
+
+    unattached = iter_csv(str(path), chunk_size=3)
+    assert sum(len(chunk) for chunk in unattached) == 7
+    assert unattached.warnings.counts == warnings.counts
+
+
+def test_iter_csv_missing_file_raises_before_iteration(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        iter_csv(str(tmp_path / "missing.csv"))
+
+
+def test_load_csv_parallel_matches_sequential_loader(tmp_path):
+    rows = ['"Name","Tab","Quantity","Total"']
+    for index in range(40):
+        rows.append(f'"Item {index}","tab","{index if index % 7 else "x"}","{index}.5"')
+        if index % 9 == 0:
+            rows.append('"Multi\nline, ""quoted"" name","dump","2","1"')
+            rows.append("")
+            rows.append('"","tab","1","1"')
+    path = tmp_path / "sample.csv"
+    path.write_text("\ufeff" + "\r\n".join(rows) + "\r\n", encoding="utf-8")
+
+    expected = load_csv(str(path))
+    for chunk_bytes in (1, 64, 1 << 20):
+        assert load_csv_parallel(str(path), max_workers=2, chunk_bytes=chunk_bytes) == expected
+    assert "Row 11: invalid Quantity 'x', defaulting to 1." in expected[1]
+
+    stray = tmp_path / "stray.csv"
+    stray.write_text(
+        '"Name","Tab","Quantity","Total"\n' + 'Map 12",T,1,2\n"Multi\nline",T,3,4\n' * 100,
+        encoding="utf-8",
+    )
+    assert load_csv_parallel(str(stray), max_workers=2, chunk_bytes=2) == load_csv(str(stray))
+
+    carriage = tmp_path / "carriage.csv"
+    carriage.write_bytes(("\r".join(rows) + "\r").encode("utf-8"))
+    assert load_csv_parallel(str(carriage), max_workers=2, chunk_bytes=64) == load_csv(str(carriage))
+    assert len(load_csv(str(carriage))[0]) > 40
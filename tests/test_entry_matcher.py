@@ -0,0 +1,32 @@
+import re
+
+from core.collision_checker import validate_regex
+from core.entry_matcher import EntryMatcher, expand_entry
+
+
+def test_expand_entry_handles_generator_dialect():
+    assert expand_entry("(Divine|Chaos) Orb$") == ["Divine Orb\x01", "Chaos Orb\x01"]
+    assert expand_entry("^(?:A\\.B|C)$") == ["\x00A.B\x01", "\x00C\x01"]
+    assert expand_entry("Orb.*") is None
+    assert expand_entry("a^b") is None
+    assert expand_entry("[ae][lr\\-]$") == ["al\x01", "ar\x01", "a-\x01", "el\x01", "er\x01", "e-\x01"]
+    assert expand_entry("[a-c]") is None
+    assert expand_entry("[^a]") is None
+
+
+def test_matcher_agrees_with_re_including_fallback_entries():
+    entries = ["(Divine|Chaos) Orb$", "^Scarab", "Map$|^(?:Sextant)$", "Ess[ae]nce", "Ess(a|e)nc.$"]
+    names = ["Divine Orb", "chaos orb", "Orb of Chaos", "Scarab of Time", "Horned Scarab", "Sextant", "Essence", "Map\n"]
+
+    for case_insensitive in (False, True):
+        matcher = EntryMatcher(entries, case_insensitive)
+        flags = re.IGNORECASE if case_insensitive else 0
+        for name in names:
+            expected = sum(1 << index for index, entry in enumerate(entries) if re.search(entry, name, flags))
+            assert matcher.match_mask(name) == expected
+
+
+def test_validate_regex_reports_first_problem():
+    assert validate_regex(["Orb$"], ["Chaos Orb"], ["Orb of Regret"]) == (True, None)
+    assert validate_regex(["Orb"], ["Chaos Orb"], ["Orb of Regret"]) == (False, "Regex matches non-target 'Orb of Regret'.")
+    assert validate_regex(["(Orb"], ["Chaos Orb"], [])[0] is False
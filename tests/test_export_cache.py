@@ -0,0 +1,88 @@
+import hashlib
+import os
+from decimal import Decimal
+
+from core.csv_loader import load_csv
+from core.export_cache import ExportCache
+from core.models import ItemRecord
+
+HEADER = '"Name","Tab","Quantity","Total"\n'
+
+
+def _write(path, body):
+    path.write_text(HEADER + body, encoding="utf-8")
+    return str(path)
+
+
+def test_export_cache_round_trips_records_warnings_and_index(tmp_path):
+    csv_path = _write(tmp_path / "export.csv", '"Chaos Orb","c","x","1.50"\n"Divine Orb","c","2","300"\n"","c","1","1"\n')
+    cache = ExportCache(str(tmp_path / "cache"))
+
+    first = cache.load(csv_path)
+    second = ExportCache(str(tmp_path / "cache")).load(csv_path)
+    records, warnings = load_csv(csv_path)
+
+    assert first.records == second.records == records
+    assert second.records[0] == ItemRecord(name="Chaos Orb", tab="c", quantity=1, total=Decimal("1.50"))
+    assert second.warnings == first.warnings
+    assert second.warnings.examples == warnings
+    assert second.warnings.counts == {"invalid_quantity": 1, "missing_name": 1}
+    assert second.name_index.reversed_names() == first.name_index.reversed_names()
+    assert second.name_index.count_with_suffix(" orb") == 2
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+
+
+def test_export_cache_caps_stored_warnings(tmp_path):
+    csv_path = _write(tmp_path / "export.csv", '"Chaos Orb","c","x","1"\n' * 50)
+    cache = ExportCache(str(tmp_path / "cache"))
+    cache.load(csv_path)
+
+    warnings = ExportCache(str(tmp_path / "cache")).load(csv_path).warnings
+
+    assert warnings.counts == {"invalid_quantity": 50}
+    assert len(warnings.examples) == warnings.max_examples < 50
+
+
+def test_export_cache_evicts_least_recently_used_snapshots(tmp_path):
+    cache = ExportCache(str(tmp_path / "cache"), max_snapshots=2)
+    paths = [_write(tmp_path / f"export{index}.csv", f'"Item {index}","c","1","1"\n') for index in range(3)]
+    snapshots = [cache.snapshot_path(hashlib.sha256(open(path, "rb").read()).hexdigest()) for path in paths]
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    os.utime(snapshots[0], ns=(1, 1))
+    os.utime(snapshots[1], ns=(2, 2))
+    cache.load(paths[0])
+    cache.load(paths[2])
+
+    assert [snapshot.exists() for snapshot in snapshots] == [True, False, True]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 3, 1)
+
+
+def test_export_cache_reparses_corrupt_snapshots(tmp_path):
+    csv_path = _write(tmp_path / "export.csv", '"Chaos Orb","c","1","1"\n')
+    cache = ExportCache(str(tmp_path / "cache"))
+    expected = cache.load(csv_path).records
+
+    snapshot = next((tmp_path / "cache").glob("*.bin"))
+    snapshot.write_bytes(snapshot.read_bytes()[:-3])
+
+    assert cache.load(csv_path).records == expected
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+    assert cache.load(csv_path).records == expected
+    assert cache.stats.hits == 1
+
+
+def test_export_cache_bounds_the_directory_size(tmp_path):
+    paths = [_write(tmp_path / f"export{index}.csv", f'"Item {index}","c","1","1"\n' * 20) for index in range(3)]
+    ExportCache(str(tmp_path / "probe")).load(paths[0])
+    size = next((tmp_path / "probe").glob("*.bin")).stat().st_size
+    cache = ExportCache(str(tmp_path / "cache"), max_bytes=2 * size)
+
+    for path in paths:
+        cache.load(path)
+
+    assert len(list((tmp_path / "cache").glob("*.bin"))) == 2
+    assert cache.stats.evictions == 1
+    ExportCache(str(tmp_path / "tiny"), max_bytes=size - 1).load(paths[0])
+    assert not list((tmp_path / "tiny").glob("*.bin"))
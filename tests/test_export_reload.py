@@ -0,0 +1,70 @@
+import os
+from decimal import Decimal
+
+from core.export_cache import ExportCache
+from core.export_reload import ExportReloader, diff_records
+from core.models import ItemRecord
+from core.name_index import NameIndex
+
+HEADER = '"Name","Tab","Quantity","Total"\n'
+
+
+def _record(name, tab="c", quantity=1, total="1"):
+    return ItemRecord(name=name, tab=tab, quantity=quantity, total=Decimal(total))
+
+
+def test_diff_records_keys_on_name_and_tab():
+    old = [_record("Chaos Orb"), _record("Chaos Orb", tab="dump"), _record("Divine Orb"), _record("Map", quantity=2)]
+    new = [_record("Chaos Orb", quantity=5), _record("Chaos Orb", tab="dump"), _record("Map"), _record("Map")]
+
+    diff = diff_records(old, new)
+
+    assert diff.added == [_record("Map")]
+    assert diff.removed == [_record("Divine Orb")]
+    assert diff.changed == [
+        (_record("Chaos Orb"), _record("Chaos Orb", quantity=5)),
+        (_record("Map", quantity=2), _record("Map")),
+    ]
+    assert diff.added_names == []
+    assert diff.removed_names == ["Divine Orb"]
+    assert diff_records(new, list(reversed(new))).empty
+
+
+def test_reloader_skips_unchanged_files_and_reports_deltas(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text(HEADER + '"Chaos Orb","c","1","1"\n', encoding="utf-8")
+    reloader = ExportReloader(str(path))
+
+    first = reloader.reload()
+    assert first.added == [_record("Chaos Orb")]
+    assert reloader.reload() is None
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert reloader.reload() is None
+
+    path.write_text(HEADER + '"Chaos Orb","c","3","1"\n"Divine Orb","c","1","x"\n', encoding="utf-8")
+    diff = reloader.reload()
+
+    assert diff.summary() == "1 added, 0 removed, 1 changed"
+    assert diff.added_names == ["Divine Orb"]
+    assert reloader.warnings.counts == {"invalid_total": 1}
+
+    index = NameIndex(["Chaos Orb"])
+    index.apply_changes(diff.added_names, diff.removed_names)
+    assert index.contains_name("divine orb")
+
+
+def test_watch_reloads_bypass_the_export_cache(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text(HEADER + '"Chaos Orb","c","1","1"\n', encoding="utf-8")
+    cache = ExportCache(str(tmp_path / "cache"))
+    reloader = ExportReloader(str(path), cache=cache)
+
+    reloader.reload(force=True)
+    path.write_text(HEADER + '"Chaos Orb","c","2","1"\n', encoding="utf-8")
+    diff = reloader.reload()
+
+    assert diff.summary() == "0 added, 0 removed, 1 changed"
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+    assert len(list((tmp_path / "cache").glob("*.bin"))) == 1
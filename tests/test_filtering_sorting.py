@@ -1,6 +1,9 @@
+import random
+from collections import Counter
 from decimal import Decimal
 
-from core.filtering import filter_items
+from core.export_reload import diff_records
+from core.filtering import LiveSelection, filter_items, split_selection
 from core.models import FilterSpec, ItemRecord, SortSpec
 from core.sorting import sort_items
 
@@ -83,3 +86,44 @@ def test_sort_name_ascending():
     sorted_items = sort_items(items, spec)
 
     assert [item.name for item in sorted_items] == ["Alpha", "Beta", "Gamma"]
+
+
+def test_split_selection_consumes_a_stream():
+    items = _items() + [ItemRecord(name="Beta", tab="t1", quantity=1, total=Decimal("1"))]
+    spec = FilterSpec(top_n=2)
+
+    selected, non_targets = split_selection(iter(items), spec)
+
+    assert [item.name for item in selected] == ["Beta", "Gamma"]
+    assert non_targets == ["Alpha", "Beta"]
+
+
+def test_live_selection_follows_export_diffs():
+    rng = random.Random(3)
+    names = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]
+
+    def export():
+        return [
+            ItemRecord(name=rng.choice(names), tab=rng.choice(["t1", "t2"]), quantity=1, total=Decimal(rng.randint(1, 9)))
+            for _ in range(rng.randint(5, 12))
+        ]
+
+    for spec in (FilterSpec(tabs={"t1"}, min_total=Decimal("4")), FilterSpec(top_n=3)):
+        records = export()
+        selection = LiveSelection(records, spec)
+        targets = set(selection.target_names())
+        non_targets = set(selection.non_target_names())
+        for _ in range(20):
+            reloaded = export()
+            diff = diff_records(records, reloaded)
+            delta = selection.apply(diff.outgoing, diff.incoming)
+            targets = (targets - delta.removed_targets) | delta.added_targets
+            non_targets = (non_targets - delta.removed_non_targets) | delta.added_non_targets
+            records = reloaded
+
+            selected, expected_non_targets = split_selection(records, spec)
+            assert Counter(selection.items) == Counter(selected)
+            assert len(selection) == len(selected)
+            assert Counter(selection.non_target_names()) == Counter(expected_non_targets)
+            assert targets == {item.name for item in selected}
+            assert non_targets == set(expected_non_targets)
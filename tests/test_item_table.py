@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import pytest
+
+from core.filtering import filter_items
+from core.models import FilterSpec, ItemRecord, LoadWarnings, SortSpec
+from core.sorting import sort_items
+
+pytest.importorskip("numpy")
+
+from core.item_table import ItemTable, load_item_table
+
+
+def _items():
+    return [
+        ItemRecord(name="Chaos Orb", tab="c", quantity=3, total=Decimal("1.5")),
+        ItemRecord(name="Divine Orb", tab="c", quantity=0, total=Decimal("120")),
+        ItemRecord(name="Chaos Orb", tab="dump", quantity=7, total=Decimal("3.25")),
+        ItemRecord(name="Ambush Scarab", tab="frag", quantity=2, total=Decimal("-1")),
+    ]
+
+
+def test_item_table_round_trips_records_with_interned_columns():
+    table = ItemTable.from_records(_items())
+
+    assert table.to_records() == _items()
+    assert table.name_pool == ["Chaos Orb", "Divine Orb", "Ambush Scarab"]
+    assert table.name_codes.tolist() == [0, 1, 0, 2]
+    assert table.totals.tolist() == [150, 12000, 325, -100]
+    assert table.total_scale == 2
+    assert table.total_sum() == Decimal("123.75")
+
+
+def test_item_table_keeps_source_exponents():
+    totals = [Decimal("1E+2"), Decimal("0.50"), Decimal("-3"), Decimal("0.000"), Decimal("12.5")]
+    items = [ItemRecord(name=f"Item {index}", tab="t", quantity=1, total=total) for index, total in enumerate(totals)]
+
+    table = ItemTable.from_records(items)
+
+    assert [str(record.total) for record in table.to_records()] == ["1E+2", "0.50", "-3", "0.000", "12.5"]
+    assert [str(record.total) for record in table.sort(SortSpec(field="total")).to_records()] == [
+        "-3",
+        "0.000",
+        "0.50",
+        "12.5",
+        "1E+2",
+    ]
+
+
+def test_item_table_filter_and_sort_match_record_passes():
+    items = _items()
+    table = ItemTable.from_records(items)
+    specs = [
+        FilterSpec(tabs={"c", "frag"}, min_total=Decimal("0")),
+        FilterSpec(name_query="orb", min_price=Decimal("0.4"), max_price=Decimal("0.5")),
+        FilterSpec(max_quantity=3, top_n=2),
+        FilterSpec(bottom_n=3),
+    ]
+
+    for spec in specs:
+        assert table.filter(spec).to_records() == filter_items(items, spec)
+    for field in ("name", "tab", "quantity", "total"):
+        for ascending in (True, False):
+            sort_spec = SortSpec(field=field, ascending=ascending)
+            assert table.sort(sort_spec).to_records() == sort_items(items, sort_spec)
+
+
+def test_load_item_table_streams_the_export(tmp_path):
+    path = tmp_path / "sample.csv"
+    path.write_text(
+        '"Name","Tab","Quantity","Total"\n"Chaos Orb","c","2","0.5"\n"Divine Orb","c","x","100"\n',
+        encoding="utf-8",
+    )
+    warnings = LoadWarnings()
+
+    table = load_item_table(str(path), chunk_size=1, warnings=warnings)
+
+    assert table.names() == ["Chaos Orb", "Divine Orb"]
+    assert table.quantities.tolist() == [2, 1]
+    assert warnings.counts == {"invalid_quantity": 1}
@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+from core.export_cache import ExportCache
+from core.models import ItemRecord, LoadWarnings
+from core.multi_export import load_exports
+
+HEADER = '"Name","Tab","Quantity","Total"\n'
+
+
+def _write(path, body):
+    path.write_text(HEADER + body, encoding="utf-8")
+    return str(path)
+
+
+def test_load_exports_aggregates_name_and_tab_across_sources(tmp_path):
+    first = _write(tmp_path / "main.csv", '"Chaos Orb","c","10","10"\n"Divine Orb","c","1","300"\n"Chaos Orb","c","x","1.5"\n')
+    second = _write(tmp_path / "alt.csv", '"Chaos Orb","c","5","5"\n"Chaos Orb","dump","2","2"\n')
+    warnings = LoadWarnings()
+
+    merged = load_exports([first, second, first], max_workers=1, warnings=warnings)
+
+    assert merged.records == [
+        ItemRecord(name="Chaos Orb", tab="c", quantity=16, total=Decimal("16.5")),
+        ItemRecord(name="Divine Orb", tab="c", quantity=1, total=Decimal("300")),
+        ItemRecord(name="Chaos Orb", tab="dump", quantity=2, total=Decimal("2")),
+    ]
+    assert merged.row_count == 5
+    assert merged.sources_for(merged.records[0]) == (first, second)
+    assert merged.sources_for(merged.records[2]) == (second,)
+    assert warnings.examples == [f"{first}: Row 4: invalid Quantity 'x', defaulting to 1."]
+    assert load_exports([first]).records[0] == ItemRecord(name="Chaos Orb", tab="c", quantity=11, total=Decimal("11.5"))
+
+
+def test_load_exports_pools_match_sequential_loading(tmp_path):
+    paths = []
+    for index in range(4):
+        body = "".join(f'"Item {row % 7}","t{row % 2}","{index}","{row}"\n' for row in range(40))
+        paths.append(_write(tmp_path / f"export{index}.csv", body))
+    expected = load_exports(paths, max_workers=1)
+    cache = ExportCache(str(tmp_path / "cache"))
+
+    assert load_exports(paths, max_workers=2) == expected
+    assert load_exports(paths, max_workers=2, cache=cache) == expected
+    assert load_exports(paths, max_workers=2, cache=cache) == expected
+    assert (cache.stats.hits, cache.stats.misses) == (4, 4)
@@ -0,0 +1,60 @@
+import pickle
+
+from core.name_index import NameIndex
+from core.regex_generator import generate_regex
+from core.suffix_index import SuffixIndex
+
+NAMES = ["Chaos Orb", "Divine Orb", "Orb of Annulment", "Eldritch Orb of Annulment", "Mirror Shard"]
+
+
+def test_complement_matches_non_target_index():
+    index = NameIndex(NAMES)
+    targets = {"chaos orb", "orb of annulment"}
+    non_targets = {name.lower() for name in NAMES} - targets
+
+    complement = index.complement(targets)
+    direct = SuffixIndex(non_targets)
+
+    for name in targets:
+        assert complement.shared_suffix_length(name) == direct.shared_suffix_length(name)
+
+
+def test_generate_regex_with_name_index_matches_full_build():
+    index = NameIndex(NAMES)
+    targets = ["Chaos Orb", "Orb of Annulment"]
+    non_targets = [name for name in NAMES if name not in targets]
+
+    for mode in ("balanced", "compact", "optimal"):
+        assert generate_regex(targets, non_targets, match_mode=mode, name_index=index) == generate_regex(
+            targets, non_targets, match_mode=mode
+        )
+
+
+def test_mismatched_selection_falls_back():
+    index = NameIndex(NAMES)
+
+    assert not index.matches_selection({"chaos orb"}, {"divine orb"}, True)
+    assert not index.matches_selection({"chaos orb"}, set(), False)
+
+
+def test_swapped_non_target_falls_back():
+    index = NameIndex(["Alpha Orb", "Beta Orb", "Gamma"])
+
+    assert not index.matches_selection({"alpha orb"}, {"gamma", "xpha orb"}, True)
+    result = generate_regex(["Alpha Orb"], ["Gamma", "Xpha Orb"], match_mode="compact", name_index=index)
+    assert result == generate_regex(["Alpha Orb"], ["Gamma", "Xpha Orb"], match_mode="compact")
+    assert result.ok and "ha Orb$" not in result.entries
+
+
+def test_selection_fingerprint_follows_changes_and_pickling():
+    index = NameIndex(NAMES)
+    names = {name.lower() for name in NAMES}
+    assert index.matches_selection({"chaos orb"}, names - {"chaos orb"}, True)
+
+    index.apply_changes(["Exalted Orb"], ["Mirror Shard"])
+    names = names - {"mirror shard"} | {"exalted orb"}
+    assert index.matches_selection({"exalted orb"}, names - {"exalted orb"}, True)
+    assert not index.matches_selection({"exalted orb"}, names - {"exalted orb"} | {"mirror shard"} - {"divine orb"}, True)
+
+    restored = pickle.loads(pickle.dumps(index))
+    assert restored.matches_selection({"exalted orb"}, names - {"exalted orb"}, True)
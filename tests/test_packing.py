@@ -0,0 +1,26 @@
+from core.packing import _first_fit_decreasing, pack_items
+
+
+def test_pack_items_keeps_sequential_fill_when_already_minimal():
+    assert pack_items([2, 2, 3], 8) == [[0, 1], [2]]
+
+
+def test_pack_items_reduces_entry_count_below_sequential_fill():
+    lengths = [3, 4, 4, 5]
+
+    bins = pack_items(lengths, 9)
+
+    assert bins == [[0, 3], [1, 2]]
+
+
+def test_pack_items_accounts_for_group_overhead():
+    bins = pack_items([3, 3], 12, overhead=len("^(?:)$"), single_overhead=len("^$"))
+
+    assert bins == [[0], [1]]
+
+
+def test_first_fit_decreasing_uses_the_leftmost_bin_with_room():
+    lengths = [6, 5, 5, 4, 3, 2, 2, 1]
+
+    assert _first_fit_decreasing(lengths, 10, 0, 0) == [[0, 4], [1, 3], [2, 5, 7], [6]]
+    assert _first_fit_decreasing(lengths, 12, 6, 2) == [[0], [1], [2], [3, 7], [4, 5], [6]]
@@ -0,0 +1,43 @@
+from core.models import RegexJob
+from core.regex_batch import generate_regex_batch
+from core.regex_generator import generate_regex
+
+UNIVERSE = [
+    "Chaos Orb",
+    "Divine Orb",
+    "Orb of Annulment",
+    "Eldritch Orb of Annulment",
+    "Mirror Shard",
+    "Horned Scarab of Awakening",
+]
+
+
+def _jobs():
+    return [
+        RegexJob(target_names=["Chaos Orb", "Divine Orb"]),
+        RegexJob(target_names=["Orb of Annulment"], options={"match_mode": "substring"}),
+        RegexJob(target_names=["Mirror Shard"], non_target_names=["Chaos Orb"], options={"match_mode": "exact"}),
+        RegexJob(target_names=["Horned Scarab of Awakening", "Mirror Shard"], options={"match_mode": "compact"}),
+    ]
+
+
+def _expected(job):
+    if job.non_target_names is None:
+        non_targets = [name for name in UNIVERSE if name not in job.target_names]
+    else:
+        non_targets = job.non_target_names
+    return generate_regex(job.target_names, non_targets, **job.options)
+
+
+def test_batch_matches_sequential_generation_in_job_order():
+    jobs = _jobs()
+
+    results = generate_regex_batch(UNIVERSE, jobs, max_workers=2)
+
+    assert results == [_expected(job) for job in jobs]
+
+
+def test_batch_runs_inline_with_single_worker():
+    jobs = _jobs()
+
+    assert generate_regex_batch(UNIVERSE, jobs, max_workers=1) == [_expected(job) for job in jobs]
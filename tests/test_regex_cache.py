@@ -0,0 +1,67 @@
+from core import regex_cache
+from core.regex_cache import RegexCache, regex_fingerprint
+from core.regex_generator import generate_regex
+
+
+def test_fingerprint_ignores_order_and_duplicates():
+    first = regex_fingerprint(["Chaos Orb", "Divine Orb"], ["Mirror Shard", "Mirror Shard"])
+    second = regex_fingerprint(["Divine Orb", "Chaos Orb"], ["Mirror Shard"])
+
+    assert first == second
+    assert first != regex_fingerprint(["Divine Orb", "Chaos Orb"], ["Mirror Shard"], match_mode="exact")
+    assert first != regex_fingerprint(["Divine Orb", "Chaos Orb"], ["Mirror Shard"], validation="full")
+
+
+def test_fingerprint_changes_with_cache_version(monkeypatch):
+    before = regex_fingerprint(["Chaos Orb"], ["Divine Orb"])
+    monkeypatch.setattr(regex_cache, "REGEX_CACHE_VERSION", regex_cache.REGEX_CACHE_VERSION + 1)
+
+    assert regex_fingerprint(["Chaos Orb"], ["Divine Orb"]) != before
+
+
+def test_cache_does_not_serve_certified_results_to_full_validation():
+    cache = RegexCache()
+
+    cache.generate(["Chaos Orb"], ["Divine Orb"])
+    cache.generate(["Chaos Orb"], ["Divine Orb"], validation="full")
+
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+
+def test_cache_counts_hits_and_evicts_least_recent():
+    cache = RegexCache(max_entries=2)
+
+    first = cache.generate(["Chaos Orb"], ["Divine Orb"])
+    assert cache.generate(["Chaos Orb"], ["Divine Orb"]) is first
+    cache.generate(["Divine Orb"], ["Chaos Orb"])
+    cache.generate(["Chaos Orb"], ["Divine Orb"])
+    cache.generate(["Mirror Shard"], ["Chaos Orb"])
+
+    assert first == generate_regex(["Chaos Orb"], ["Divine Orb"])
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 3
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+
+def test_cache_persists_to_disk(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = RegexCache(path=str(path))
+    result = cache.generate(["Chaos Orb"], ["Divine Orb"], match_mode="compact")
+
+    reloaded = RegexCache(path=str(path))
+    warnings = reloaded.load()
+
+    assert not warnings
+    assert reloaded.generate(["Chaos Orb"], ["Divine Orb"], match_mode="compact") == result
+    assert reloaded.stats.hits == 1
+
+
+def test_cache_load_handles_corruption(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not valid json", encoding="ascii")
+
+    cache = RegexCache(path=str(path))
+
+    assert cache.load()
+    assert len(cache) == 0
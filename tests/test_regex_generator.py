@@ -1,4 +1,21 @@
-from core.regex_generator import generate_regex
+import random
+import re
+import sys
+import time
+
+import pytest
+
+from benchmarks.synthetic import iter_synthetic_names, load_naming_seed
+from core import regex_generator
+from core.cancellation import CancellationToken, GenerationCancelled
+from core.collision_checker import validate_regex, verify_certificate
+from core.regex_generator import (
+    RegexGenerationError,
+    RegexSession,
+    _compact_suffixes,
+    generate_regex,
+    iter_regex_entries,
+)
 
 
 def test_suffix_collision_forces_exact():
@@ -41,3 +58,305 @@ def test_deterministic_output():
     result_b = generate_regex(targets_b, non_targets)
 
     assert result_a.entries == result_b.entries
+
+
+def test_greedy_prefers_widest_then_shortest_pattern():
+    targets = ["Chaos Orb", "Divine Orb", "Mirror Shard"]
+    non_targets = ["Orb"]
+
+    result = generate_regex(targets, non_targets, match_mode="compact", allow_negation=False)
+
+    assert result.ok
+    assert result.entries == ["d$| Orb$"]
+
+
+def test_session_matches_full_rebuild_after_deltas():
+    session = RegexSession()
+    targets = {"Chaos Orb", "Divine Orb", "Mirror Shard"}
+    non_targets = {"Orb of Annulment", "Exalted Orb"}
+
+    session.update(targets, non_targets)
+    assert session.result() == generate_regex(targets, non_targets)
+
+    session.apply(removed_targets=["Divine Orb"], added_non_targets=["Divine Orb", "Eldritch Chaos Orb"])
+    targets.discard("Divine Orb")
+    non_targets |= {"Divine Orb", "Eldritch Chaos Orb"}
+    assert session.result() == generate_regex(targets, non_targets)
+
+    session.apply(removed_non_targets=["Eldritch Chaos Orb"], added_targets=["Orb of Annulment"])
+    non_targets -= {"Eldritch Chaos Orb", "Orb of Annulment"}
+    session.apply(removed_non_targets=["Orb of Annulment"])
+    targets.add("Orb of Annulment")
+    assert session.targets == sorted(targets)
+    assert session.result() == generate_regex(targets, non_targets)
+
+
+def test_session_rerenders_only_changed_entries(monkeypatch):
+    options = {"max_length": 24, "match_mode": "compact", "allow_negation": False}
+    session = RegexSession(**options)
+    targets = ["Sapphire Ring", "Ruby Amulet", "Onyx Belt", "Leather Boots", "Silk Gloves", "Iron Helmet", "Oak Shield"]
+    non_targets = ["Gold Ring", "Coral Amulet", "Chain Belt", "Iron Boots"]
+    session.update(targets, non_targets)
+    before = session.result()
+
+    rendered = []
+    render_group = regex_generator._render_group
+    monkeypatch.setattr(
+        regex_generator,
+        "_render_group",
+        lambda group, is_safe: rendered.append(group) or render_group(group, is_safe),
+    )
+    session.apply(added_non_targets=["Chaos Orb"])
+    assert session.result() == before
+    assert rendered == []
+
+    session.apply(removed_targets=["Onyx Belt"], added_non_targets=["Onyx Belt", "Wool Gloves"])
+    targets.remove("Onyx Belt")
+    non_targets += ["Chaos Orb", "Onyx Belt", "Wool Gloves"]
+    after = session.result()
+
+    assert after == generate_regex(targets, non_targets, **options)
+    assert after.entries == ["k Gloves$|y Amulet$", "(d|e Ring|r Boots|met)$"]
+
+
+def test_session_matches_full_rebuild_on_sample_export():
+    names = load_naming_seed().names
+    rng = random.Random(4)
+    for options in ({}, {"match_mode": "compact", "max_length": 120}):
+        session = RegexSession(**options)
+        targets = set(rng.sample(names, len(names) // 3))
+        for _ in range(6):
+            flipped = set(rng.sample(names, rng.randint(1, 40)))
+            targets ^= flipped
+            session.update(targets, set(names) - targets)
+            assert session.result() == generate_regex(targets, set(names) - targets, **options)
+
+
+def test_session_keeps_the_negated_formulation_incremental(monkeypatch):
+    names = load_naming_seed().names
+    rng = random.Random(9)
+    targets = set(names) - set(rng.sample(names, 8))
+    steps = []
+    for _ in range(4):
+        targets ^= set(rng.sample(names, 3))
+        steps.append((set(targets), generate_regex(targets, set(names) - targets)))
+
+    def full_rebuild(*args, **kwargs):
+        raise AssertionError("session fell back to a full rebuild")
+
+    monkeypatch.setattr(regex_generator, "generate_regex", full_rebuild)
+    session = RegexSession()
+    for targets, expected in steps:
+        session.update(targets, set(names) - targets)
+        assert session.result() == expected
+    assert any(expected.negated for _, expected in steps)
+
+
+def test_substring_mode_avoids_exact_anchor_for_suffix_collision():
+    targets = ["Orb of Annulment"]
+    non_targets = ["Eldritch Orb of Annulment"]
+
+    result = generate_regex(targets, non_targets, match_mode="substring")
+
+    assert result.ok
+    assert result.entries == ["^O"]
+
+
+def test_substring_mode_uses_unanchored_patterns():
+    targets = ["Awakened Sextant", "Elevated Sextant"]
+    non_targets = ["Sextant", "Awakened Gem", "Elevated Gem"]
+
+    result = generate_regex(targets, non_targets, match_mode="substring")
+
+    assert result.ok
+    assert result.entries == [" S"]
+
+
+def test_optimal_mode_reports_proof():
+    targets = ["Horned Scarab of Awakening", "Horned Scarab of Pandemonium", "Mirror Shard"]
+    non_targets = ["Scarab of Pandemonium", "Chaos Orb"]
+
+    balanced = generate_regex(targets, non_targets)
+    optimal = generate_regex(targets, non_targets, match_mode="optimal", time_budget_ms=1000)
+
+    assert optimal.ok
+    assert optimal.proven_optimal is True
+    assert balanced.proven_optimal is None
+    assert sum(len(entry) for entry in optimal.entries) <= sum(len(entry) for entry in balanced.entries)
+
+
+def test_compaction_factors_suffixes_and_branch_prefixes():
+    assert _compact_suffixes(["Chaos Orb", "Divine Orb"]) == ("(Divine|Chaos) Orb$", [])
+    assert _compact_suffixes(["Scarab", "Abyss Scarab"]) == ("Scarab$", [])
+    assert _compact_suffixes(["Blightx1", "Blighty2"]) == ("Blight(x1|y2)$", [])
+
+
+def test_compaction_merges_equivalent_branches_into_classes():
+    assert _compact_suffixes(["ed Oil", "et Oil", "al Map", "el Map"]) == ("(e[dt] Oil|[ae]l Map)$", [])
+    assert _compact_suffixes(["al Oil", "ar Oil", "er Oil"]) == ("(al|[ae]r) Oil$", [])
+    assert _compact_suffixes(["al Oil", "ar Oil", "er Oil"], lambda suffix: True) == ("[ae][lr] Oil$", ["el Oil"])
+    assert _compact_suffixes(["al Oil", "ar Oil", "er Oil"], lambda suffix: suffix != "el Oil") == (
+        "(al|[ae]r) Oil$",
+        [],
+    )
+
+
+def test_compaction_applies_to_each_packed_entry():
+    targets = ["Chaos Orb", "Divine Orb", "Exalted Orb", "Regal Orb", "Iron Ring", "Gold Ring", "Coral Ring", "Ruby Ring"]
+    non_targets = ["Orb", "Ring", "Sulphite"]
+
+    result = generate_regex(targets, non_targets, max_length=30, allow_negation=False)
+
+    assert result.ok
+    assert result.entries == ["os Orb$|y Ring$", "(ne Orb|[ln] Ring)$", "((ed|al) Orb|d Ring)$"]
+    assert validate_regex(result.entries, targets, non_targets) == (True, None)
+
+
+def test_suffix_covers_stay_compact_for_wide_selections():
+    names = sorted({name.lower(): name for name in iter_synthetic_names(4000)}.values())
+    targets, non_targets = names[::2], names[1::2]
+    targets_raw, _, targets_norm, non_targets_norm, error = regex_generator._prepare_names(targets, non_targets, True)
+
+    candidates, _ = regex_generator._build_candidates(
+        targets_raw, targets_norm, non_targets_norm, True, "balanced", 8, 6, None, None
+    )
+
+    assert error is None
+    assert all(candidate.mask.bit_length() == candidate.gain for candidate in candidates)
+    assert sum(sys.getsizeof(candidate.mask) for candidate in candidates) <= 32 * len(candidates)
+
+
+def test_minimized_entries_use_universe_slack_and_stay_certified():
+    targets = ["Opal Oil", "Clear Oil", "Amber Oil"]
+    non_targets = ["Foil Oil", "Fur Oil"]
+
+    result = generate_regex(targets, non_targets, match_mode="compact", allow_negation=False)
+    full = generate_regex(targets, non_targets, match_mode="compact", allow_negation=False, validation="full")
+
+    def evidence(literal):
+        return any(name.lower().endswith(literal) for name in non_targets)
+
+    assert result.ok
+    assert result.entries == full.entries == ["[ae][lr] Oil$"]
+    assert verify_certificate(result.entries, result.certificate, targets, {"suffix": evidence})[0]
+    for name in targets:
+        assert any(re.search(entry, name) for entry in result.entries)
+    for name in non_targets:
+        assert not any(re.search(entry, name) for entry in result.entries)
+
+
+def test_cancelled_generation_returns_error():
+    token = CancellationToken()
+    token.cancel()
+
+    result = generate_regex(["Chaos Orb"], ["Divine Orb"], token=token)
+
+    assert not result.ok
+    assert result.error == "Generation cancelled."
+    assert generate_regex(["Chaos Orb"], ["Divine Orb"], token=CancellationToken(0)).error == "Generation timed out."
+
+
+def test_progressive_entries_cover_targets_without_collisions():
+    targets = [f"Target Item {index:03d}" for index in range(60)]
+    non_targets = [f"Other Item {index:03d}" for index in range(60)]
+
+    entries = list(iter_regex_entries(targets, non_targets, max_length=60))
+
+    assert len(entries) > 1
+    assert all(len(entry) <= 60 for entry in entries)
+    assert all(any(re.search(entry, name, re.IGNORECASE) for entry in entries) for name in targets)
+    assert not any(re.search(entry, name, re.IGNORECASE) for entry in entries for name in non_targets)
+
+
+def test_progressive_entries_stop_when_cancelled():
+    token = CancellationToken()
+    targets = [f"Target Item {index:03d}" for index in range(60)]
+    entries = iter_regex_entries(targets, ["Other Item"], max_length=60, token=token)
+
+    assert next(entries)
+    token.cancel()
+    with pytest.raises(GenerationCancelled):
+        list(entries)
+    with pytest.raises(RegexGenerationError):
+        list(iter_regex_entries(["Chaos Orb"], ["chaos orb"]))
+
+
+def test_certificate_maps_targets_and_rejects_tampered_entries():
+    targets = ["Chaos Orb", "Divine Orb", "Mirror Shard"]
+    non_targets = ["Orb of Regret", "Shard of Fate"]
+
+    result = generate_regex(targets, non_targets, validation="certified", allow_negation=False)
+
+    assert result.ok
+    certificate = result.certificate
+    assert set(certificate.assignments) == set(targets)
+    assert all(pattern.kind in {"suffix", "exact"} for pattern in certificate.patterns)
+
+    evidence = {"suffix": lambda literal: any(name.lower().endswith(literal) for name in non_targets)}
+    evidence["exact"] = lambda literal: literal in {name.lower() for name in non_targets}
+    assert verify_certificate(result.entries, certificate, targets, evidence) == (True, None)
+    assert not verify_certificate(result.entries + ["Orb"], certificate, targets, evidence)[0]
+    assert not verify_certificate(result.entries, certificate, targets + ["Exalted Orb"], evidence)[0]
+    assert generate_regex(targets, non_targets, validation="sampled-full", allow_negation=False).entries == result.entries
+    assert generate_regex(targets, non_targets, validation="bogus").error == "Unsupported validation mode: bogus"
+
+
+def test_certified_validation_falls_back_to_regex_for_non_ascii_names():
+    for targets, non_targets in [
+        (["sab"], ["\u017fab", "x"]),
+        (["\u212aelvin Scale"], ["\u017fcale", "x"]),
+    ]:
+        certified = generate_regex(targets, non_targets, match_mode="compact", validation="certified", allow_negation=False)
+        full = generate_regex(targets, non_targets, match_mode="compact", validation="full", allow_negation=False)
+
+        assert not certified.ok
+        assert certified == full
+
+
+def test_majority_selection_uses_negated_complement():
+    targets = ["Chaos Orb", "Divine Orb", "Exalted Orb", "Mirror Shard", "Orb of Regret"]
+    non_targets = ["Scarab of Time"]
+
+    result = generate_regex(targets, non_targets)
+
+    assert result.ok
+    assert result.negated
+    assert result.search_entries == ["!" + entry for entry in result.entries]
+    assert len(result.entries) == 1
+    assert not any(re.search(result.entries[0], name, re.IGNORECASE) for name in targets)
+    assert re.search(result.entries[0], non_targets[0], re.IGNORECASE)
+    assert not generate_regex(targets, non_targets, allow_negation=False).negated
+    assert not generate_regex(non_targets, targets).negated
+
+
+def test_negated_formulation_shares_the_optimal_time_budget(monkeypatch):
+    budgets = []
+    optimize_cover = regex_generator.optimize_cover
+
+    def slow_optimize(covers, costs, universe, initial, time_budget_ms, token=None):
+        budgets.append(time_budget_ms)
+        time.sleep(0.05)
+        return optimize_cover(covers, costs, universe, initial, time_budget_ms, token)
+
+    monkeypatch.setattr(regex_generator, "optimize_cover", slow_optimize)
+    targets = ["Chaos Orb", "Divine Orb", "Exalted Orb", "Mirror Shard", "Orb of Regret"]
+
+    assert generate_regex(targets, ["Scarab of Time"], match_mode="optimal", time_budget_ms=80).ok
+    assert len(budgets) == 2
+    assert budgets[0] <= 80
+    assert budgets[1] <= 80 - 50
+
+
+def test_collect_stats_reports_phases_and_counters():
+    targets = ["Chaos Orb", "Divine Orb", "Mirror Shard"]
+    non_targets = ["Orb of Regret", "Shard of Fate", "Exalted Orb", "Scarab of Time"]
+
+    result = generate_regex(targets, non_targets, validation="full", collect_stats=True)
+
+    stats = result.stats
+    assert result.ok
+    assert {"index", "candidates", "cover", "packing", "validation"} <= set(stats.phase_seconds)
+    assert stats.candidate_count >= stats.suffix_count > 0
+    assert stats.cover_iterations >= len(result.entries)
+    assert stats.validated_names == len(targets) + len(non_targets)
+    assert generate_regex(targets, non_targets).stats is None
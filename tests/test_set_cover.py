@@ -0,0 +1,38 @@
+from itertools import combinations
+
+from core.set_cover import optimize_cover
+
+
+def _brute_force_cost(covers, costs, universe):
+    best = None
+    for size in range(1, len(covers) + 1):
+        for combo in combinations(range(len(covers)), size):
+            covered = 0
+            for index in combo:
+                covered |= covers[index]
+            if covered & universe == universe:
+                cost = sum(costs[index] for index in combo)
+                best = cost if best is None else min(best, cost)
+    return best
+
+
+def test_optimize_cover_beats_greedy_start():
+    covers = [0b111000, 0b000111, 0b100100, 0b010010, 0b001001]
+    costs = [4, 4, 3, 3, 3]
+    universe = 0b111111
+
+    chosen, proven = optimize_cover(covers, costs, universe, [2, 3, 4], 1000)
+
+    assert proven
+    assert chosen == [0, 1]
+    assert sum(costs[index] for index in chosen) == _brute_force_cost(covers, costs, universe)
+
+
+def test_optimize_cover_returns_initial_when_budget_exhausted():
+    covers = [0b11, 0b01, 0b10]
+    costs = [5, 1, 1]
+
+    chosen, proven = optimize_cover(covers, costs, 0b11, [0], 0)
+
+    assert chosen == [0]
+    assert not proven
@@ -0,0 +1,16 @@
+from core.suffix_automaton import SuffixAutomaton
+
+
+def test_automaton_recognizes_substrings_across_names():
+    automaton = SuffixAutomaton(["eldritch orb", "orb of annulment"])
+
+    assert "ritch o" in automaton
+    assert "of ann" in automaton
+    assert "orb orb" not in automaton
+    assert "" in automaton
+
+
+def test_matching_lengths_report_longest_known_suffix():
+    automaton = SuffixAutomaton(["abcab", "bcd"])
+
+    assert automaton.matching_lengths("xabcd") == [0, 1, 2, 3, 3]
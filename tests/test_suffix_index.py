@@ -0,0 +1,31 @@
+from core.suffix_index import SuffixIndex
+
+
+def test_suffix_membership():
+    index = SuffixIndex(["eldritch orb of annulment", "chaos orb"])
+
+    assert "orb of annulment" in index
+    assert "s orb" in index
+    assert "annulment" in index
+    assert "orb of" not in index
+    assert "" not in index
+
+
+def test_shared_suffix_length_uses_nearest_neighbour():
+    index = SuffixIndex(["divine orb", "exalted orb", "mirror shard"])
+
+    assert index.shared_suffix_length("chaos orb") == 4
+    assert index.shared_suffix_length("scroll") == 0
+    assert index.shared_suffix_length("mirror shard") == len("mirror shard")
+    assert SuffixIndex([]).shared_suffix_length("anything") == 0
+
+
+def test_count_with_suffix_and_exact_membership():
+    index = SuffixIndex(["chaos orb", "divine orb", "orb", "mirror shard"])
+
+    assert index.count_with_suffix("orb") == 3
+    assert index.count_with_suffix(" orb") == 2
+    assert index.count_with_suffix("shard") == 1
+    assert index.count_with_suffix("scarab") == 0
+    assert index.contains_name("orb")
+    assert not index.contains_name("rb")